@@ -5,7 +5,7 @@ Single-page A4 portrait (210mm × 297mm) brochure summarizing TokiStorage
 for first-time introductions (ご挨拶回り用).
 
 Usage:
-  python3 generate-brochure.py
+  python3 generate-brochure.py [--reproducible]
 """
 
 import os
@@ -13,6 +13,11 @@ import sys
 import tempfile
 from fpdf import FPDF
 
+from tokilib import fonts, qrcache
+from tokilib.gstate import GStateMixin
+from tokilib.kinsoku import KinsokuMixin
+from tokilib.reproducible import ReproducibleMixin, requested, source_date
+
 # ── Paths ──────────────────────────────────────────────────────────────
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUT_DIR = os.path.join(SCRIPT_DIR, "brochure")
@@ -70,24 +75,19 @@ EMAIL = "tokistorage1000@gmail.com"
 
 def generate_qr_image(url):
     """Generate a QR code image for the given URL, return temp file path."""
-    import qrcode
-    qr = qrcode.QRCode(version=2, error_correction=qrcode.constants.ERROR_CORRECT_M,
-                        box_size=10, border=2)
-    qr.add_data(url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
+    img = qrcache.image(qrcache.matrix(url, "M", version=2, border=2), 10)
     tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
     img.save(tmp.name)
     return tmp.name
 
 
-class BrochurePDF(FPDF):
+class BrochurePDF(ReproducibleMixin, GStateMixin, KinsokuMixin, FPDF):
     """A4 portrait brochure with Japanese font support."""
 
     def __init__(self):
         super().__init__(orientation="P", format="A4")
-        self.add_font("JP", "", FONT_PATH)
-        self.add_font("JP", "B", FONT_BOLD_PATH or FONT_PATH)
+        fonts.add_font(self, "JP", "", FONT_PATH)
+        fonts.add_font(self, "JP", "B", FONT_BOLD_PATH or FONT_PATH)
         self.set_auto_page_break(auto=False)
         self.set_margins(MARGIN, MARGIN)
 
@@ -296,6 +296,7 @@ def generate_ja(qr_path):
 
     out_path = os.path.join(OUT_DIR, "tokistorage-brochure.pdf")
     pdf.output(out_path)
+    print(f"  {os.path.basename(out_path)}: {pdf.elided_ops} redundant state ops elided")
     return out_path
 
 
@@ -482,12 +483,15 @@ def generate_en(qr_path):
 
     out_path = os.path.join(OUT_DIR, "tokistorage-brochure-en.pdf")
     pdf.output(out_path)
+    print(f"  {os.path.basename(out_path)}: {pdf.elided_ops} redundant state ops elided")
     return out_path
 
 
 def main():
     os.makedirs(OUT_DIR, exist_ok=True)
     print("Generating TokiStorage Brochure...")
+    if requested(sys.argv[1:]):
+        BrochurePDF.pin_all(source_date(__file__))
 
     qr_path = generate_qr_image(SITE_URL)
     try:
@@ -3,6 +3,13 @@
 
 from fpdf import FPDF
 import os
+import sys
+
+from tokilib import fonts
+from tokilib.chrome import ChromeMixin
+from tokilib.gstate import GStateMixin
+from tokilib.kinsoku import KinsokuMixin
+from tokilib.reproducible import ReproducibleMixin, requested, source_date
 
 OUT_DIR = os.path.dirname(os.path.abspath(__file__))
 ICON_PATH = os.path.join(OUT_DIR, "asset", "tokistorage-icon-circle.png")
@@ -26,19 +33,18 @@ BG_LIGHT = (248, 250, 252)
 WHITE = (255, 255, 255)
 
 
-class GovPDF(FPDF):
+class GovPDF(ReproducibleMixin, ChromeMixin, GStateMixin, KinsokuMixin, FPDF):
     """Base PDF class with Japanese font support for government docs."""
 
     def __init__(self):
         super().__init__()
-        self.add_font("JP", "", FONT_PATH, uni=True)
-        self.add_font("JP", "B", FONT_PATH, uni=True)
+        fonts.add_font(self, "JP", "", FONT_PATH)
+        fonts.add_font(self, "JP", "B", FONT_PATH)
         self.set_auto_page_break(auto=False)
 
     def footer(self):
+        self.stamp_chrome("footer_rule", self._draw_footer_rule)
         self.set_y(-18)
-        self.set_draw_color(*BORDER)
-        self.line(15, self.get_y(), 195, self.get_y())
         self.ln(2)
         self.set_font("JP", "", 6.5)
         self.set_text_color(*MUTED)
@@ -49,11 +55,18 @@ class GovPDF(FPDF):
             ln=True, align="C",
         )
 
+    def _draw_footer_rule(self):
+        self.set_draw_color(*BORDER)
+        self.line(15, 279, 195, 279)
+
+    def _draw_accent_line(self):
+        self.set_fill_color(*TOKI_BLUE)
+        self.rect(0, 0, 210, 3, "F")
+
     def header_block(self, title, subtitle=None):
         """Company header + document title."""
         # Top accent line
-        self.set_fill_color(*TOKI_BLUE)
-        self.rect(0, 0, 210, 3, "F")
+        self.stamp_chrome("accent_line", self._draw_accent_line)
 
         self.set_y(10)
         # Icon + Company name
@@ -194,7 +207,7 @@ def generate_overview():
 
     out = os.path.join(OUT_DIR, "government-template-overview.pdf")
     pdf.output(out)
-    print(f"  -> {out}")
+    print(f"  -> {out} ({pdf.elided_ops} redundant state ops elided)")
 
 
 # ---------------------------------------------------------------------------
@@ -330,7 +343,7 @@ def generate_estimate():
 
     out = os.path.join(OUT_DIR, "government-template-estimate.pdf")
     pdf.output(out)
-    print(f"  -> {out}")
+    print(f"  -> {out} ({pdf.elided_ops} redundant state ops elided)")
 
 
 # ---------------------------------------------------------------------------
@@ -413,7 +426,7 @@ def generate_specification():
 
     out = os.path.join(OUT_DIR, "government-template-specification.pdf")
     pdf.output(out)
-    print(f"  -> {out}")
+    print(f"  -> {out} ({pdf.elided_ops} redundant state ops elided)")
 
 
 # ---------------------------------------------------------------------------
@@ -539,7 +552,7 @@ def generate_proposal():
 
     out = os.path.join(OUT_DIR, "government-template-proposal.pdf")
     pdf.output(out)
-    print(f"  -> {out}")
+    print(f"  -> {out} ({pdf.elided_ops} redundant state ops elided)")
 
 
 # ---------------------------------------------------------------------------
@@ -548,6 +561,8 @@ def generate_proposal():
 
 if __name__ == "__main__":
     print("Generating government document templates...")
+    if requested(sys.argv[1:]):
+        GovPDF.pin_all(source_date(__file__))
     generate_overview()
     generate_estimate()
     generate_specification()
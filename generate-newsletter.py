@@ -12,18 +12,53 @@ Layout: A4 landscape (297mm × 210mm) — matches TokiQR print output.
 Usage:
   python3 generate-newsletter.py              # Generate Vol.1 No.1
   python3 generate-newsletter.py 2026 2 2     # Generate 2026, No.2, serial #2
+  python3 generate-newsletter.py 2026 4 2 2 --incremental
+                                              # Skip/reuse unchanged inputs
+  python3 generate-newsletter.py 2026 4 2 2 --linearize
+                                              # Fast web view (any mode)
+  python3 generate-newsletter.py 2026 4 2 2 --publish
+                                              # PDF + newsletter-2026-04{,-en}.html,
+                                              # writing only changed files (hand-edited
+                                              # pages are skipped with a WARNING)
+  python3 generate-newsletter.py 2026 4 2 2 --reproducible
+                                              # Byte-identical output for identical
+                                              # inputs (also: SOURCE_DATE_EPOCH)
+  python3 generate-newsletter.py --rebuild-all [--workers N]
+                                              # Every issue in schedule.json
+  python3 generate-newsletter.py --fleet <clients_dir> [YYYY-MM] [--workers N]
+                                              # Due issues of every client repo
+  python3 generate-newsletter.py --anthology 1
+                                              # All issues of Vol.1 in one PDF
+  python3 generate-newsletter.py 2026 4 2 2 --trace
+                                              # Time per page/section (any mode):
+                                              # Chrome trace JSON + summary table
 """
 
 import os
+import shutil
 import sys
 import textwrap
+import time
 from fpdf import FPDF
 
+from tokilib import fonts, trace
+from tokilib.buildcache import (BuildCache, combine_digests, file_digest, replace_if_changed,
+                               source_digest, write_if_changed)
+from tokilib.chrome import ChromeMixin
+from tokilib.excerpts import ExcerptCache
+from tokilib.gstate import GStateMixin
+from tokilib.kinsoku import KinsokuMixin
+from tokilib.measure import clip_to_width, string_widths, text_height
+from tokilib.reproducible import issue_date, pin, requested
+from tokilib.trace import TraceMixin
+
 # ── Paths ──────────────────────────────────────────────────────────────
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 OUT_DIR = os.path.join(SCRIPT_DIR, "newsletter")
+SCHEDULE_PATH = os.path.join(OUT_DIR, "schedule.json")
 ICON_PATH = os.path.join(SCRIPT_DIR, "asset", "tokistorage-icon-circle.png")
 TOKIQR_DIR = os.path.join(SCRIPT_DIR, "tokiqr")
+ESSAYS_POOL_PATH = os.path.join(OUT_DIR, "essays-pool.json")
 
 # Font detection: macOS → Linux fallback
 FONT_CANDIDATES = [
@@ -83,36 +118,66 @@ PAGE_H = 210
 MARGIN = 15
 CONTENT_W = PAGE_W - MARGIN * 2   # 267mm
 
+# Materials index (巻末 掲載者一覧): issues with more materials than this
+# list them on index pages after the TokiQR cover instead of inline.
+INDEX_INLINE_MAX = 30
+INDEX_COLS = 4
+INDEX_ROW_H = 5.2
+INDEX_TOP = 22
+INDEX_BOTTOM = PAGE_H - 20
+
 
 # ── PDF Class ──────────────────────────────────────────────────────────
-class NewsletterPDF(FPDF):
+class NewsletterPDF(TraceMixin, ChromeMixin, GStateMixin, KinsokuMixin, FPDF):
     """Newsletter PDF with Japanese font support and consistent styling."""
 
     def __init__(self):
         super().__init__(orientation="L", format="A4")
-        self.add_font("JP", "", FONT_PATH)
-        self.add_font("JP", "B", FONT_BOLD_PATH or FONT_PATH)
+        fonts.add_font(self, "JP", "", FONT_PATH)
+        fonts.add_font(self, "JP", "B", FONT_BOLD_PATH or FONT_PATH)
         self.set_auto_page_break(auto=True, margin=20)
 
     def _footer_line(self, text):
+        self.stamp_chrome("footer_rule", self._draw_footer_rule)
         self.set_y(-15)
-        self.set_draw_color(*BORDER)
-        self.line(MARGIN, self.get_y(), PAGE_W - MARGIN, self.get_y())
         self.ln(3)
         self.set_font("JP", "", 6.5)
         self.set_text_color(*MUTED)
         self.cell(0, 3.5, text, align="C")
 
+    def _draw_footer_rule(self):
+        self.set_draw_color(*BORDER)
+        self.line(MARGIN, PAGE_H - 15, PAGE_W - MARGIN, PAGE_H - 15)
+
     def accent_bar(self):
         """Top accent bar in TokiStorage blue."""
+        self.stamp_chrome("accent_bar", self._draw_accent_bar)
+
+    def _draw_accent_bar(self):
         self.set_fill_color(*TOKI_BLUE)
         self.rect(0, 0, PAGE_W, 3.5, "F")
 
+    def page_accent(self, accent=None):
+        """Top accent bar in accent (None: the TokiStorage accent bar)."""
+        if accent is None:
+            self.accent_bar()
+        else:
+            self.set_fill_color(*accent)
+            self.rect(0, 0, PAGE_W, 3.5, "F")
+
+    def box_frame(self, x, y, w, h):
+        """Thin border frame (cover/colophon publisher box), one form per size."""
+        def draw():
+            self.set_draw_color(*BORDER)
+            self.rect(0, 0, w, h, "D")
+        self.stamp_chrome(f"box_frame_{w}x{h}", draw, x, y)
+
     def section_heading(self, title):
         self.ln(3)
         self.set_font("JP", "B", 11)
         self.set_text_color(*DARK)
         y = self.get_y()
+        self.start_section(title)  # bookmark, carried into merged issues and anthologies
         self.set_fill_color(*TOKI_BLUE)
         self.rect(MARGIN, y, 3, 7, "F")
         self.set_x(MARGIN + 7)
@@ -148,6 +213,15 @@ class NewsletterPDF(FPDF):
         self.line(MARGIN, self.get_y(), PAGE_W - MARGIN, self.get_y())
         self.ln(4)
 
+    def _keep_together(self, h, accent=None):
+        """Start a new page first if a block of height h won't fit.
+
+        The new page gets the accent bar in accent (None: TokiStorage blue).
+        """
+        if self.get_y() + h > PAGE_H - 18:
+            self.add_page()
+            self.page_accent(accent)
+
     def info_box(self, text):
         """Light-background information box."""
         y = self.get_y()
@@ -162,8 +236,101 @@ class NewsletterPDF(FPDF):
         self.multi_cell(CONTENT_W - 10, 5, text)
         self.set_y(y + h + 2)
 
+    def essay_box(self, title, excerpt, url, accent=None):
+        """Essay card: linked title + excerpt, never split across pages.
 
-def generate_vol1():
+        Call with auto page break off; the box height is measured, so the
+        page break (if any) happens before the box instead of inside it.
+        accent is the top bar colour of that new page (None: TokiStorage).
+        """
+        text_w = CONTENT_W - 10
+        self.set_font("JP", "", 8.5)
+        box_h = 3 + 7 + text_height(self, text_w, 4.5, excerpt) + 5  # pad + title + text + pad
+        self._keep_together(box_h, accent)
+
+        y = self.get_y()
+        self.set_fill_color(*BG_LIGHT)
+        self.set_draw_color(*BORDER)
+        self.rect(MARGIN, y, CONTENT_W, box_h, "DF")
+        self.set_xy(MARGIN + 5, y + 3)
+        self.set_font("JP", "B", 9)
+        self.set_text_color(*TOKI_BLUE)
+        self.cell(text_w, 7, title, new_x="LMARGIN", new_y="NEXT", link=url)
+        self.set_x(MARGIN + 5)
+        self.set_font("JP", "", 8.5)
+        self.set_text_color(*SECONDARY)
+        self.multi_cell(text_w, 4.5, excerpt)
+        self.set_y(y + box_h + 3)
+
+    def materials_index(self, groups, footer, accent=None):
+        """Multi-column materials index on as many pages as it needs.
+
+        groups is [(label, [entry, ...])].  Entries fill the columns top to
+        bottom in a single pass, each page's running header (group labels
+        and entry range) is written when the page is full, and names too
+        long for a column are clipped with "…".  accent is the top bar
+        colour (None: the TokiStorage accent bar).
+        """
+        col_w = CONTENT_W / INDEX_COLS
+        rows = int((INDEX_BOTTOM - INDEX_TOP) / INDEX_ROW_H)
+        total = sum(len(entries) for _, entries in groups)
+        state = {"col": INDEX_COLS, "row": 0, "labels": [], "first": 0}
+        number = 0
+
+        def finish_page():
+            self.set_font("JP", "B", 9)
+            self.set_text_color(*DARK)
+            self.set_xy(MARGIN, 11)
+            self.cell(CONTENT_W / 2, 6, "掲載者一覧 ── " + " / ".join(state["labels"]))
+            self.set_font("JP", "", 8)
+            self.set_text_color(*MUTED)
+            self.set_xy(MARGIN + CONTENT_W / 2, 11)
+            self.cell(CONTENT_W / 2, 6, f"{state['first']}–{number} / {total}", align="R")
+            self.set_draw_color(*BORDER)
+            self.line(MARGIN, 18, PAGE_W - MARGIN, 18)
+            self._footer_line(footer)
+
+        def next_slot(label):
+            if state["row"] == rows:
+                state["col"] += 1
+                state["row"] = 0
+            if state["col"] == INDEX_COLS:
+                if state["labels"]:
+                    finish_page()
+                self.add_page()
+                if not state["labels"]:
+                    self.start_section("掲載者一覧")
+                self.page_accent(accent)
+                state.update(col=0, row=0, labels=[label], first=number + 1)
+            elif label not in state["labels"]:
+                state["labels"].append(label)
+            x = MARGIN + state["col"] * col_w
+            y = INDEX_TOP + state["row"] * INDEX_ROW_H
+            state["row"] += 1
+            return x, y
+
+        def put(x, y, text, style=""):
+            self.set_font("JP", style, 8)
+            self.set_text_color(*(DARK if style else SECONDARY))
+            self.set_xy(x, y)
+            self.cell(col_w - 2, INDEX_ROW_H, text)
+
+        self.set_auto_page_break(auto=False)
+        for label, entries in groups:
+            self.set_font("JP", "", 8)
+            widths = string_widths(self, entries)  # one batch per group
+            put(*next_slot(label), f"◆ {label}", "B")
+            for entry, width in zip(entries, widths):
+                x, y = next_slot(label)
+                number += 1
+                if width > col_w - 3:
+                    self.set_font("JP", "", 8)
+                    entry = clip_to_width(self, entry, col_w - 3)
+                put(x, y, entry)
+        finish_page()
+
+
+def generate_vol1(linearize=False, reproducible=False):
     """Generate Vol.1 No.1 (創刊号) — February 2026."""
     year = 2026
     month = 2
@@ -179,719 +346,326 @@ def generate_vol1():
     pdf.set_subject("存在証明の民主化")
     pdf.set_keywords("存在証明, QRコード, 国立国会図書館, 逐次刊行物, 三層分散保管")
     pdf.set_creator("generate-newsletter.py")
+    if reproducible:
+        pin(pdf, issue_date(None, year, month))
 
     # ═══════════════════════════════════════════════════════════════════
     # PAGE 1: Cover
     # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=False)
-
-    # Icon
-    if os.path.exists(ICON_PATH):
-        pdf.image(ICON_PATH, x=(PAGE_W - 50) / 2, y=12, w=50)
-
-    # Publication name
-    pdf.set_y(68)
-    pdf.set_font("JP", "", 10)
-    pdf.set_text_color(*TOKI_BLUE)
-    pdf.cell(0, 6, PUBLICATION_NAME, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    # Volume info
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, f"第{volume}巻 第{issue_num}号（通巻第{serial}号）", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(8)
-
-    # Title
-    pdf.set_font("JP", "B", 28)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 18, "創刊号", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(4)
-
-    pdf.set_font("JP", "", 11)
-    pdf.set_text_color(*SECONDARY)
-    pdf.cell(0, 7, "── 声を、国家の永久保存記録にする ──", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(12)
-
-    # Date and issue info
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.cell(0, 6, "2026年2月", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(2)
-    pdf.cell(0, 6, f"Vol.{volume}  No.{issue_num}  Serial #{serial:05d}", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(15)
-
-    # Publisher info box
-    box_w = 160
-    box_x = (PAGE_W - box_w) / 2
-    pdf.set_draw_color(*BORDER)
-    box_y = pdf.get_y()
-    pdf.rect(box_x, box_y, box_w, 35, "D")
-    pdf.set_xy(box_x + 5, box_y + 4)
-    pdf.set_font("JP", "B", 9)
-    pdf.set_text_color(*DARK)
-    pdf.cell(box_w - 10, 6, "発行者", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.cell(box_w - 10, 6, PUBLISHER, align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.cell(box_w - 10, 6, PUBLISHER_ADDRESS, align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.cell(box_w - 10, 6, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    # Footer
-    pdf._footer_line(f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号（通巻第{serial}号）　2026年2月")
+    with trace.span("cover", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=False)
 
-    # ═══════════════════════════════════════════════════════════════════
-    # PAGE 2: Colophon (奥付) — Required for NDL deposit
-    # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=False)
-
-    pdf.set_y(15)
-    pdf.set_font("JP", "B", 14)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 10, "奥付（Colophon）", align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(2)
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, "国立国会図書館法に基づく納本に必要な刊行情報", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(5)
-
-    # Colophon data table
-    colophon_data = [
-        ("刊行物名", PUBLICATION_NAME_JA),
-        ("英題", PUBLICATION_NAME),
-        ("巻号", f"第{volume}巻 第{issue_num}号（通巻第{serial}号）"),
-        ("発行年月日", "2026年（令和8年）2月13日"),
-        ("発行者", "佐藤卓也"),
-        ("屋号", "TokiStorage（トキストレージ）"),
-        ("発行者住所", PUBLISHER_ADDRESS),
-        ("URL", PUBLISHER_URL),
-        ("連絡先", PUBLISHER_EMAIL),
-        ("刊行頻度", "不定期（年複数回の刊行を予定）"),
-        ("フォーマット", "PDF（電子書籍等・オンライン資料）"),
-        ("根拠法", "国立国会図書館法 第25条・第25条の4"),
-        ("採番体系", "式年遷宮型（1巻＝20年） ※1000年発行を想定"),
-        ("ISSN", "未申請（今後申請予定）"),
-    ]
-
-    pdf.set_fill_color(*BG_LIGHT)
-    for i, (label, value) in enumerate(colophon_data):
-        y = pdf.get_y()
-        fill = i % 2 == 0
-        if fill:
-            pdf.set_fill_color(*BG_LIGHT)
-            pdf.rect(MARGIN, y, CONTENT_W, 8, "F")
-        pdf.set_xy(MARGIN + 3, y)
-        pdf.set_font("JP", "B", 8)
-        pdf.set_text_color(*MUTED)
-        pdf.cell(50, 8, label)
-        pdf.set_font("JP", "", 9)
-        pdf.set_text_color(*DARK)
-        pdf.cell(0, 8, value, new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(3)
-    pdf.divider()
-
-    # Numbering system explanation
-    pdf.set_font("JP", "B", 9)
-    pdf.set_text_color(*DARK)
-    pdf.set_x(MARGIN)
-    pdf.cell(0, 6, "採番体系について", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*SECONDARY)
-    pdf.set_x(MARGIN)
-    numbering_text = (
-        "本ニュースレターは、式年遷宮に倣い1巻＝20年の周期で採番しています。\n"
-        "・巻（Volume）＝ 20年周期（第1巻＝2026–2045年、第2巻＝2046–2065年…）\n"
-        "・号（Number）＝ 巻内の通し番号（遷宮ごとにリセット）\n"
-        "・通巻（Serial）＝ 全巻を通じた連番（5桁、最大99,999号）\n"
-        "・ファイル名＝ YYYY-MM形式（発行月。例：2026-02, 3026-12）\n"
-        "1000年で50巻。伊勢神宮の遷宮と同じ周期で、記録を次世代に受け渡していきます。"
-    )
-    pdf.multi_cell(CONTENT_W, 4.5, numbering_text)
-
-    pdf._footer_line(f"{PUBLICATION_NAME_JA}　奥付")
+        # Icon
+        if os.path.exists(ICON_PATH):
+            pdf.image(ICON_PATH, x=(PAGE_W - 50) / 2, y=12, w=50)
 
-    # ═══════════════════════════════════════════════════════════════════
-    # PAGE 3–4: Content (本文)
-    # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=True, margin=20)
-
-    pdf.set_y(12)
-
-    # Section 1: 発刊にあたって
-    pdf.section_heading("発刊にあたって")
-    pdf.body(
-        "このニュースレターは、トキストレージが発行する逐次刊行物です。"
-        "国立国会図書館法（第25条・第25条の4）に基づき、電子書籍等として納本されます。"
-    )
-    pdf.body(
-        "「私が存在した」ことを永久に残す——その手段が、すべての人に開かれる時代が来ました。"
-        "記録が積み重なるほど、世代を越えた対話が生まれます。"
-        "あなたの曾祖父母の顔と声、わかりますか？"
-    )
-    pdf.body(
-        "トキストレージは「存在証明の民主化」を使命に掲げ、"
-        "すべての人の声と存在を国家永久保存にする唯一の無料・デジタル完結の手段を提供します。"
-        "本ニュースレターは、その活動記録であり、同時にそれ自体が国立国会図書館に永久保存される"
-        "「存在証明」でもあります。"
-    )
-
-    pdf.divider()
-
-    # Section 2: トキストレージとは
-    pdf.section_heading("トキストレージとは")
-    pdf.body_bold("ミッション：あなたが物語となる")
-    pdf.body(
-        "トキストレージは、物理・国家・民間の三層分散保管によって、"
-        "あなたの存在証明を永続化するサービスです。個人事業として2026年2月に創業しました。"
-    )
-
-    pdf.body_bold("三層分散保管アーキテクチャ")
-
-    # Three-layer table
-    layers = [
-        ("物理層", "石英ガラス／UV耐性ラミネート", "電源・サーバー不要。手元に届き、触れられる存在証明"),
-        ("国家層", "国立国会図書館（法定納本）", "国の法制度による制度的永久保存"),
-        ("民間層", "GitHub", "世界中に分散されたホスティング"),
-    ]
-
-    y = pdf.get_y()
-    pdf.set_fill_color(*BG_LIGHT)
-    pdf.set_draw_color(*BORDER)
-
-    # Header — columns sized for landscape
-    col_layer = 35
-    col_medium = 80
-    col_desc = CONTENT_W - col_layer - col_medium
-    pdf.set_x(MARGIN)
-    pdf.set_font("JP", "B", 8)
-    pdf.set_text_color(*DARK)
-    pdf.set_fill_color(*TOKI_BLUE)
-    pdf.set_text_color(*WHITE)
-    pdf.cell(col_layer, 7, "  層", fill=True)
-    pdf.cell(col_medium, 7, "  媒体", fill=True)
-    pdf.cell(col_desc, 7, "  特徴", fill=True)
-    pdf.ln()
-
-    for i, (layer, medium, desc) in enumerate(layers):
-        fill = i % 2 == 0
-        if fill:
-            pdf.set_fill_color(*BG_LIGHT)
-        pdf.set_x(MARGIN)
-        pdf.set_font("JP", "B", 8)
-        pdf.set_text_color(*DARK)
-        pdf.cell(col_layer, 7, "  " + layer, fill=fill)
+        # Publication name
+        pdf.set_y(68)
+        pdf.set_font("JP", "", 10)
+        pdf.set_text_color(*TOKI_BLUE)
+        pdf.cell(0, 6, PUBLICATION_NAME, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        # Volume info
         pdf.set_font("JP", "", 8)
-        pdf.set_text_color(*SECONDARY)
-        pdf.cell(col_medium, 7, "  " + medium, fill=fill)
-        pdf.cell(col_desc, 7, "  " + desc, fill=fill)
-        pdf.ln()
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, f"第{volume}巻 第{issue_num}号（通巻第{serial}号）", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(8)
 
-    pdf.ln(3)
-    pdf.body(
-        "この設計は、データ保全の世界標準「3-2-1ルール」"
-        "——3つのコピー、2種類の媒体、1つはオフサイト——を満たします。"
-        "単一障害点がなく、どれかひとつが残れば、存在証明は失われません。"
-    )
-
-    pdf.divider()
-
-    # Section 3: 技術概要
-    pdf.section_heading("技術概要：声を国家の永久保存記録にする")
-
-    pdf.body_bold("パイプライン：声 → QRコード → PDF → 国会図書館")
-    pdf.body(
-        "音声は本来、再生機器やサーバーがなければ消えてしまう揮発性の高いメディアです。"
-        "トキストレージは、独自データ圧縮技術により、"
-        "データサイズ制約の多いQRコードの仕様内でより多くの声を記録します。"
-        "音声をQRコードに変換し、PDFに埋め込み、ニュースレター（本誌）として"
-        "国立国会図書館に納本します。"
-    )
-
-    # Flow diagram as text
-    pdf.ln(1)
-    pdf.set_font("JP", "B", 10)
-    pdf.set_text_color(*TOKI_BLUE)
-    pdf.set_x(MARGIN)
-    pdf.cell(CONTENT_W, 8, "[声]  ->  [QRコード]  ->  [PDF]  ->  [国会図書館]", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(3)
-
-    pdf.body_bold("なぜ、この方法しかないのか")
-    pdf.body(
-        "国立国会図書館のオンライン資料収集が受け付けるフォーマットは "
-        "PDF・EPUB・DAISYの3種のみ。MP3やWAVなどの音声ファイルは"
-        "「図書又は逐次刊行物に相当するもの」に該当せず、制度上、納本できません。\n\n"
-        "物理メディア（CD/DVD）に焼いて納本する方法はありますが、製造費・郵送費がかかり、"
-        "デジタルで完結しません。\n\n"
-        "音声→QRコード→PDF→ニュースレター（逐次刊行物）という変換は、"
-        "無料・デジタル完結・可逆的（元の音声に復元可能）・制度的に適格"
-        "——この4条件をすべて満たす唯一の方法です。"
-    )
-
-    pdf.divider()
-
-    # Section 4: このニュースレター自体が存在証明
-    pdf.section_heading("このニュースレター自体が存在証明")
-    pdf.body(
-        "ここに重要な自己言及があります。"
-        "このPDFは、国立国会図書館に納本されます。つまり、今あなたが読んでいるこの文書自体が、"
-        "制度的に永久保存される「存在証明」です。"
-    )
-    pdf.body(
-        "トキストレージのニュースレターは、単なる広報ではありません。"
-        "顧客の声（TokiQRコード）を掲載し、それを国家保存に届ける「媒体」であると同時に、"
-        "トキストレージという事業そのものの存在証明でもあります。"
-    )
-
-    pdf.divider()
-
-    # Section 5: エッセイ紹介
-    pdf.section_heading("エッセイ紹介 ── なぜ、こう設計したのか")
-    pdf.body(
-        "トキストレージの設計思想は、一連のエッセイとして公開しています。"
-        "創刊号に関連する3本をご紹介します。"
-    )
-
-    base_url = "https://tokistorage.github.io/lp/"
-    essays = [
-        ("30秒音声の世界",
-         "QRコードに音声を刻める時間が2秒から30秒に拡張されたとき、"
-         "変わったのは数字ではなく、体験の質だった。"
-         "2秒では「声が出た」という技術実証。30秒では「想いを残せた」という存在証明。",
-         f"{base_url}30seconds.html"),
-        ("3-2-1ルール ── 三層分散保管の根拠",
-         "「3-2-1ルール」はデータバックアップの世界標準であり、"
-         "半世紀にわたり実証されてきた原則である。"
-         "トキストレージの三層分散保管は、この原則を「データ保全」から「存在証明」へと拡張した設計である。",
-         f"{base_url}backup-rule.html"),
-        ("公開主義 ── 構造的に隠せない設計",
-         "組織は秘密を持つと、その管理にリソースを奪われる。"
-         "トキストレージは「隠さない」のではなく「構造的に隠せない」設計を採用した。"
-         "QRコードを石英に刻むという行為自体が、公開性の物理的な宣言である。",
-         f"{base_url}openness.html"),
-    ]
-
-    # Disable auto page break during essay boxes to prevent mid-box splits
-    pdf.set_auto_page_break(auto=False)
-
-    for title, excerpt, url in essays:
-        # Measure box height: title (7mm) + text + padding
-        pdf.set_font("JP", "", 8.5)
-        text_w = CONTENT_W - 10
-        chars_per_line = int(text_w / 3)  # ~8.5pt Japanese ≈ 3mm per char
-        n_lines = 0
-        for paragraph in excerpt.split("\n"):
-            n_lines += max(1, -(-len(paragraph) // chars_per_line))
-        text_h = n_lines * 4.5
-        box_h = 3 + 7 + text_h + 5  # top pad + title + text + bottom pad
-
-        # Force page break if box won't fit
-        if pdf.get_y() + box_h > PAGE_H - 18:
-            pdf.add_page()
-            pdf.accent_bar()
+        # Title
+        pdf.set_font("JP", "B", 28)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 18, "創刊号", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(4)
 
-        y = pdf.get_y()
-        pdf.set_fill_color(*BG_LIGHT)
-        pdf.set_draw_color(*BORDER)
-        pdf.rect(MARGIN, y, CONTENT_W, box_h, "DF")
-        pdf.set_xy(MARGIN + 5, y + 3)
-        pdf.set_font("JP", "B", 9)
-        pdf.set_text_color(*TOKI_BLUE)
-        pdf.cell(text_w, 7, title, new_x="LMARGIN", new_y="NEXT", link=url)
-        pdf.set_x(MARGIN + 5)
-        pdf.set_font("JP", "", 8.5)
+        pdf.set_font("JP", "", 11)
         pdf.set_text_color(*SECONDARY)
-        pdf.multi_cell(text_w, 4.5, excerpt)
-        pdf.set_y(y + box_h + 3)
+        pdf.cell(0, 7, "── 声を、国家の永久保存記録にする ──", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
 
-    # Re-enable auto page break
-    pdf.set_auto_page_break(auto=True, margin=20)
+        pdf.ln(12)
 
-    pdf.ln(1)
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.set_x(MARGIN)
-    pdf.cell(CONTENT_W, 5,
-             f"全エッセイは {PUBLISHER_URL} からお読みいただけます。",
-             new_x="LMARGIN", new_y="NEXT")
+        # Date and issue info
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.cell(0, 6, "2026年2月", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+        pdf.cell(0, 6, f"Vol.{volume}  No.{issue_num}  Serial #{serial:05d}", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
 
-    pdf.divider()
+        pdf.ln(15)
 
-    # Section 6: 今後の予定
-    pdf.section_heading("今後の予定")
-    pdf.body(
-        "次号以降、以下の内容を予定しています：\n\n"
-        "・ご利用者さまの声（許諾をいただいたTokiQRの掲載）\n"
-        "・佐渡島 物理保管拠点の構築報告\n"
-        "・パートナー・協賛者のご紹介"
-    )
+        # Publisher info box
+        box_w = 160
+        box_x = (PAGE_W - box_w) / 2
+        box_y = pdf.get_y()
+        pdf.box_frame(box_x, box_y, box_w, 35)
+        pdf.set_xy(box_x + 5, box_y + 4)
+        pdf.set_font("JP", "B", 9)
+        pdf.set_text_color(*DARK)
+        pdf.cell(box_w - 10, 6, "発行者", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.cell(box_w - 10, 6, PUBLISHER, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.cell(box_w - 10, 6, PUBLISHER_ADDRESS, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.cell(box_w - 10, 6, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
 
-    pdf.ln(4)
+        # Footer
+        pdf._footer_line(f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号（通巻第{serial}号）　2026年2月")
 
     # ═══════════════════════════════════════════════════════════════════
-    # TokiQR Cover Page (扉ページ) — before the actual TokiQR print page
+    # PAGE 2: Colophon (奥付) — Required for NDL deposit
     # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=False)
-
-    pdf.set_y(30)
-
-    # Section number + title
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*TOKI_BLUE)
-    pdf.cell(0, 6, "── 巻末セクション ──", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(6)
-
-    pdf.set_font("JP", "B", 20)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 14, "TokiQR：代表メッセージ", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(8)
-
-    desc_w = 220
-    desc_x = (PAGE_W - desc_w) / 2
-    pdf.set_font("JP", "", 9.5)
-    pdf.set_text_color(*SECONDARY)
-    pdf.set_x(desc_x)
-    pdf.multi_cell(desc_w, 6, (
-        "創刊号の巻末として、トキストレージ代表 佐藤卓也による最初のTokiQRを掲載します。\n"
-        "次のページに印刷されたQRコードをスマートフォンでスキャンすると、"
-        "代表の肉声を再生できます。"
-    ), align="C")
-
-    pdf.ln(6)
-
-    # Key message box
-    box_w = 240
-    box_x = (PAGE_W - box_w) / 2
-    box_y = pdf.get_y()
-    pdf.set_fill_color(*BG_LIGHT)
-    pdf.set_draw_color(*BORDER)
-    pdf.rect(box_x, box_y, box_w, 30, "DF")
-    pdf.set_xy(box_x + 10, box_y + 5)
-    pdf.set_font("JP", "B", 9)
-    pdf.set_text_color(*DARK)
-    pdf.multi_cell(box_w - 20, 6, (
-        "サーバーは不要です。データはQRコード内に完全に埋め込まれています。\n"
-        "インターネット接続があればスマートフォンだけで再生可能。\n"
-        "100年後でも、このQRコードが残っていれば声は蘇ります。"
-    ), align="C")
-
-    pdf.set_y(box_y + 36)
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, "読み取りのコツ：カメラを3倍ズームにして、少し離してスキャンすると認識しやすくなります。",
-             align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf._footer_line(f"{PUBLICATION_NAME_JA}　巻末 TokiQR")
+    with trace.span("colophon", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=False)
 
-    # ═══════════════════════════════════════════════════════════════════
-    # LAST PAGE: Back Cover (must be last — merge inserts TokiQR before this)
-    # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=False)
-
-    pdf.set_y(35)
-
-    # NDL deposit declaration
-    pdf.set_font("JP", "B", 12)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 8, "国立国会図書館 納本宣言", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(6)
-
-    decl_w = 200
-    decl_x = (PAGE_W - decl_w) / 2
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.set_x(decl_x)
-    pdf.multi_cell(decl_w, 6, (
-        "本誌は、国立国会図書館法（第25条の4）に基づき、"
-        "オンライン資料として国立国会図書館に納本されます。\n\n"
-        "This publication is deposited with the National Diet Library "
-        "of Japan under Article 25-4 of the National Diet Library Law."
-    ), align="C")
-
-    pdf.ln(12)
-    pdf.divider()
-
-    # Next issue preview
-    pdf.ln(4)
-    pdf.set_font("JP", "B", 10)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 7, "次号予告", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(2)
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.set_x(decl_x)
-    pdf.multi_cell(decl_w, 6, (
-        f"第{volume}巻 第{issue_num + 1}号（通巻第{serial + 1}号）は、"
-        "ご利用者さまの声（TokiQR）の掲載と、佐渡島物理保管拠点の進捗報告を予定しています。"
-    ), align="C")
-
-    pdf.ln(12)
-
-    # Copyright
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, "© 2026 TokiStorage（佐藤卓也）. All rights reserved.", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.cell(0, 5, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf._footer_line(f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号　裏表紙")
+        pdf.set_y(15)
+        pdf.set_font("JP", "B", 14)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 10, "奥付（Colophon）", align="C", new_x="LMARGIN", new_y="NEXT")
 
-    # ═══════════════════════════════════════════════════════════════════
-    # Output — generate base PDF, then merge TokiQR page before back cover
-    # ═══════════════════════════════════════════════════════════════════
-    os.makedirs(OUT_DIR, exist_ok=True)
-    filename = f"{year}-{month:02d}.pdf"
-    out_path = os.path.join(OUT_DIR, filename)
+        pdf.ln(2)
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, "国立国会図書館法に基づく納本に必要な刊行情報", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
 
-    # Find TokiQR representative PDF
-    tokiqr_pdf_path = None
-    if os.path.isdir(TOKIQR_DIR):
-        for f in sorted(os.listdir(TOKIQR_DIR)):
-            if f.endswith(".pdf"):
-                tokiqr_pdf_path = os.path.join(TOKIQR_DIR, f)
-                break
+        pdf.ln(5)
+
+        # Colophon data table
+        colophon_data = [
+            ("刊行物名", PUBLICATION_NAME_JA),
+            ("英題", PUBLICATION_NAME),
+            ("巻号", f"第{volume}巻 第{issue_num}号（通巻第{serial}号）"),
+            ("発行年月日", "2026年（令和8年）2月13日"),
+            ("発行者", "佐藤卓也"),
+            ("屋号", "TokiStorage（トキストレージ）"),
+            ("発行者住所", PUBLISHER_ADDRESS),
+            ("URL", PUBLISHER_URL),
+            ("連絡先", PUBLISHER_EMAIL),
+            ("刊行頻度", "不定期（年複数回の刊行を予定）"),
+            ("フォーマット", "PDF（電子書籍等・オンライン資料）"),
+            ("根拠法", "国立国会図書館法 第25条・第25条の4"),
+            ("採番体系", "式年遷宮型（1巻＝20年） ※1000年発行を想定"),
+            ("ISSN", "未申請（今後申請予定）"),
+        ]
 
-    if tokiqr_pdf_path:
-        # Write base newsletter to temp file, then merge with TokiQR
-        from pypdf import PdfReader, PdfWriter
+        pdf.set_fill_color(*BG_LIGHT)
+        for i, (label, value) in enumerate(colophon_data):
+            y = pdf.get_y()
+            fill = i % 2 == 0
+            if fill:
+                pdf.set_fill_color(*BG_LIGHT)
+                pdf.rect(MARGIN, y, CONTENT_W, 8, "F")
+            pdf.set_xy(MARGIN + 3, y)
+            pdf.set_font("JP", "B", 8)
+            pdf.set_text_color(*MUTED)
+            pdf.cell(50, 8, label)
+            pdf.set_font("JP", "", 9)
+            pdf.set_text_color(*DARK)
+            pdf.cell(0, 8, value, new_x="LMARGIN", new_y="NEXT")
+
+        pdf.ln(3)
+        pdf.divider()
 
-        tmp_path = out_path + ".tmp"
-        pdf.output(tmp_path)
-        print(f"  Base PDF: {tmp_path}")
+        # Numbering system explanation
+        pdf.set_font("JP", "B", 9)
+        pdf.set_text_color(*DARK)
+        pdf.set_x(MARGIN)
+        pdf.cell(0, 6, "採番体系について", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*SECONDARY)
+        pdf.set_x(MARGIN)
+        numbering_text = (
+            "本ニュースレターは、式年遷宮に倣い1巻＝20年の周期で採番しています。\n"
+            "・巻（Volume）＝ 20年周期（第1巻＝2026–2045年、第2巻＝2046–2065年…）\n"
+            "・号（Number）＝ 巻内の通し番号（遷宮ごとにリセット）\n"
+            "・通巻（Serial）＝ 全巻を通じた連番（5桁、最大99,999号）\n"
+            "・ファイル名＝ YYYY-MM形式（発行月。例：2026-02, 3026-12）\n"
+            "1000年で50巻。伊勢神宮の遷宮と同じ周期で、記録を次世代に受け渡していきます。"
+        )
+        pdf.multi_cell(CONTENT_W, 4.5, numbering_text)
 
-        newsletter = PdfReader(tmp_path)
-        tokiqr = PdfReader(tokiqr_pdf_path)
-        writer = PdfWriter()
+        pdf._footer_line(f"{PUBLICATION_NAME_JA}　奥付")
 
-        # All pages except the last (back cover) — includes the TokiQR cover page
-        for i in range(len(newsletter.pages) - 1):
-            writer.add_page(newsletter.pages[i])
+    # ═══════════════════════════════════════════════════════════════════
+    # PAGE 3–4: Content (本文)
+    # ═══════════════════════════════════════════════════════════════════
+    with trace.span("content", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=True, margin=20)
 
-        # Insert TokiQR print page(s) after the cover page
-        for page in tokiqr.pages:
-            writer.add_page(page)
-        print(f"  TokiQR merged: {tokiqr_pdf_path}")
+        pdf.set_y(12)
 
-        # Append back cover
-        writer.add_page(newsletter.pages[-1])
+        # Section 1: 発刊にあたって
+        pdf.section_heading("発刊にあたって")
+        pdf.body(
+            "このニュースレターは、トキストレージが発行する逐次刊行物です。"
+            "国立国会図書館法（第25条・第25条の4）に基づき、電子書籍等として納本されます。"
+        )
+        pdf.body(
+            "「私が存在した」ことを永久に残す——その手段が、すべての人に開かれる時代が来ました。"
+            "記録が積み重なるほど、世代を越えた対話が生まれます。"
+            "あなたの曾祖父母の顔と声、わかりますか？"
+        )
+        pdf.body(
+            "トキストレージは「存在証明の民主化」を使命に掲げ、"
+            "すべての人の声と存在を国家永久保存にする唯一の無料・デジタル完結の手段を提供します。"
+            "本ニュースレターは、その活動記録であり、同時にそれ自体が国立国会図書館に永久保存される"
+            "「存在証明」でもあります。"
+        )
 
-        with open(out_path, "wb") as f:
-            writer.write(f)
-        os.remove(tmp_path)
-    else:
-        pdf.output(out_path)
-        print("  (No TokiQR PDF found — skipped merge)")
+        pdf.divider()
 
-    size_kb = os.path.getsize(out_path) / 1024
-    print(f"  -> {out_path} ({size_kb:.1f} KB)")
-    return out_path
+        # Section 2: トキストレージとは
+        pdf.section_heading("トキストレージとは")
+        pdf.body_bold("ミッション：あなたが物語となる")
+        pdf.body(
+            "トキストレージは、物理・国家・民間の三層分散保管によって、"
+            "あなたの存在証明を永続化するサービスです。個人事業として2026年2月に創業しました。"
+        )
 
+        pdf.body_bold("三層分散保管アーキテクチャ")
 
-def generate_issue(year, month, issue_num, serial):
-    """Generate newsletter for any issue based on manifest data.
+        # Three-layer table
+        layers = [
+            ("物理層", "石英ガラス／UV耐性ラミネート", "電源・サーバー不要。手元に届き、触れられる存在証明"),
+            ("国家層", "国立国会図書館（法定納本）", "国の法制度による制度的永久保存"),
+            ("民間層", "GitHub", "世界中に分散されたホスティング"),
+        ]
 
-    Usage: python3 generate-newsletter.py 2026 4 2 2
-           (year=2026, month=4, issue_num=2, serial=2)
-    """
-    import json
+        y = pdf.get_y()
+        pdf.set_fill_color(*BG_LIGHT)
+        pdf.set_draw_color(*BORDER)
 
-    volume = (year - INAUGURAL_YEAR) // VOLUME_SPAN + 1
-    month_str = f"{year}-{month:02d}"
-    manifest_path = os.path.join(SCRIPT_DIR, "newsletter", "materials", month_str, "manifest.json")
+        # Header — columns sized for landscape
+        col_layer = 35
+        col_medium = 80
+        col_desc = CONTENT_W - col_layer - col_medium
+        pdf.set_x(MARGIN)
+        pdf.set_font("JP", "B", 8)
+        pdf.set_text_color(*DARK)
+        pdf.set_fill_color(*TOKI_BLUE)
+        pdf.set_text_color(*WHITE)
+        pdf.cell(col_layer, 7, "  層", fill=True)
+        pdf.cell(col_medium, 7, "  媒体", fill=True)
+        pdf.cell(col_desc, 7, "  特徴", fill=True)
+        pdf.ln()
 
-    if not os.path.exists(manifest_path):
-        print(f"  ERROR: manifest not found: {manifest_path}")
-        sys.exit(1)
+        for i, (layer, medium, desc) in enumerate(layers):
+            fill = i % 2 == 0
+            if fill:
+                pdf.set_fill_color(*BG_LIGHT)
+            pdf.set_x(MARGIN)
+            pdf.set_font("JP", "B", 8)
+            pdf.set_text_color(*DARK)
+            pdf.cell(col_layer, 7, "  " + layer, fill=fill)
+            pdf.set_font("JP", "", 8)
+            pdf.set_text_color(*SECONDARY)
+            pdf.cell(col_medium, 7, "  " + medium, fill=fill)
+            pdf.cell(col_desc, 7, "  " + desc, fill=fill)
+            pdf.ln()
 
-    with open(manifest_path, encoding="utf-8") as f:
-        manifest = json.load(f)
+        pdf.ln(3)
+        pdf.body(
+            "この設計は、データ保全の世界標準「3-2-1ルール」"
+            "——3つのコピー、2種類の媒体、1つはオフサイト——を満たします。"
+            "単一障害点がなく、どれかひとつが残れば、存在証明は失われません。"
+        )
 
-    pdf = NewsletterPDF()
-    pdf.set_title(f"TokiStorage Newsletter Vol.{volume} No.{issue_num}")
-    pdf.set_author("TokiStorage（佐藤卓也）")
-    pdf.set_subject("存在証明の民主化")
-    pdf.set_creator("generate-newsletter.py")
+        pdf.divider()
 
-    footer_text = f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号（通巻第{serial}号）　{year}年{month}月"
+        # Section 3: 技術概要
+        pdf.section_heading("技術概要：声を国家の永久保存記録にする")
 
-    # ═══════════════════════════════════════════════════════════════════
-    # PAGE 1: Cover
-    # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=False)
-
-    if os.path.exists(ICON_PATH):
-        pdf.image(ICON_PATH, x=(PAGE_W - 50) / 2, y=12, w=50)
-
-    pdf.set_y(68)
-    pdf.set_font("JP", "", 10)
-    pdf.set_text_color(*TOKI_BLUE)
-    pdf.cell(0, 6, PUBLICATION_NAME, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, f"第{volume}巻 第{issue_num}号（通巻第{serial}号）", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(8)
-
-    title_ja = manifest["issue"].get("title_ja", f"第{issue_num}号")
-    pdf.set_font("JP", "B", 24)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 18, title_ja, align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(12)
-
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.cell(0, 6, f"{year}年{month}月", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(2)
-    pdf.cell(0, 6, f"Vol.{volume}  No.{issue_num}  Serial #{serial:05d}", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(15)
-    box_w = 160
-    box_x = (PAGE_W - box_w) / 2
-    pdf.set_draw_color(*BORDER)
-    box_y = pdf.get_y()
-    pdf.rect(box_x, box_y, box_w, 35, "D")
-    pdf.set_xy(box_x + 5, box_y + 4)
-    pdf.set_font("JP", "B", 9)
-    pdf.set_text_color(*DARK)
-    pdf.cell(box_w - 10, 6, "発行者", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.cell(box_w - 10, 6, PUBLISHER, align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.cell(box_w - 10, 6, PUBLISHER_ADDRESS, align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.cell(box_w - 10, 6, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf._footer_line(footer_text)
+        pdf.body_bold("パイプライン：声 → QRコード → PDF → 国会図書館")
+        pdf.body(
+            "音声は本来、再生機器やサーバーがなければ消えてしまう揮発性の高いメディアです。"
+            "トキストレージは、独自データ圧縮技術により、"
+            "データサイズ制約の多いQRコードの仕様内でより多くの声を記録します。"
+            "音声をQRコードに変換し、PDFに埋め込み、ニュースレター（本誌）として"
+            "国立国会図書館に納本します。"
+        )
 
-    # ═══════════════════════════════════════════════════════════════════
-    # PAGE 2: Colophon
-    # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=False)
-
-    pdf.set_y(15)
-    pdf.set_font("JP", "B", 14)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 10, "奥付（Colophon）", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(2)
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, "国立国会図書館法に基づく納本に必要な刊行情報", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(5)
-
-    colophon_data = [
-        ("刊行物名", PUBLICATION_NAME_JA),
-        ("英題", PUBLICATION_NAME),
-        ("巻号", f"第{volume}巻 第{issue_num}号（通巻第{serial}号）"),
-        ("発行年月日", f"{year}年（令和{year - 2018}年）{month}月"),
-        ("発行者", "佐藤卓也"),
-        ("屋号", "TokiStorage（トキストレージ）"),
-        ("発行者住所", PUBLISHER_ADDRESS),
-        ("URL", PUBLISHER_URL),
-        ("連絡先", PUBLISHER_EMAIL),
-        ("刊行頻度", "不定期（年複数回の刊行を予定）"),
-        ("フォーマット", "PDF（電子書籍等・オンライン資料）"),
-        ("根拠法", "国立国会図書館法 第25条・第25条の4"),
-        ("採番体系", "式年遷宮型（1巻＝20年） ※1000年発行を想定"),
-    ]
-
-    pdf.set_fill_color(*BG_LIGHT)
-    for i, (label, value) in enumerate(colophon_data):
-        y = pdf.get_y()
-        if i % 2 == 0:
-            pdf.set_fill_color(*BG_LIGHT)
-            pdf.rect(MARGIN, y, CONTENT_W, 8, "F")
-        pdf.set_xy(MARGIN + 3, y)
-        pdf.set_font("JP", "B", 8)
-        pdf.set_text_color(*MUTED)
-        pdf.cell(50, 8, label)
-        pdf.set_font("JP", "", 9)
-        pdf.set_text_color(*DARK)
-        pdf.cell(0, 8, value, new_x="LMARGIN", new_y="NEXT")
+        # Flow diagram as text
+        pdf.ln(1)
+        pdf.set_font("JP", "B", 10)
+        pdf.set_text_color(*TOKI_BLUE)
+        pdf.set_x(MARGIN)
+        pdf.cell(CONTENT_W, 8, "[声]  ->  [QRコード]  ->  [PDF]  ->  [国会図書館]", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(3)
+
+        pdf.body_bold("なぜ、この方法しかないのか")
+        pdf.body(
+            "国立国会図書館のオンライン資料収集が受け付けるフォーマットは "
+            "PDF・EPUB・DAISYの3種のみ。MP3やWAVなどの音声ファイルは"
+            "「図書又は逐次刊行物に相当するもの」に該当せず、制度上、納本できません。\n\n"
+            "物理メディア（CD/DVD）に焼いて納本する方法はありますが、製造費・郵送費がかかり、"
+            "デジタルで完結しません。\n\n"
+            "音声→QRコード→PDF→ニュースレター（逐次刊行物）という変換は、"
+            "無料・デジタル完結・可逆的（元の音声に復元可能）・制度的に適格"
+            "——この4条件をすべて満たす唯一の方法です。"
+        )
 
-    pdf._footer_line(f"{PUBLICATION_NAME_JA}　奥付")
+        pdf.divider()
 
-    # ═══════════════════════════════════════════════════════════════════
-    # PAGE 3+: Content
-    # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=True, margin=20)
-    pdf.set_y(12)
+        # Section 4: このニュースレター自体が存在証明
+        pdf.section_heading("このニュースレター自体が存在証明")
+        pdf.body(
+            "ここに重要な自己言及があります。"
+            "このPDFは、国立国会図書館に納本されます。つまり、今あなたが読んでいるこの文書自体が、"
+            "制度的に永久保存される「存在証明」です。"
+        )
+        pdf.body(
+            "トキストレージのニュースレターは、単なる広報ではありません。"
+            "顧客の声（TokiQRコード）を掲載し、それを国家保存に届ける「媒体」であると同時に、"
+            "トキストレージという事業そのものの存在証明でもあります。"
+        )
 
-    # ── Section 1: Essays ──
-    essays = manifest.get("essays", [])
-    if essays:
-        pdf.section_heading("エッセイ紹介")
+        pdf.divider()
+
+        # Section 5: エッセイ紹介
+        pdf.section_heading("エッセイ紹介 ── なぜ、こう設計したのか")
         pdf.body(
-            "TokiQRの技術と設計思想に関連するエッセイを厳選してご紹介します。"
+            "トキストレージの設計思想は、一連のエッセイとして公開しています。"
+            "創刊号に関連する3本をご紹介します。"
         )
 
         base_url = "https://tokistorage.github.io/lp/"
+        essays = [
+            ("30秒音声の世界",
+             "QRコードに音声を刻める時間が2秒から30秒に拡張されたとき、"
+             "変わったのは数字ではなく、体験の質だった。"
+             "2秒では「声が出た」という技術実証。30秒では「想いを残せた」という存在証明。",
+             f"{base_url}30seconds.html"),
+            ("3-2-1ルール ── 三層分散保管の根拠",
+             "「3-2-1ルール」はデータバックアップの世界標準であり、"
+             "半世紀にわたり実証されてきた原則である。"
+             "トキストレージの三層分散保管は、この原則を「データ保全」から「存在証明」へと拡張した設計である。",
+             f"{base_url}backup-rule.html"),
+            ("公開主義 ── 構造的に隠せない設計",
+             "組織は秘密を持つと、その管理にリソースを奪われる。"
+             "トキストレージは「隠さない」のではなく「構造的に隠せない」設計を採用した。"
+             "QRコードを石英に刻むという行為自体が、公開性の物理的な宣言である。",
+             f"{base_url}openness.html"),
+        ]
+
+        # Disable auto page break during essay boxes to prevent mid-box splits
         pdf.set_auto_page_break(auto=False)
 
-        for essay in essays:
-            title = essay.get("title_ja", "")
-            excerpt = essay.get("excerpt_ja", "")
-            url = f"{base_url}{essay['id']}.html"
-
-            # Measure box height
-            pdf.set_font("JP", "", 8.5)
-            text_w = CONTENT_W - 10
-            chars_per_line = int(text_w / 3)
-            n_lines = 0
-            for paragraph in excerpt.split("\n"):
-                n_lines += max(1, -(-len(paragraph) // chars_per_line))
-            text_h = n_lines * 4.5
-            box_h = 3 + 7 + text_h + 5
-
-            if pdf.get_y() + box_h > PAGE_H - 18:
-                pdf.add_page()
-                pdf.accent_bar()
-
-            y = pdf.get_y()
-            pdf.set_fill_color(*BG_LIGHT)
-            pdf.set_draw_color(*BORDER)
-            pdf.rect(MARGIN, y, CONTENT_W, box_h, "DF")
-            pdf.set_xy(MARGIN + 5, y + 3)
-            pdf.set_font("JP", "B", 9)
-            pdf.set_text_color(*TOKI_BLUE)
-            pdf.cell(text_w, 7, title, new_x="LMARGIN", new_y="NEXT", link=url)
-            pdf.set_x(MARGIN + 5)
-            pdf.set_font("JP", "", 8.5)
-            pdf.set_text_color(*SECONDARY)
-            pdf.multi_cell(text_w, 4.5, excerpt)
-            pdf.set_y(y + box_h + 3)
+        for title, excerpt, url in essays:
+            pdf.essay_box(title, excerpt, url)
 
+        # Re-enable auto page break
         pdf.set_auto_page_break(auto=True, margin=20)
 
         pdf.ln(1)
@@ -901,41 +675,31 @@ def generate_issue(year, month, issue_num, serial):
         pdf.cell(CONTENT_W, 5,
                  f"全エッセイは {PUBLISHER_URL} からお読みいただけます。",
                  new_x="LMARGIN", new_y="NEXT")
+
         pdf.divider()
 
-    # ── Section 2: Customer Voices (list, grouped by product) ──
-    materials = manifest.get("materials", [])
-    if materials:
-        pdf.section_heading("巻末 TokiQR 掲載者一覧")
+        # Section 6: 今後の予定
+        pdf.section_heading("今後の予定")
         pdf.body(
-            "注文時にNDL納本を選択されたお客様のTokiQRを巻末に掲載しています。"
-            "QRコードをスマートフォンでスキャンすると肉声を再生できます。"
+            "次号以降、以下の内容を予定しています：\n\n"
+            "・ご利用者さまの声（許諾をいただいたTokiQRの掲載）\n"
+            "・佐渡島 物理保管拠点の構築報告\n"
+            "・パートナー・協賛者のご紹介"
         )
 
-        # Group by product type
-        quartz = [m for m in materials if m.get("product") == "quartz"]
-        laminate = [m for m in materials if m.get("product") != "quartz"]
-
-        if quartz:
-            pdf.body_bold("◆ クォーツガラス版")
-            for m in quartz:
-                pdf.body(f"　{m['displayName']}（{m['orderId']}）")
-
-        if laminate:
-            pdf.body_bold("◆ ラミネート版")
-            for m in laminate:
-                pdf.body(f"　{m['displayName']}（{m['orderId']}）")
-
-        pdf.divider()
+        pdf.ln(4)
 
     # ═══════════════════════════════════════════════════════════════════
-    # TokiQR Cover Page (巻末扉) — only if customer materials exist
+    # TokiQR Cover Page (扉ページ) — before the actual TokiQR print page
     # ═══════════════════════════════════════════════════════════════════
-    if materials:
+    with trace.span("TokiQR cover", "section"):
         pdf.add_page()
         pdf.accent_bar()
         pdf.set_auto_page_break(auto=False)
+
         pdf.set_y(30)
+
+        # Section number + title
         pdf.set_font("JP", "", 9)
         pdf.set_text_color(*TOKI_BLUE)
         pdf.cell(0, 6, "── 巻末セクション ──", align="C", new_x="LMARGIN", new_y="NEXT")
@@ -943,7 +707,7 @@ def generate_issue(year, month, issue_num, serial):
 
         pdf.set_font("JP", "B", 20)
         pdf.set_text_color(*DARK)
-        pdf.cell(0, 14, "TokiQR：ご利用者さまの声", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 14, "TokiQR：代表メッセージ", align="C", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(8)
 
         desc_w = 220
@@ -951,20 +715,15 @@ def generate_issue(year, month, issue_num, serial):
         pdf.set_font("JP", "", 9.5)
         pdf.set_text_color(*SECONDARY)
         pdf.set_x(desc_x)
-        # Build grouped names list
-        names_parts = []
-        if quartz:
-            names_parts.append("【クォーツガラス版】" + "、".join([m["displayName"] for m in quartz]))
-        if laminate:
-            names_parts.append("【ラミネート版】" + "、".join([m["displayName"] for m in laminate]))
-        names_text = "\n".join(names_parts)
         pdf.multi_cell(desc_w, 6, (
-            f"{names_text}\n\n"
-            "次のページ以降に印刷されたQRコードをスマートフォンでスキャンすると、"
-            "ご利用者さまの肉声を再生できます。"
+            "創刊号の巻末として、トキストレージ代表 佐藤卓也による最初のTokiQRを掲載します。\n"
+            "次のページに印刷されたQRコードをスマートフォンでスキャンすると、"
+            "代表の肉声を再生できます。"
         ), align="C")
+
         pdf.ln(6)
 
+        # Key message box
         box_w = 240
         box_x = (PAGE_W - box_w) / 2
         box_y = pdf.get_y()
@@ -980,101 +739,885 @@ def generate_issue(year, month, issue_num, serial):
             "100年後でも、このQRコードが残っていれば声は蘇ります。"
         ), align="C")
 
+        pdf.set_y(box_y + 36)
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, "読み取りのコツ：カメラを3倍ズームにして、少し離してスキャンすると認識しやすくなります。",
+                 align="C", new_x="LMARGIN", new_y="NEXT")
+
         pdf._footer_line(f"{PUBLICATION_NAME_JA}　巻末 TokiQR")
 
     # ═══════════════════════════════════════════════════════════════════
-    # Back Cover
+    # LAST PAGE: Back Cover (must be last — merge inserts TokiQR before this)
     # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.accent_bar()
-    pdf.set_auto_page_break(auto=False)
-
-    pdf.set_y(35)
-    pdf.set_font("JP", "B", 12)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 8, "国立国会図書館 納本宣言", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(6)
-
-    decl_w = 200
-    decl_x = (PAGE_W - decl_w) / 2
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.set_x(decl_x)
-    pdf.multi_cell(decl_w, 6, (
-        "本誌は、国立国会図書館法（第25条の4）に基づき、"
-        "オンライン資料として国立国会図書館に納本されます。\n\n"
-        "This publication is deposited with the National Diet Library "
-        "of Japan under Article 25-4 of the National Diet Library Law."
-    ), align="C")
-
-    pdf.ln(12)
-    pdf.divider()
-    pdf.ln(4)
-
-    pdf.set_font("JP", "B", 10)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 7, "次号予告", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(2)
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.set_x(decl_x)
-    pdf.multi_cell(decl_w, 6, (
-        f"第{volume}巻 第{issue_num + 1}号（通巻第{serial + 1}号）の内容は追ってお知らせします。"
-    ), align="C")
-
-    pdf.ln(12)
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, f"© {year} TokiStorage（佐藤卓也）. All rights reserved.", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.cell(0, 5, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf._footer_line(f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号　裏表紙")
+    with trace.span("back cover", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=False)
 
-    # ═══════════════════════════════════════════════════════════════════
-    # Output — merge TokiQR PDFs before back cover
-    # ═══════════════════════════════════════════════════════════════════
-    os.makedirs(OUT_DIR, exist_ok=True)
-    out_path = os.path.join(OUT_DIR, f"{month_str}.pdf")
+        pdf.set_y(35)
 
-    # Collect all TokiQR PDFs to merge
-    tokiqr_pdfs = []
-    for m in materials:
-        p = os.path.join(SCRIPT_DIR, m["tokiqrPdf"])
-        if os.path.exists(p):
-            tokiqr_pdfs.append(p)
+        # NDL deposit declaration
+        pdf.set_font("JP", "B", 12)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 8, "国立国会図書館 納本宣言", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(6)
 
-    if tokiqr_pdfs:
-        from pypdf import PdfReader, PdfWriter
+        decl_w = 200
+        decl_x = (PAGE_W - decl_w) / 2
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.set_x(decl_x)
+        pdf.multi_cell(decl_w, 6, (
+            "本誌は、国立国会図書館法（第25条の4）に基づき、"
+            "オンライン資料として国立国会図書館に納本されます。\n\n"
+            "This publication is deposited with the National Diet Library "
+            "of Japan under Article 25-4 of the National Diet Library Law."
+        ), align="C")
 
-        tmp_path = out_path + ".tmp"
-        pdf.output(tmp_path)
-        print(f"  Base PDF: {tmp_path}")
+        pdf.ln(12)
+        pdf.divider()
 
-        newsletter = PdfReader(tmp_path)
-        writer = PdfWriter()
+        # Next issue preview
+        pdf.ln(4)
+        pdf.set_font("JP", "B", 10)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 7, "次号予告", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.set_x(decl_x)
+        pdf.multi_cell(decl_w, 6, (
+            f"第{volume}巻 第{issue_num + 1}号（通巻第{serial + 1}号）は、"
+            "ご利用者さまの声（TokiQR）の掲載と、佐渡島物理保管拠点の進捗報告を予定しています。"
+        ), align="C")
 
-        for i in range(len(newsletter.pages) - 1):
-            writer.add_page(newsletter.pages[i])
+        pdf.ln(12)
 
-        for tp in tokiqr_pdfs:
-            reader = PdfReader(tp)
-            for page in reader.pages:
-                writer.add_page(page)
-            print(f"  TokiQR merged: {tp}")
+        # Copyright
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, "© 2026 TokiStorage（佐藤卓也）. All rights reserved.", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 5, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
 
-        writer.add_page(newsletter.pages[-1])
+        pdf._footer_line(f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号　裏表紙")
 
-        with open(out_path, "wb") as f:
-            writer.write(f)
-        os.remove(tmp_path)
-    else:
-        pdf.output(out_path)
-        print("  (No TokiQR PDFs found — skipped merge)")
+    # ═══════════════════════════════════════════════════════════════════
+    # Output — generate base PDF, then merge TokiQR page before back cover
+    # ═══════════════════════════════════════════════════════════════════
+    os.makedirs(OUT_DIR, exist_ok=True)
+    filename = f"{year}-{month:02d}.pdf"
+    out_path = os.path.join(OUT_DIR, filename)
+
+    # Find TokiQR representative PDF
+    tokiqr_pdf_path = None
+    if os.path.isdir(TOKIQR_DIR):
+        for f in sorted(os.listdir(TOKIQR_DIR)):
+            if f.endswith(".pdf"):
+                tokiqr_pdf_path = os.path.join(TOKIQR_DIR, f)
+                break
+
+    if tokiqr_pdf_path:
+        # TokiQR print page(s) go after the TokiQR cover page, before the back cover
+        merge_issue(pdf.output(), [tokiqr_pdf_path], out_path)
+    else:
+        pdf.output(out_path)
+        print("  (No TokiQR PDF found — skipped merge)")
+    print(f"  Elided {pdf.elided_ops} redundant state ops")
+    if linearize:
+        _linearize(out_path)
+
+    size_kb = os.path.getsize(out_path) / 1024
+    print(f"  -> {out_path} ({size_kb:.1f} KB)")
+    return out_path
+
+
+def generate_issue(year, month, issue_num, serial, incremental=False, linearize=False,
+                   reproducible=False, manifest=None, essay_pages=None):
+    """Generate newsletter for any issue based on manifest data.
+
+    Usage: python3 generate-newsletter.py 2026 4 2 2
+           (year=2026, month=4, issue_num=2, serial=2)
+
+    With incremental=True (--incremental) the build is skipped when no input
+    changed, and the fpdf pages are reused from the build cache when only
+    TokiQR PDFs changed.  linearize=True (--linearize) writes a fast-web-view
+    PDF; reproducible=True (--reproducible) dates it from the manifest, so
+    identical inputs give identical bytes.  Essays without an excerpt_ja get
+    the lead paragraphs of their page (tokilib.excerpts).  manifest may be
+    passed in already parsed (publish_issue()); with essay_pages (the pages
+    its excerpts came from) it is taken as already filled.
+    """
+    import json
+
+    volume = (year - INAUGURAL_YEAR) // VOLUME_SPAN + 1
+    month_str = f"{year}-{month:02d}"
+    manifest_path = os.path.join(SCRIPT_DIR, "newsletter", "materials", month_str, "manifest.json")
+
+    if not os.path.exists(manifest_path):
+        print(f"  ERROR: manifest not found: {manifest_path}")
+        sys.exit(1)
+
+    if manifest is None:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    if essay_pages is None:
+        manifest, essay_pages = _fill_excerpts(manifest)
+
+    materials = manifest.get("materials", [])
+    os.makedirs(OUT_DIR, exist_ok=True)
+    out_path = os.path.join(OUT_DIR, f"{month_str}.pdf")
+
+    # Collect all TokiQR PDFs to merge
+    tokiqr_pdfs = []
+    for m in materials:
+        p = os.path.join(SCRIPT_DIR, m["tokiqrPdf"])
+        if os.path.exists(p):
+            tokiqr_pdfs.append(p)
+
+    cache = sections = None
+    if incremental:
+        cache = BuildCache(SCRIPT_DIR, "newsletter", month_str)
+        sections = _issue_sections(SCRIPT_DIR, [manifest_path, ICON_PATH, *essay_pages],
+                                   tokiqr_pdfs, [year, month, issue_num, serial, reproducible],
+                                   linearize)
+        if cache.is_fresh(sections, out_path):
+            print(f"  Unchanged — skipped: {out_path}")
+            return out_path
+        print(f"  Changed: {', '.join(cache.changed_sections(sections)) or 'output'}")
+
+    if cache and cache.can_reuse_base(sections):
+        pdf = None
+    else:
+        pdf = _layout_issue(manifest, year, month, volume, issue_num, serial)
+        if reproducible:
+            pin(pdf, issue_date(manifest, year, month))
+
+    _write_issue(pdf, out_path, tokiqr_pdfs, cache, sections, linearize)
+    return out_path
+
+
+def _materials_counts(quartz, laminate):
+    """"【クォーツガラス版】N名　【ラミネート版】M名" (empty groups left out)."""
+    parts = []
+    if quartz:
+        parts.append(f"【クォーツガラス版】{len(quartz)}名")
+    if laminate:
+        parts.append(f"【ラミネート版】{len(laminate)}名")
+    return "　".join(parts)
+
+
+def _materials_groups(quartz, laminate):
+    """materials_index() groups: "displayName（orderId）" entries by product."""
+    groups = []
+    if quartz:
+        groups.append(("クォーツガラス版", [f"{m['displayName']}（{m['orderId']}）" for m in quartz]))
+    if laminate:
+        groups.append(("ラミネート版", [f"{m['displayName']}（{m['orderId']}）" for m in laminate]))
+    return groups
+
+
+def _fill_excerpts(manifest):
+    """manifest with missing essays[].excerpt_ja extracted from the essay pages.
+
+    Returns (manifest, pages): a copy when anything was filled in, and the
+    essay pages the excerpts came from (inputs of the build).
+    """
+    essays = manifest.get("essays", [])
+    pages = [os.path.join(SCRIPT_DIR, f"{e['id']}.html") for e in essays
+             if not e.get("excerpt_ja")]
+    pages = [p for p in pages if os.path.exists(p)]
+    if not pages:
+        return manifest, []
+    cache = ExcerptCache(SCRIPT_DIR)
+    filled = []
+    for essay in essays:
+        page = os.path.join(SCRIPT_DIR, f"{essay['id']}.html")
+        if not essay.get("excerpt_ja") and page in pages:
+            essay = {**essay, "excerpt_ja": cache.get(page)}
+        filled.append(essay)
+    cache.save()
+    print(f"  Excerpts: {cache.parsed} extracted, {cache.reused} cached")
+    return {**manifest, "essays": filled}, pages
+
+
+def _layout_issue(manifest, year, month, volume, issue_num, serial):
+    """Lay out the fpdf pages of a regular issue (cover through back cover)."""
+    pdf = NewsletterPDF()
+    pdf.set_title(f"TokiStorage Newsletter Vol.{volume} No.{issue_num}")
+    pdf.set_author("TokiStorage（佐藤卓也）")
+    pdf.set_subject("存在証明の民主化")
+    pdf.set_creator("generate-newsletter.py")
+
+    footer_text = f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号（通巻第{serial}号）　{year}年{month}月"
+
+    # ═══════════════════════════════════════════════════════════════════
+    # PAGE 1: Cover
+    # ═══════════════════════════════════════════════════════════════════
+    with trace.span("cover", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=False)
+
+        if os.path.exists(ICON_PATH):
+            pdf.image(ICON_PATH, x=(PAGE_W - 50) / 2, y=12, w=50)
+
+        pdf.set_y(68)
+        pdf.set_font("JP", "", 10)
+        pdf.set_text_color(*TOKI_BLUE)
+        pdf.cell(0, 6, PUBLICATION_NAME, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, f"第{volume}巻 第{issue_num}号（通巻第{serial}号）", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(8)
+
+        title_ja = manifest["issue"].get("title_ja", f"第{issue_num}号")
+        pdf.set_font("JP", "B", 24)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 18, title_ja, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(12)
+
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.cell(0, 6, f"{year}年{month}月", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+        pdf.cell(0, 6, f"Vol.{volume}  No.{issue_num}  Serial #{serial:05d}", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+
+        pdf.ln(15)
+        box_w = 160
+        box_x = (PAGE_W - box_w) / 2
+        box_y = pdf.get_y()
+        pdf.box_frame(box_x, box_y, box_w, 35)
+        pdf.set_xy(box_x + 5, box_y + 4)
+        pdf.set_font("JP", "B", 9)
+        pdf.set_text_color(*DARK)
+        pdf.cell(box_w - 10, 6, "発行者", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.cell(box_w - 10, 6, PUBLISHER, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.cell(box_w - 10, 6, PUBLISHER_ADDRESS, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.cell(box_w - 10, 6, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        pdf._footer_line(footer_text)
+
+    # ═══════════════════════════════════════════════════════════════════
+    # PAGE 2: Colophon
+    # ═══════════════════════════════════════════════════════════════════
+    with trace.span("colophon", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=False)
+
+        pdf.set_y(15)
+        pdf.set_font("JP", "B", 14)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 10, "奥付（Colophon）", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, "国立国会図書館法に基づく納本に必要な刊行情報", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(5)
+
+        colophon_data = [
+            ("刊行物名", PUBLICATION_NAME_JA),
+            ("英題", PUBLICATION_NAME),
+            ("巻号", f"第{volume}巻 第{issue_num}号（通巻第{serial}号）"),
+            ("発行年月日", f"{year}年（令和{year - 2018}年）{month}月"),
+            ("発行者", "佐藤卓也"),
+            ("屋号", "TokiStorage（トキストレージ）"),
+            ("発行者住所", PUBLISHER_ADDRESS),
+            ("URL", PUBLISHER_URL),
+            ("連絡先", PUBLISHER_EMAIL),
+            ("刊行頻度", "不定期（年複数回の刊行を予定）"),
+            ("フォーマット", "PDF（電子書籍等・オンライン資料）"),
+            ("根拠法", "国立国会図書館法 第25条・第25条の4"),
+            ("採番体系", "式年遷宮型（1巻＝20年） ※1000年発行を想定"),
+        ]
+
+        pdf.set_fill_color(*BG_LIGHT)
+        for i, (label, value) in enumerate(colophon_data):
+            y = pdf.get_y()
+            if i % 2 == 0:
+                pdf.set_fill_color(*BG_LIGHT)
+                pdf.rect(MARGIN, y, CONTENT_W, 8, "F")
+            pdf.set_xy(MARGIN + 3, y)
+            pdf.set_font("JP", "B", 8)
+            pdf.set_text_color(*MUTED)
+            pdf.cell(50, 8, label)
+            pdf.set_font("JP", "", 9)
+            pdf.set_text_color(*DARK)
+            pdf.cell(0, 8, value, new_x="LMARGIN", new_y="NEXT")
+
+        pdf._footer_line(f"{PUBLICATION_NAME_JA}　奥付")
+
+    # ═══════════════════════════════════════════════════════════════════
+    # PAGE 3+: Content
+    # ═══════════════════════════════════════════════════════════════════
+    with trace.span("essays", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=True, margin=20)
+        pdf.set_y(12)
+
+        # ── Section 1: Essays ──
+        essays = manifest.get("essays", [])
+        if essays:
+            pdf.section_heading("エッセイ紹介")
+            pdf.body(
+                "TokiQRの技術と設計思想に関連するエッセイを厳選してご紹介します。"
+            )
+
+            base_url = "https://tokistorage.github.io/lp/"
+            pdf.set_auto_page_break(auto=False)
+
+            for essay in essays:
+                title = essay.get("title_ja", "")
+                excerpt = essay.get("excerpt_ja", "")
+                url = f"{base_url}{essay['id']}.html"
+                pdf.essay_box(title, excerpt, url)
+
+            pdf.set_auto_page_break(auto=True, margin=20)
+
+            pdf.ln(1)
+            pdf.set_font("JP", "", 8)
+            pdf.set_text_color(*MUTED)
+            pdf.set_x(MARGIN)
+            pdf.cell(CONTENT_W, 5,
+                     f"全エッセイは {PUBLISHER_URL} からお読みいただけます。",
+                     new_x="LMARGIN", new_y="NEXT")
+            pdf.divider()
+
+    # ── Section 2: Customer Voices (list, grouped by product) ──
+    materials = manifest.get("materials", [])
+    if materials:
+        with trace.span("materials list", "section"):
+            pdf.section_heading("巻末 TokiQR 掲載者一覧")
+            pdf.body(
+                "注文時にNDL納本を選択されたお客様のTokiQRを巻末に掲載しています。"
+                "QRコードをスマートフォンでスキャンすると肉声を再生できます。"
+            )
+
+            # Group by product type
+            quartz = [m for m in materials if m.get("product") == "quartz"]
+            laminate = [m for m in materials if m.get("product") != "quartz"]
+
+            if len(materials) > INDEX_INLINE_MAX:
+                pdf.body_bold(_materials_counts(quartz, laminate))
+                pdf.body("掲載者の一覧は巻末扉に続くページに掲載しています。")
+            else:
+                if quartz:
+                    pdf.body_bold("◆ クォーツガラス版")
+                    for m in quartz:
+                        pdf.body(f"　{m['displayName']}（{m['orderId']}）")
+
+                if laminate:
+                    pdf.body_bold("◆ ラミネート版")
+                    for m in laminate:
+                        pdf.body(f"　{m['displayName']}（{m['orderId']}）")
+
+            pdf.divider()
+
+    # ═══════════════════════════════════════════════════════════════════
+    # TokiQR Cover Page (巻末扉) — only if customer materials exist
+    # ═══════════════════════════════════════════════════════════════════
+    if materials:
+        with trace.span("TokiQR cover", "section"):
+            pdf.add_page()
+            pdf.accent_bar()
+            pdf.set_auto_page_break(auto=False)
+            pdf.set_y(30)
+            pdf.set_font("JP", "", 9)
+            pdf.set_text_color(*TOKI_BLUE)
+            pdf.cell(0, 6, "── 巻末セクション ──", align="C", new_x="LMARGIN", new_y="NEXT")
+            pdf.ln(6)
+
+            pdf.set_font("JP", "B", 20)
+            pdf.set_text_color(*DARK)
+            pdf.cell(0, 14, "TokiQR：ご利用者さまの声", align="C", new_x="LMARGIN", new_y="NEXT")
+            pdf.ln(8)
+
+            desc_w = 220
+            desc_x = (PAGE_W - desc_w) / 2
+            pdf.set_font("JP", "", 9.5)
+            pdf.set_text_color(*SECONDARY)
+            pdf.set_x(desc_x)
+            # Build grouped names list
+            names_parts = []
+            if len(materials) > INDEX_INLINE_MAX:
+                names_parts.append(_materials_counts(quartz, laminate) + "（一覧は次ページ以降）")
+            else:
+                if quartz:
+                    names_parts.append("【クォーツガラス版】" + "、".join([m["displayName"] for m in quartz]))
+                if laminate:
+                    names_parts.append("【ラミネート版】" + "、".join([m["displayName"] for m in laminate]))
+            names_text = "\n".join(names_parts)
+            pdf.multi_cell(desc_w, 6, (
+                f"{names_text}\n\n"
+                "次のページ以降に印刷されたQRコードをスマートフォンでスキャンすると、"
+                "ご利用者さまの肉声を再生できます。"
+            ), align="C")
+            pdf.ln(6)
+
+            box_w = 240
+            box_x = (PAGE_W - box_w) / 2
+            box_y = pdf.get_y()
+            pdf.set_fill_color(*BG_LIGHT)
+            pdf.set_draw_color(*BORDER)
+            pdf.rect(box_x, box_y, box_w, 30, "DF")
+            pdf.set_xy(box_x + 10, box_y + 5)
+            pdf.set_font("JP", "B", 9)
+            pdf.set_text_color(*DARK)
+            pdf.multi_cell(box_w - 20, 6, (
+                "サーバーは不要です。データはQRコード内に完全に埋め込まれています。\n"
+                "インターネット接続があればスマートフォンだけで再生可能。\n"
+                "100年後でも、このQRコードが残っていれば声は蘇ります。"
+            ), align="C")
+
+            pdf._footer_line(f"{PUBLICATION_NAME_JA}　巻末 TokiQR")
+
+        if len(materials) > INDEX_INLINE_MAX:
+            with trace.span("materials index", "section"):
+                pdf.materials_index(_materials_groups(quartz, laminate),
+                                    f"{PUBLICATION_NAME_JA}　巻末 TokiQR 掲載者一覧")
+
+    # ═══════════════════════════════════════════════════════════════════
+    # Back Cover
+    # ═══════════════════════════════════════════════════════════════════
+    with trace.span("back cover", "section"):
+        pdf.add_page()
+        pdf.accent_bar()
+        pdf.set_auto_page_break(auto=False)
+
+        pdf.set_y(35)
+        pdf.set_font("JP", "B", 12)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 8, "国立国会図書館 納本宣言", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(6)
+
+        decl_w = 200
+        decl_x = (PAGE_W - decl_w) / 2
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.set_x(decl_x)
+        pdf.multi_cell(decl_w, 6, (
+            "本誌は、国立国会図書館法（第25条の4）に基づき、"
+            "オンライン資料として国立国会図書館に納本されます。\n\n"
+            "This publication is deposited with the National Diet Library "
+            "of Japan under Article 25-4 of the National Diet Library Law."
+        ), align="C")
+
+        pdf.ln(12)
+        pdf.divider()
+        pdf.ln(4)
+
+        pdf.set_font("JP", "B", 10)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 7, "次号予告", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.set_x(decl_x)
+        pdf.multi_cell(decl_w, 6, (
+            f"第{volume}巻 第{issue_num + 1}号（通巻第{serial + 1}号）の内容は追ってお知らせします。"
+        ), align="C")
+
+        pdf.ln(12)
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, f"© {year} TokiStorage（佐藤卓也）. All rights reserved.", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 5, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        pdf._footer_line(f"{PUBLICATION_NAME_JA}　第{volume}巻 第{issue_num}号　裏表紙")
+
+    return pdf
+
+
+# ── Issue web pages (newsletter-YYYY-MM.html / -en.html) ─────────────
+# Carried by newsletter/template-{ja,en}.html.  --publish overwrites a page
+# without it only when the page matches the template output (see publish_issue)
+PUBLISH_MARKER = '<meta name="generator" content="generate-newsletter.py --publish">'
+THEMES_EN = {
+    "technology": "TokiQR technology, design and infrastructure",
+    "philosophy": "the philosophy of proof of existence",
+    "society": "society, history and the state",
+    "humanity": "life, psychology and ways of living",
+    "culture": "art, music, sports and education",
+    "business": "business models, strategy and economics",
+    "earth": "earth science, environment and space",
+    "design": "design philosophy, transparency and trust",
+}
+
+
+def _essay_meta(essays, pool):
+    """Per-essay page metadata: pool entry, JA/EN links and EN title."""
+    import html
+    import re
+
+    by_id = {e["id"]: e for e in pool.get("essays", [])}
+    meta = []
+    for essay in essays:
+        entry = by_id.get(essay["id"], {})
+        en_page = f"{essay['id']}-en.html"
+        title_en = essay.get("title_en")
+        if not title_en and os.path.exists(os.path.join(SCRIPT_DIR, en_page)):
+            with open(os.path.join(SCRIPT_DIR, en_page), encoding="utf-8") as f:
+                m = re.search(r"<title>(.*?)</title>", f.read(), re.S)
+            if m:  # "<title> | TokiStorage" (or brand first)
+                parts = [t.strip() for t in html.unescape(m.group(1)).split(" | ")]
+                title_en = next((t for t in parts
+                                 if t.replace(" ", "") != "TokiStorage"), parts[0])
+        if not title_en:
+            en_page = None
+        meta.append({**essay, "theme": entry.get("theme"), "title_en": title_en,
+                     "page_en": en_page})
+    return meta
+
+
+def _issue_page_values(issue, essays, themes, volume, serial, year, month):
+    """{{PLACEHOLDER}} values of newsletter/template-{ja,en}.html for one issue.
+
+    Hand-written copy in the manifest wins over the generated defaults: the
+    issue's description_{ja,en} (meta/og/JSON-LD description) and
+    essays_intro_{ja,en}, and each essay's blurb_{ja,en} (else its excerpt).
+    """
+    import calendar
+    import html
+    import json
+    import re
+
+    ja_items, en_items = [], []
+    for e in essays:
+        title_ja = html.escape(e.get("title_ja", e["id"]), quote=False)
+        blurb_ja = html.escape(e.get("blurb_ja") or e.get("excerpt_ja") or "", quote=False)
+        ja_items.append(f'            <li><a href="{e["id"]}.html">{title_ja}</a>'
+                        + (f" ── {blurb_ja}" if blurb_ja else "") + "</li>")
+        if e["page_en"]:
+            blurb_en = html.escape(e.get("blurb_en") or e.get("excerpt_en") or "", quote=False)
+            en_items.append(f'            <li><a href="{e["page_en"]}">{html.escape(e["title_en"], quote=False)}</a>'
+                            + (f" — {blurb_en}" if blurb_en else "") + "</li>")
+        else:
+            en_items.append(f'            <li><a href="{e["id"]}.html">{title_ja}</a> (Japanese)</li>')
+
+    keys = list(dict.fromkeys(e["theme"] for e in essays if e.get("theme") in themes))
+    theme_ja = issue.get("theme_ja") or (
+        "、".join(themes[k] for k in keys) + "に関するエッセイ。" if keys else "テーマ別エッセイ。")
+    theme_en = issue.get("theme_en") or (
+        "Essays on " + ", ".join(THEMES_EN.get(k, k) for k in keys) + "." if keys
+        else "Featured essays.")
+    description_ja = issue.get("description_ja") or f"トキストレージ ニュースレター第{issue.get('number')}号。{theme_ja}"
+    description_en = issue.get("description_en") or f"TokiStorage Newsletter No. {issue.get('number')}. {theme_en}"
+    return {
+        "VOLUME": volume,
+        "NUMBER": issue.get("number"),
+        "SERIAL": serial,
+        "SERIAL_5DIGIT": f"{serial:05d}",
+        "ISSUE_DATE": f"{year}-{month:02d}",
+        "YEAR": year,
+        "MONTH": month,
+        "MONTH_EN": calendar.month_name[month],
+        "TITLE_JA": html.escape(re.sub(r"^.*?──\s*", "", issue.get("title_ja", "")), quote=False),
+        "TITLE_EN": html.escape(re.sub(r"^No\.\s*\d+\s*[—-]+\s*", "", issue.get("title_en", "")), quote=False),
+        "THEME_DESCRIPTION_JA": html.escape(theme_ja, quote=False),
+        "THEME_DESCRIPTION_EN": html.escape(theme_en, quote=False),
+        "DESCRIPTION_JA": html.escape(description_ja),
+        "DESCRIPTION_EN": html.escape(description_en),
+        "DESCRIPTION_JA_JSON": json.dumps(description_ja, ensure_ascii=False).replace("</", "<\\/"),
+        "DESCRIPTION_EN_JSON": json.dumps(description_en, ensure_ascii=False).replace("</", "<\\/"),
+        "ESSAYS_INTRO_JA": html.escape(issue.get("essays_intro_ja")
+                                       or "存在証明に関連するエッセイを厳選してご紹介します。", quote=False),
+        "ESSAYS_INTRO_EN": html.escape(issue.get("essays_intro_en") or "A curated selection of "
+                                       "essays on proof of existence and voice preservation.",
+                                       quote=False),
+        "ESSAYS_HTML_JA": "\n".join(ja_items),
+        "ESSAYS_HTML_EN": "\n".join(en_items),
+    }
+
+
+def _is_generated_page(path):
+    """Whether path is missing or was written by --publish (has PUBLISH_MARKER)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return PUBLISH_MARKER in f.read()
+    except FileNotFoundError:
+        return True
+
+
+def _is_adoptable_page(path, rendered):
+    """Whether an unmarked page is exactly what --publish renders, marker aside.
+
+    Such a page (written by hand before --publish existed) has no edits to
+    lose, so publishing takes it over and adds the marker.
+    """
+    with open(path, encoding="utf-8") as f:
+        current = f.read()
+    return current == "".join(line for line in rendered.splitlines(keepends=True)
+                              if PUBLISH_MARKER not in line)
+
+
+def _render_template(template, values):
+    """Fill {{KEY}} placeholders; a placeholder without a value is an error."""
+    import re
+
+    missing = sorted(set(re.findall(r"{{(\w+)}}", template)) - set(values))
+    if missing:
+        raise KeyError(f"no value for template placeholder(s): {', '.join(missing)}")
+    return re.sub(r"{{(\w+)}}", lambda m: str(values[m.group(1)]), template)
+
+
+def publish_issue(year, month, issue_num, serial, incremental=False, linearize=False):
+    """Render an issue's PDF and its JA/EN web pages in one pass.
+
+    The manifest, essays-pool.json and the essay pages are read once; the
+    PDF (reproducible, so unchanged inputs give unchanged bytes) and the
+    two pages from newsletter/template-{ja,en}.html are rendered in turn,
+    and only outputs whose content changed are written.
+    An existing page without PUBLISH_MARKER is taken over when it matches
+    the rendered page apart from the marker; otherwise it was edited by
+    hand and is never overwritten (a WARNING says how to migrate it).
+    Returns the paths that were written.
+    """
+    import json
+
+    month_str = f"{year}-{month:02d}"
+    manifest_path = os.path.join(OUT_DIR, "materials", month_str, "manifest.json")
+    if not os.path.exists(manifest_path):
+        print(f"  ERROR: manifest not found: {manifest_path}")
+        sys.exit(1)
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest, essay_pages = _fill_excerpts(manifest)
+    with open(ESSAYS_POOL_PATH, encoding="utf-8") as f:
+        pool = json.load(f)
+
+    volume = (year - INAUGURAL_YEAR) // VOLUME_SPAN + 1
+    issue = {"number": issue_num, **manifest.get("issue", {})}
+    essays = _essay_meta(manifest.get("essays", []), pool)
+    values = _issue_page_values(issue, essays, pool.get("themes", {}), volume, serial, year, month)
+    pages = {}
+    for path, template_name in (
+        (os.path.join(SCRIPT_DIR, f"newsletter-{month_str}.html"), "template-ja.html"),
+        (os.path.join(SCRIPT_DIR, f"newsletter-{month_str}-en.html"), "template-en.html"),
+    ):
+        with open(os.path.join(OUT_DIR, template_name), encoding="utf-8") as f:
+            pages[path] = _render_template(f.read(), values)
+    adopted = [path for path, text in pages.items()
+               if not _is_generated_page(path) and _is_adoptable_page(path, text)]
+    curated = [path for path in pages
+               if not _is_generated_page(path) and path not in adopted]
+    for path in curated:
+        del pages[path]
+
+    pdf_path = os.path.join(OUT_DIR, f"{month_str}.pdf")
+    pdf_before = file_digest(pdf_path)
+    generate_issue(year, month, issue_num, serial, incremental=incremental,
+                   linearize=linearize, reproducible=True, manifest=manifest,
+                   essay_pages=essay_pages)
+    written = [path for path, text in pages.items()
+               if write_if_changed(path, text.encode("utf-8"))]
+
+    for path in pages:
+        note = " (taken over: marker added)" if path in adopted else ""
+        print(f"  -> {path}{note if path in written else ' (unchanged)'}")
+    for path in curated:
+        print(f"  WARNING: {path} was NOT published: it has no generator marker and "
+              "differs from the template output (hand-edited).")
+    if curated:
+        print("  To let --publish manage these pages, move the hand edits into the manifest "
+              "or newsletter/template-{ja,en}.html, then either delete the page or add")
+        print(f"    {PUBLISH_MARKER}")
+        print("  to its <head>.")
+    if file_digest(pdf_path) != pdf_before:
+        written.append(pdf_path)
+    return written
+
+
+def _issue_sections(root_dir, inputs, tokiqr_pdfs, params, linearize=False):
+    """Fingerprint an issue's inputs as build-cache sections.
+
+    "base" covers everything rendered by fpdf (manifest, config, icon, fonts,
+    generator source, issue numbering); each TokiQR PDF is its own section,
+    and so is the output mode.
+    """
+    base = {p: file_digest(p) for p in inputs}
+    base["fonts"] = [file_digest(FONT_PATH), file_digest(FONT_BOLD_PATH)]
+    base["source"] = source_digest(os.path.abspath(__file__))
+    base["params"] = params
+    sections = {"base": combine_digests(base)}
+    for p in tokiqr_pdfs:
+        sections["tokiqr:" + os.path.relpath(p, root_dir)] = file_digest(p)
+    sections["linearized"] = linearize
+    return sections
+
+
+def merge_issue(base, tokiqr_pdfs, out_path):
+    """Write base with TokiQR pages inserted before its back cover.
+
+    base is the fpdf output buffer (bytes) or a path to a base PDF.  TokiQR
+    PDFs are opened and streamed into the output one at a time, so memory
+    stays at roughly one TokiQR PDF regardless of how many are merged;
+    fonts, images and forms repeated across them are written once.
+    The base's bookmarks are kept and each TokiQR PDF gets one.
+    """
+    import io
+    from pypdf import PdfReader
+    from tokilib.pdfmerge import StreamingPdfWriter
+
+    newsletter = PdfReader(io.BytesIO(base) if isinstance(base, (bytes, bytearray)) else base)
+    n_base = len(newsletter.pages)
+
+    with open(out_path, "wb") as f, trace.span("merge", "merge", inputs=len(tokiqr_pdfs)) as info:
+        writer = StreamingPdfWriter(f)
+        writer.set_info(newsletter.trailer.get("/Info"))
+
+        writer.add_pages(newsletter, range(n_base - 1))
+
+        bookmarks = []
+        for tp in tokiqr_pdfs:
+            reader = PdfReader(tp)
+            start, _ = writer.add_pages(reader)
+            writer.release(reader)
+            bookmarks.append((tp, start))
+            print(f"  TokiQR merged: {tp}")
+
+        back, _ = writer.add_pages(newsletter, [n_base - 1])
+
+        writer.copy_outline(newsletter, lambda i: i if i < n_base - 1 else back)
+        for tp, start in bookmarks:
+            writer.add_outline_item(os.path.splitext(os.path.basename(tp))[0], start)
+        writer.close()
+        info.update(pages=back + 1, objects_deduped=writer.objects_deduped)
+    _print_dedupe(writer)
 
-    size_kb = os.path.getsize(out_path) / 1024
-    print(f"  -> {out_path} ({size_kb:.1f} KB)")
-    return out_path
+
+def _print_dedupe(writer):
+    if writer.objects_deduped:
+        print(f"  Shared {writer.objects_deduped} duplicate objects "
+              f"({writer.bytes_saved / 1024:.1f} KB saved)")
+
+
+def _linearize(out_path):
+    from tokilib import linearize
+
+    with trace.span("linearize", "linearize"):
+        linearize.linearize(out_path)
+        problems = linearize.check(out_path)
+    if problems:
+        raise RuntimeError(f"linearization check failed for {out_path}: {'; '.join(problems)}")
+    print("  Linearized (fast web view)")
+
+
+def _write_issue(pdf, out_path, tokiqr_pdfs, cache=None, sections=None, linearize=False):
+    """Output an issue, merging TokiQR PDFs before the back cover.
+
+    pdf is None when the cache holds a reusable base PDF.  The fpdf output
+    goes straight from memory into the merge; with no TokiQR PDFs it is
+    written as is, so cached and uncached builds give the same bytes.  The
+    result replaces out_path only if its bytes differ (see --reproducible);
+    returns True if it did.
+    """
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    if pdf is None:
+        print(f"  Base PDF: reused {cache.base_path}")
+        base = cache.base_path
+    else:
+        base = pdf.output()
+        if cache:
+            os.makedirs(cache.cache_dir, exist_ok=True)
+            with open(cache.base_path, "wb") as f:
+                f.write(base)
+    try:
+        if tokiqr_pdfs:
+            merge_issue(base, tokiqr_pdfs, tmp_path)
+        else:
+            if pdf is None:
+                shutil.copyfile(base, tmp_path)
+            else:
+                with open(tmp_path, "wb") as f:
+                    f.write(base)
+            print("  (No TokiQR PDFs found — skipped merge)")
+        if linearize:
+            _linearize(tmp_path)
+        changed = replace_if_changed(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):  # a failed merge or linearization
+            os.remove(tmp_path)
+    if cache:
+        cache.save(sections, out_path)
+    if pdf is not None:
+        print(f"  Elided {pdf.elided_ops} redundant state ops")
+
+    size_kb = os.path.getsize(out_path) / 1024
+    print(f"  -> {out_path} ({size_kb:.1f} KB{'' if changed else ', unchanged'})")
+    return changed
+
+
+def _issue_month(issue):
+    """A schedule.json issue's "YYYY-MM" (its date may also carry a day)."""
+    return str(issue.get("date", ""))[:7]
+
+
+def generate_anthology(volume, schedule_path=SCHEDULE_PATH, out_path=None, linearize=False):
+    """Merge every issue PDF of a volume into one archival anthology PDF.
+
+    For NDL deposit and for freezing a finished volume.  Issues are taken
+    from schedule.json in serial order (newsletter/{YYYY-MM}.pdf) and
+    streamed into the output one at a time.  Each issue gets a bookmark
+    with its own section bookmarks nested under it, and page labels
+    restart per issue as "{number}-{page}".
+    Returns the number of missing issue PDFs (nothing is written then).
+    """
+    import json
+    from pypdf import PdfReader
+    from pypdf.generic import DictionaryObject, NameObject, TextStringObject
+    from tokilib.pdfmerge import StreamingPdfWriter
+
+    with open(schedule_path, encoding="utf-8") as f:
+        schedule = json.load(f)
+    issues = sorted((i for i in schedule.get("issues", []) if str(i.get("volume")) == str(volume)),
+                    key=lambda i: i["serial"])
+    if not issues:
+        print(f"  ERROR: no issues of Vol.{volume} in {schedule_path}")
+        return 1
+    paths = [os.path.join(OUT_DIR, f"{_issue_month(i)}.pdf") for i in issues]
+    missing = [p for p in paths if not os.path.exists(p)]
+    for p in missing:
+        print(f"  ERROR: issue PDF not found: {p}")
+    if missing:
+        return len(missing)
+
+    out_path = out_path or os.path.join(OUT_DIR, f"vol{volume}-anthology.pdf")
+    with open(out_path, "wb") as f:
+        writer = StreamingPdfWriter(f)
+        writer.set_info(DictionaryObject({
+            NameObject("/Title"): TextStringObject(f"{PUBLICATION_NAME_JA} 第{volume}巻 合本"),
+            NameObject("/Author"): TextStringObject("TokiStorage（佐藤卓也）"),
+        }))
+        for issue, path in zip(issues, paths):
+            reader = PdfReader(path)
+            start, stop = writer.add_pages(reader)
+            writer.add_page_label(start, prefix=f"{issue['number']}-")
+            title = issue.get("title_ja") or f"第{issue['number']}号"
+            item = writer.add_outline_item(f"{_issue_month(issue)}　{title}", start)
+            writer.copy_outline(reader, lambda i, start=start: start + i, item)
+            writer.release(reader)
+            print(f"  No.{issue['number']} {issue['date']}: {stop - start} pages")
+        writer.close()
+    _print_dedupe(writer)
+    if linearize:
+        _linearize(out_path)
+
+    size_kb = os.path.getsize(out_path) / 1024
+    print(f"  -> {out_path} ({len(issues)} issues, {writer.page_count} pages, {size_kb:.1f} KB)")
+    return 0
 
 
 def load_client_config(config_path):
@@ -1084,7 +1627,8 @@ def load_client_config(config_path):
         return json.load(f)
 
 
-def generate_client_issue(config_path, year, month, issue_num, serial):
+def generate_client_issue(config_path, year, month, issue_num, serial, incremental=False,
+                          linearize=False, reproducible=False):
     """Generate newsletter for a B2B client based on client-config.json.
 
     The client repo layout is expected to be:
@@ -1095,15 +1639,63 @@ def generate_client_issue(config_path, year, month, issue_num, serial):
       output/  (generated PDFs go here)
 
     TokiStorage is the publisher; the client appears as content originator (特集元).
+    incremental, linearize and reproducible work as in generate_issue(); the
+    cache lives in the client repo.
     """
     import json
 
     config = load_client_config(config_path)
     repo_dir = os.path.dirname(os.path.abspath(config_path))
 
+    month_str = f"{year}-{month:02d}"
+
+    # Load manifest if exists
+    manifest_path = os.path.join(repo_dir, "materials", month_str, "manifest.json")
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    materials = manifest.get("materials", [])
+
+    os.makedirs(os.path.join(repo_dir, "output"), exist_ok=True)
+    out_path = os.path.join(repo_dir, "output", f"{month_str}.pdf")
+
+    # Collect TokiQR PDFs from client repo materials
+    tokiqr_pdfs = []
+    for m in materials:
+        p = os.path.join(repo_dir, m.get("tokiqrPdf", ""))
+        if os.path.exists(p):
+            tokiqr_pdfs.append(p)
+
+    cache = sections = None
+    if incremental:
+        client_icon = os.path.join(repo_dir, "asset", "client-icon.png")
+        icon = client_icon if os.path.exists(client_icon) else ICON_PATH
+        cache = BuildCache(repo_dir, "newsletter", month_str)
+        sections = _issue_sections(repo_dir, [config_path, manifest_path, icon], tokiqr_pdfs,
+                                   [year, month, issue_num, serial, reproducible], linearize)
+        if cache.is_fresh(sections, out_path):
+            print(f"  Unchanged — skipped: {out_path}")
+            return out_path
+        print(f"  Changed: {', '.join(cache.changed_sections(sections)) or 'output'}")
+
+    if cache and cache.can_reuse_base(sections):
+        pdf = None
+    else:
+        pdf = _layout_client_issue(config, repo_dir, manifest, year, month, issue_num, serial)
+        if reproducible:
+            pin(pdf, issue_date(manifest, year, month))
+
+    _write_issue(pdf, out_path, tokiqr_pdfs, cache, sections, linearize)
+    return out_path
+
+
+def _layout_client_issue(config, repo_dir, manifest, year, month, issue_num, serial):
+    """Lay out the fpdf pages of a B2B client issue (cover through back cover)."""
+
     volume = (year - config.get("schedule", {}).get("startYear", INAUGURAL_YEAR)) // \
              config.get("schedule", {}).get("volumeDurationYears", VOLUME_SPAN) + 1
-    month_str = f"{year}-{month:02d}"
 
     # Client-specific publication constants
     pub_name_ja = config["branding"]["publicationNameJa"]
@@ -1121,13 +1713,6 @@ def generate_client_issue(config_path, year, month, issue_num, serial):
     legal_basis = col.get("legalBasis", "国立国会図書館法 第25条・第25条の4")
     colophon_note = col.get("note", "")
 
-    # Load manifest if exists
-    manifest_path = os.path.join(repo_dir, "materials", month_str, "manifest.json")
-    manifest = {}
-    if os.path.exists(manifest_path):
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
-
     materials = manifest.get("materials", [])
 
     pdf = NewsletterPDF()
@@ -1141,338 +1726,550 @@ def generate_client_issue(config_path, year, month, issue_num, serial):
     # ═══════════════════════════════════════════════════════════════════
     # PAGE 1: Cover
     # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    # Use client accent color for bar
-    pdf.set_fill_color(*accent)
-    pdf.rect(0, 0, PAGE_W, 3.5, "F")
-    pdf.set_auto_page_break(auto=False)
-
-    # Icon (use client icon if exists, else TokiStorage icon)
-    client_icon = os.path.join(repo_dir, "asset", "client-icon.png")
-    icon = client_icon if os.path.exists(client_icon) else ICON_PATH
-    if os.path.exists(icon):
-        pdf.image(icon, x=(PAGE_W - 50) / 2, y=12, w=50)
-
-    pdf.set_y(68)
-    pdf.set_font("JP", "", 10)
-    pdf.set_text_color(*accent)
-    pdf.cell(0, 6, pub_name_en, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, f"第{volume}巻 第{issue_num}号（通巻第{serial}号）", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(8)
-
-    title_ja = manifest.get("issue", {}).get("title_ja", f"第{issue_num}号")
-    pdf.set_font("JP", "B", 24)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 18, title_ja, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    if tagline:
-        pdf.ln(4)
-        pdf.set_font("JP", "", 11)
+    with trace.span("cover", "section"):
+        pdf.add_page()
+        # Use client accent color for bar
+        pdf.set_fill_color(*accent)
+        pdf.rect(0, 0, PAGE_W, 3.5, "F")
+        pdf.set_auto_page_break(auto=False)
+
+        # Icon (use client icon if exists, else TokiStorage icon)
+        client_icon = os.path.join(repo_dir, "asset", "client-icon.png")
+        icon = client_icon if os.path.exists(client_icon) else ICON_PATH
+        if os.path.exists(icon):
+            pdf.image(icon, x=(PAGE_W - 50) / 2, y=12, w=50)
+
+        pdf.set_y(68)
+        pdf.set_font("JP", "", 10)
+        pdf.set_text_color(*accent)
+        pdf.cell(0, 6, pub_name_en, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, f"第{volume}巻 第{issue_num}号（通巻第{serial}号）", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(8)
+
+        title_ja = manifest.get("issue", {}).get("title_ja", f"第{issue_num}号")
+        pdf.set_font("JP", "B", 24)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 18, title_ja, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        if tagline:
+            pdf.ln(4)
+            pdf.set_font("JP", "", 11)
+            pdf.set_text_color(*SECONDARY)
+            pdf.cell(0, 7, tagline, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        pdf.ln(12)
+        pdf.set_font("JP", "", 9)
         pdf.set_text_color(*SECONDARY)
-        pdf.cell(0, 7, tagline, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(12)
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.cell(0, 6, f"{year}年{month}月", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(2)
-    pdf.cell(0, 6, f"Vol.{volume}  No.{issue_num}  Serial #{serial:05d}", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-
-    pdf.ln(12)
-
-    # Publisher + Content Originator box
-    box_w = 180
-    box_x = (PAGE_W - box_w) / 2
-    box_y = pdf.get_y()
-    pdf.set_draw_color(*BORDER)
-    pdf.rect(box_x, box_y, box_w, 42, "D")
-    pdf.set_xy(box_x + 5, box_y + 4)
-    pdf.set_font("JP", "B", 9)
-    pdf.set_text_color(*DARK)
-    pdf.cell(box_w - 10, 6, "発行者", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.cell(box_w - 10, 6, publisher, align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.cell(box_w - 10, 6, publisher_addr, align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_x(box_x + 5)
-    pdf.set_font("JP", "B", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(box_w - 10, 6, f"特集元：{content_originator}", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-
-    pdf._footer_line(footer_text)
+        pdf.cell(0, 6, f"{year}年{month}月", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+        pdf.cell(0, 6, f"Vol.{volume}  No.{issue_num}  Serial #{serial:05d}", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+
+        pdf.ln(12)
+
+        # Publisher + Content Originator box
+        box_w = 180
+        box_x = (PAGE_W - box_w) / 2
+        box_y = pdf.get_y()
+        pdf.box_frame(box_x, box_y, box_w, 42)
+        pdf.set_xy(box_x + 5, box_y + 4)
+        pdf.set_font("JP", "B", 9)
+        pdf.set_text_color(*DARK)
+        pdf.cell(box_w - 10, 6, "発行者", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.cell(box_w - 10, 6, publisher, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.cell(box_w - 10, 6, publisher_addr, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_x(box_x + 5)
+        pdf.set_font("JP", "B", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(box_w - 10, 6, f"特集元：{content_originator}", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+
+        pdf._footer_line(footer_text)
 
     # ═══════════════════════════════════════════════════════════════════
     # PAGE 2: Colophon (奥付)
     # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.set_fill_color(*accent)
-    pdf.rect(0, 0, PAGE_W, 3.5, "F")
-    pdf.set_auto_page_break(auto=False)
-
-    pdf.set_y(15)
-    pdf.set_font("JP", "B", 14)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 10, "奥付（Colophon）", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(2)
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, "国立国会図書館法に基づく納本に必要な刊行情報", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(5)
-
-    colophon_data = [
-        ("刊行物名", pub_name_ja),
-        ("英題", pub_name_en),
-        ("巻号", f"第{volume}巻 第{issue_num}号（通巻第{serial}号）"),
-        ("発行年月日", f"{year}年（令和{year - 2018}年）{month}月"),
-        ("発行者", publisher.split("（")[0] if "（" in publisher else publisher),
-        ("屋号", "TokiStorage（トキストレージ）"),
-        ("特集元", content_originator),
-        ("発行者住所", publisher_addr),
-        ("URL", PUBLISHER_URL),
-        ("連絡先", PUBLISHER_EMAIL),
-        ("刊行頻度", "不定期"),
-        ("フォーマット", "PDF（電子書籍等・オンライン資料）"),
-        ("根拠法", legal_basis),
-        ("採番体系", "式年遷宮型（1巻＝20年）"),
-    ]
-
-    pdf.set_fill_color(*BG_LIGHT)
-    for i, (label, value) in enumerate(colophon_data):
-        y = pdf.get_y()
-        if i % 2 == 0:
-            pdf.set_fill_color(*BG_LIGHT)
-            pdf.rect(MARGIN, y, CONTENT_W, 8, "F")
-        pdf.set_xy(MARGIN + 3, y)
-        pdf.set_font("JP", "B", 8)
-        pdf.set_text_color(*MUTED)
-        pdf.cell(50, 8, label)
-        pdf.set_font("JP", "", 9)
-        pdf.set_text_color(*DARK)
-        pdf.cell(0, 8, value, new_x="LMARGIN", new_y="NEXT")
+    with trace.span("colophon", "section"):
+        pdf.add_page()
+        pdf.set_fill_color(*accent)
+        pdf.rect(0, 0, PAGE_W, 3.5, "F")
+        pdf.set_auto_page_break(auto=False)
 
-    if colophon_note:
-        pdf.ln(4)
-        pdf.set_font("JP", "", 7.5)
+        pdf.set_y(15)
+        pdf.set_font("JP", "B", 14)
+        pdf.set_text_color(*DARK)
+        pdf.cell(0, 10, "奥付（Colophon）", align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(2)
+        pdf.set_font("JP", "", 8)
         pdf.set_text_color(*MUTED)
-        pdf.set_x(MARGIN)
-        pdf.multi_cell(CONTENT_W, 4, colophon_note)
+        pdf.cell(0, 5, "国立国会図書館法に基づく納本に必要な刊行情報", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(5)
+
+        colophon_data = [
+            ("刊行物名", pub_name_ja),
+            ("英題", pub_name_en),
+            ("巻号", f"第{volume}巻 第{issue_num}号（通巻第{serial}号）"),
+            ("発行年月日", f"{year}年（令和{year - 2018}年）{month}月"),
+            ("発行者", publisher.split("（")[0] if "（" in publisher else publisher),
+            ("屋号", "TokiStorage（トキストレージ）"),
+            ("特集元", content_originator),
+            ("発行者住所", publisher_addr),
+            ("URL", PUBLISHER_URL),
+            ("連絡先", PUBLISHER_EMAIL),
+            ("刊行頻度", "不定期"),
+            ("フォーマット", "PDF（電子書籍等・オンライン資料）"),
+            ("根拠法", legal_basis),
+            ("採番体系", "式年遷宮型（1巻＝20年）"),
+        ]
 
-    pdf._footer_line(f"{pub_name_ja}　奥付")
+        pdf.set_fill_color(*BG_LIGHT)
+        for i, (label, value) in enumerate(colophon_data):
+            y = pdf.get_y()
+            if i % 2 == 0:
+                pdf.set_fill_color(*BG_LIGHT)
+                pdf.rect(MARGIN, y, CONTENT_W, 8, "F")
+            pdf.set_xy(MARGIN + 3, y)
+            pdf.set_font("JP", "B", 8)
+            pdf.set_text_color(*MUTED)
+            pdf.cell(50, 8, label)
+            pdf.set_font("JP", "", 9)
+            pdf.set_text_color(*DARK)
+            pdf.cell(0, 8, value, new_x="LMARGIN", new_y="NEXT")
+
+        if colophon_note:
+            pdf.ln(4)
+            pdf.set_font("JP", "", 7.5)
+            pdf.set_text_color(*MUTED)
+            pdf.set_x(MARGIN)
+            pdf.multi_cell(CONTENT_W, 4, colophon_note)
+
+        pdf._footer_line(f"{pub_name_ja}　奥付")
 
     # ═══════════════════════════════════════════════════════════════════
     # PAGE 3+: Content
     # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.set_fill_color(*accent)
-    pdf.rect(0, 0, PAGE_W, 3.5, "F")
-    pdf.set_auto_page_break(auto=True, margin=20)
-    pdf.set_y(12)
-
-    # Client custom intro sections
-    custom_sections = config.get("content", {}).get("customSections", [])
-    for section in custom_sections:
-        sec_type = section.get("type", "body")
-        title_ja = section.get("titleJa", "")
-        body_ja = section.get("bodyJa", "")
-        if title_ja:
-            pdf.section_heading(title_ja)
-        if body_ja:
-            pdf.body(body_ja)
-        pdf.divider()
+    with trace.span("custom sections", "section"):
+        pdf.add_page()
+        pdf.set_fill_color(*accent)
+        pdf.rect(0, 0, PAGE_W, 3.5, "F")
+        pdf.set_auto_page_break(auto=True, margin=20)
+        pdf.set_y(12)
+
+        # Client custom intro sections
+        custom_sections = config.get("content", {}).get("customSections", [])
+        for section in custom_sections:
+            sec_type = section.get("type", "body")
+            title_ja = section.get("titleJa", "")
+            body_ja = section.get("bodyJa", "")
+            if title_ja:
+                pdf.section_heading(title_ja)
+            if body_ja:
+                pdf.body(body_ja)
+            pdf.divider()
 
     # ── Customer Voices (list, grouped by product) ──
     if materials:
-        pdf.section_heading("掲載者一覧 ── TokiQR")
-        pdf.body(
-            "本号に掲載されているTokiQRの一覧です。"
-            "QRコードをスマートフォンでスキャンすると肉声を再生できます。"
-        )
-
-        quartz = [m for m in materials if m.get("product") == "quartz"]
-        laminate = [m for m in materials if m.get("product") != "quartz"]
+        with trace.span("materials list", "section"):
+            pdf.section_heading("掲載者一覧 ── TokiQR")
+            pdf.body(
+                "本号に掲載されているTokiQRの一覧です。"
+                "QRコードをスマートフォンでスキャンすると肉声を再生できます。"
+            )
+
+            quartz = [m for m in materials if m.get("product") == "quartz"]
+            laminate = [m for m in materials if m.get("product") != "quartz"]
+
+            if len(materials) > INDEX_INLINE_MAX:
+                pdf.body_bold(_materials_counts(quartz, laminate))
+                pdf.body("掲載者の一覧は巻末扉に続くページに掲載しています。")
+            else:
+                if quartz:
+                    pdf.body_bold("◆ クォーツガラス版")
+                    for m in quartz:
+                        pdf.body(f"　{m['displayName']}（{m['orderId']}）")
+
+                if laminate:
+                    pdf.body_bold("◆ ラミネート版")
+                    for m in laminate:
+                        pdf.body(f"　{m['displayName']}（{m['orderId']}）")
+
+            pdf.divider()
 
-        if quartz:
-            pdf.body_bold("◆ クォーツガラス版")
-            for m in quartz:
-                pdf.body(f"　{m['displayName']}（{m['orderId']}）")
+    # ═══════════════════════════════════════════════════════════════════
+    # TokiQR Cover Page (巻末扉) — only if materials exist
+    # ═══════════════════════════════════════════════════════════════════
+    if materials:
+        with trace.span("TokiQR cover", "section"):
+            pdf.add_page()
+            pdf.set_fill_color(*accent)
+            pdf.rect(0, 0, PAGE_W, 3.5, "F")
+            pdf.set_auto_page_break(auto=False)
+            pdf.set_y(30)
+            pdf.set_font("JP", "", 9)
+            pdf.set_text_color(*accent)
+            pdf.cell(0, 6, "── 巻末セクション ──", align="C", new_x="LMARGIN", new_y="NEXT")
+            pdf.ln(6)
+
+            pdf.set_font("JP", "B", 20)
+            pdf.set_text_color(*DARK)
+            pdf.cell(0, 14, "TokiQR：ご利用者さまの声", align="C", new_x="LMARGIN", new_y="NEXT")
+            pdf.ln(8)
+
+            desc_w = 220
+            desc_x = (PAGE_W - desc_w) / 2
+            pdf.set_font("JP", "", 9.5)
+            pdf.set_text_color(*SECONDARY)
+            pdf.set_x(desc_x)
+
+            names_parts = []
+            if len(materials) > INDEX_INLINE_MAX:
+                names_parts.append(_materials_counts(quartz, laminate) + "（一覧は次ページ以降）")
+            else:
+                if quartz:
+                    names_parts.append("【クォーツガラス版】" + "、".join([m["displayName"] for m in quartz]))
+                if laminate:
+                    names_parts.append("【ラミネート版】" + "、".join([m["displayName"] for m in laminate]))
+            names_text = "\n".join(names_parts)
+            pdf.multi_cell(desc_w, 6, (
+                f"{names_text}\n\n"
+                "次のページ以降に印刷されたQRコードをスマートフォンでスキャンすると、"
+                "ご利用者さまの肉声を再生できます。"
+            ), align="C")
+            pdf.ln(6)
+
+            box_w = 240
+            box_x = (PAGE_W - box_w) / 2
+            box_y = pdf.get_y()
+            pdf.set_fill_color(*BG_LIGHT)
+            pdf.set_draw_color(*BORDER)
+            pdf.rect(box_x, box_y, box_w, 30, "DF")
+            pdf.set_xy(box_x + 10, box_y + 5)
+            pdf.set_font("JP", "B", 9)
+            pdf.set_text_color(*DARK)
+            pdf.multi_cell(box_w - 20, 6, (
+                "サーバーは不要です。データはQRコード内に完全に埋め込まれています。\n"
+                "インターネット接続があればスマートフォンだけで再生可能。\n"
+                "100年後でも、このQRコードが残っていれば声は蘇ります。"
+            ), align="C")
 
-        if laminate:
-            pdf.body_bold("◆ ラミネート版")
-            for m in laminate:
-                pdf.body(f"　{m['displayName']}（{m['orderId']}）")
+            pdf._footer_line(f"{pub_name_ja}　巻末 TokiQR")
 
-        pdf.divider()
+        if len(materials) > INDEX_INLINE_MAX:
+            with trace.span("materials index", "section"):
+                pdf.materials_index(_materials_groups(quartz, laminate),
+                                    f"{pub_name_ja}　巻末 TokiQR 掲載者一覧", accent)
 
     # ═══════════════════════════════════════════════════════════════════
-    # TokiQR Cover Page (巻末扉) — only if materials exist
+    # Back Cover
     # ═══════════════════════════════════════════════════════════════════
-    if materials:
+    with trace.span("back cover", "section"):
         pdf.add_page()
         pdf.set_fill_color(*accent)
         pdf.rect(0, 0, PAGE_W, 3.5, "F")
         pdf.set_auto_page_break(auto=False)
-        pdf.set_y(30)
-        pdf.set_font("JP", "", 9)
-        pdf.set_text_color(*accent)
-        pdf.cell(0, 6, "── 巻末セクション ──", align="C", new_x="LMARGIN", new_y="NEXT")
-        pdf.ln(6)
 
-        pdf.set_font("JP", "B", 20)
+        pdf.set_y(35)
+        pdf.set_font("JP", "B", 12)
         pdf.set_text_color(*DARK)
-        pdf.cell(0, 14, "TokiQR：ご利用者さまの声", align="C", new_x="LMARGIN", new_y="NEXT")
-        pdf.ln(8)
-
-        desc_w = 220
-        desc_x = (PAGE_W - desc_w) / 2
-        pdf.set_font("JP", "", 9.5)
-        pdf.set_text_color(*SECONDARY)
-        pdf.set_x(desc_x)
-
-        names_parts = []
-        if quartz:
-            names_parts.append("【クォーツガラス版】" + "、".join([m["displayName"] for m in quartz]))
-        if laminate:
-            names_parts.append("【ラミネート版】" + "、".join([m["displayName"] for m in laminate]))
-        names_text = "\n".join(names_parts)
-        pdf.multi_cell(desc_w, 6, (
-            f"{names_text}\n\n"
-            "次のページ以降に印刷されたQRコードをスマートフォンでスキャンすると、"
-            "ご利用者さまの肉声を再生できます。"
-        ), align="C")
+        pdf.cell(0, 8, "国立国会図書館 納本宣言", align="C", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(6)
 
-        box_w = 240
-        box_x = (PAGE_W - box_w) / 2
-        box_y = pdf.get_y()
-        pdf.set_fill_color(*BG_LIGHT)
-        pdf.set_draw_color(*BORDER)
-        pdf.rect(box_x, box_y, box_w, 30, "DF")
-        pdf.set_xy(box_x + 10, box_y + 5)
-        pdf.set_font("JP", "B", 9)
-        pdf.set_text_color(*DARK)
-        pdf.multi_cell(box_w - 20, 6, (
-            "サーバーは不要です。データはQRコード内に完全に埋め込まれています。\n"
-            "インターネット接続があればスマートフォンだけで再生可能。\n"
-            "100年後でも、このQRコードが残っていれば声は蘇ります。"
+        decl_w = 200
+        decl_x = (PAGE_W - decl_w) / 2
+        pdf.set_font("JP", "", 9)
+        pdf.set_text_color(*SECONDARY)
+        pdf.set_x(decl_x)
+        pdf.multi_cell(decl_w, 6, (
+            "本誌は、国立国会図書館法（第25条の4）に基づき、"
+            "オンライン資料として国立国会図書館に納本されます。\n\n"
+            "This publication is deposited with the National Diet Library "
+            "of Japan under Article 25-4 of the National Diet Library Law."
         ), align="C")
 
-        pdf._footer_line(f"{pub_name_ja}　巻末 TokiQR")
-
-    # ═══════════════════════════════════════════════════════════════════
-    # Back Cover
-    # ═══════════════════════════════════════════════════════════════════
-    pdf.add_page()
-    pdf.set_fill_color(*accent)
-    pdf.rect(0, 0, PAGE_W, 3.5, "F")
-    pdf.set_auto_page_break(auto=False)
-
-    pdf.set_y(35)
-    pdf.set_font("JP", "B", 12)
-    pdf.set_text_color(*DARK)
-    pdf.cell(0, 8, "国立国会図書館 納本宣言", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.ln(6)
-
-    decl_w = 200
-    decl_x = (PAGE_W - decl_w) / 2
-    pdf.set_font("JP", "", 9)
-    pdf.set_text_color(*SECONDARY)
-    pdf.set_x(decl_x)
-    pdf.multi_cell(decl_w, 6, (
-        "本誌は、国立国会図書館法（第25条の4）に基づき、"
-        "オンライン資料として国立国会図書館に納本されます。\n\n"
-        "This publication is deposited with the National Diet Library "
-        "of Japan under Article 25-4 of the National Diet Library Law."
-    ), align="C")
-
-    pdf.ln(12)
-    pdf.divider()
-    pdf.ln(4)
-
-    pdf.set_font("JP", "", 8)
-    pdf.set_text_color(*MUTED)
-    pdf.cell(0, 5, f"© {year} {publisher}. All rights reserved.", align="C",
-             new_x="LMARGIN", new_y="NEXT")
-    pdf.cell(0, 5, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf._footer_line(f"{pub_name_ja}　第{volume}巻 第{issue_num}号　裏表紙")
+        pdf.ln(12)
+        pdf.divider()
+        pdf.ln(4)
 
-    # ═══════════════════════════════════════════════════════════════════
-    # Output — merge TokiQR PDFs before back cover
-    # ═══════════════════════════════════════════════════════════════════
-    out_dir = os.path.join(repo_dir, "output")
-    os.makedirs(out_dir, exist_ok=True)
-    out_path = os.path.join(out_dir, f"{month_str}.pdf")
+        pdf.set_font("JP", "", 8)
+        pdf.set_text_color(*MUTED)
+        pdf.cell(0, 5, f"© {year} {publisher}. All rights reserved.", align="C",
+                 new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 5, PUBLISHER_URL, align="C", new_x="LMARGIN", new_y="NEXT")
 
-    # Collect TokiQR PDFs from client repo materials
-    tokiqr_pdfs = []
-    for m in materials:
-        p = os.path.join(repo_dir, m.get("tokiqrPdf", ""))
-        if os.path.exists(p):
-            tokiqr_pdfs.append(p)
+        pdf._footer_line(f"{pub_name_ja}　第{volume}巻 第{issue_num}号　裏表紙")
 
-    if tokiqr_pdfs:
-        from pypdf import PdfReader, PdfWriter
+    return pdf
 
-        tmp_path = out_path + ".tmp"
-        pdf.output(tmp_path)
-        print(f"  Base PDF: {tmp_path}")
 
-        newsletter = PdfReader(tmp_path)
-        writer = PdfWriter()
+def _init_worker(tracing=False):
+    """Pool initializer: parse the Japanese fonts once per worker process.
 
-        for i in range(len(newsletter.pages) - 1):
-            writer.add_page(newsletter.pages[i])
+    tracing turns on tokilib.trace in the worker; events a forked worker
+    inherited from the parent are dropped so only its own are sent back.
+    """
+    fonts.preload(FONT_PATH, FONT_BOLD_PATH)
+    if tracing:
+        trace.enable()
+        trace.take()
+
+
+def _rebuild_one(issue, incremental, linearize, reproducible):
+    """Render one schedule.json issue; returns (out_path, seconds, trace events)."""
+    month_str = _issue_month(issue)
+    year, month = (int(x) for x in month_str.split("-"))
+    manifest_path = os.path.join(OUT_DIR, "materials", month_str, "manifest.json")
+    start = time.perf_counter()
+    if os.path.exists(manifest_path):
+        out_path = generate_issue(year, month, issue["number"], issue["serial"],
+                                  incremental=incremental, linearize=linearize,
+                                  reproducible=reproducible)
+    elif issue["serial"] == 1:
+        out_path = generate_vol1(linearize=linearize, reproducible=reproducible)  # 創刊号 content lives in generate_vol1()
+    else:
+        raise FileNotFoundError(f"manifest not found: {manifest_path}")
+    return out_path, time.perf_counter() - start, trace.take()
 
-        for tp in tokiqr_pdfs:
-            reader = PdfReader(tp)
-            for page in reader.pages:
-                writer.add_page(page)
-            print(f"  TokiQR merged: {tp}")
 
-        writer.add_page(newsletter.pages[-1])
+def rebuild_all(schedule_path=SCHEDULE_PATH, workers=None, incremental=False, linearize=False,
+                reproducible=False):
+    """Regenerate every issue listed in schedule.json on a process pool.
 
-        with open(out_path, "wb") as f:
-            writer.write(f)
-        os.remove(tmp_path)
-    else:
-        pdf.output(out_path)
-        print("  (No TokiQR PDFs found — skipped merge)")
+    Used when a shared layout element (NewsletterPDF.section_heading etc.)
+    changes and the whole back catalog has to be re-rendered.
+    Returns the number of failed issues.
+    """
+    import json
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with open(schedule_path, encoding="utf-8") as f:
+        schedule = json.load(f)
+    issues = sorted(schedule.get("issues", []), key=lambda i: i["serial"])
+
+    for vol, info in schedule.get("volumes", {}).items():
+        count = sum(1 for i in issues if str(i.get("volume")) == vol)
+        if count > info.get("issues_max", count):
+            print(f"  WARNING: Vol.{vol} lists {count} issues (issues_max {info['issues_max']})")
+
+    fonts.preload(FONT_PATH, FONT_BOLD_PATH)  # inherited warm by forked workers
+    start = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(trace.enabled(),)) as pool:
+        futures = {pool.submit(_rebuild_one, issue, incremental, linearize, reproducible): issue for issue in issues}
+        for future in as_completed(futures):
+            issue = futures[future]
+            try:
+                out_path, seconds, events = future.result()
+                trace.merge(events)
+                results[issue["serial"]] = out_path, seconds
+            except Exception as e:
+                results[issue["serial"]] = e
+                print(f"  ERROR: {issue['date']}: {e!r}")
+    wall = time.perf_counter() - start
+
+    rows = [(issue["date"], f"#{issue['serial']}", f"{issue['volume']}/{issue['number']}",
+             results[issue["serial"]]) for issue in issues]
+    return _print_build_summary(rows, wall)
+
+
+def _print_build_summary(rows, wall):
+    """Print a timing/size table for pooled builds; returns the failure count.
+
+    rows are (name, serial, vol/no, (out_path, seconds) or Exception).
+    """
+    print()
+    print(f"  {'Issue':<24} {'Serial':>6} {'Vol/No':>7} {'Time':>8} {'Size':>10}")
+    total_kb = total_cpu = 0.0
+    failed = 0
+    for name, serial, vol_no, result in rows:
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"  {name:<24} {serial:>6} {vol_no:>7} {'FAILED':>8}")
+            continue
+        out_path, seconds = result
+        size_kb = os.path.getsize(out_path) / 1024
+        total_kb += size_kb
+        total_cpu += seconds
+        print(f"  {name:<24} {serial:>6} {vol_no:>7} {seconds:>7.2f}s {size_kb:>7.1f} KB")
+    print(f"  {len(rows) - failed} built, {failed} failed — {total_kb:.1f} KB total, "
+          f"{total_cpu:.2f}s render / {wall:.2f}s wall")
+    return failed
+
+
+def _due_issues(repo_dir, month_str):
+    """Unpublished schedule.json issues of a client repo that are due by month_str.
+
+    An issue is due when its status isn't "published", its YYYY-MM is not
+    after month_str, and materials/{YYYY-MM}/manifest.json exists.
+    """
+    import json
 
-    size_kb = os.path.getsize(out_path) / 1024
-    print(f"  -> {out_path} ({size_kb:.1f} KB)")
-    return out_path
+    schedule_path = os.path.join(repo_dir, "schedule.json")
+    with open(schedule_path, encoding="utf-8") as f:
+        schedule = json.load(f)
+    due = []
+    for issue in schedule.get("issues", []):
+        issue_month = _issue_month(issue)
+        if issue.get("status") == "published" or not issue_month or issue_month > month_str:
+            continue
+        if os.path.exists(os.path.join(repo_dir, "materials", issue_month, "manifest.json")):
+            due.append(issue)
+    return due
+
+
+def _fleet_one(config_path, issue, incremental, linearize, reproducible):
+    """Render one client issue in a pool worker; returns (out_path, seconds, trace events)."""
+    year, month = (int(x) for x in _issue_month(issue).split("-"))
+    start = time.perf_counter()
+    out_path = generate_client_issue(config_path, year, month, issue["number"], issue["serial"],
+                                     incremental=incremental, linearize=linearize,
+                                     reproducible=reproducible)
+    return out_path, time.perf_counter() - start, trace.take()
+
+
+def generate_fleet(fleet_dir, month_str=None, workers=None, incremental=False,
+                   linearize=False, reproducible=False):
+    """Render the due issues of every client repo under fleet_dir in one run.
+
+    Each immediate subdirectory holding a client-config.json and
+    schedule.json is a client repo.  All due issues are rendered
+    concurrently; fonts are parsed once up front and shared with the
+    workers, and a failing client is reported without stopping the others.
+    Returns the number of failed issues.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from datetime import date
+
+    month_str = month_str or date.today().strftime("%Y-%m")
+    jobs = []
+    for name in sorted(os.listdir(fleet_dir)):
+        repo_dir = os.path.join(fleet_dir, name)
+        config_path = os.path.join(repo_dir, "client-config.json")
+        if not (os.path.isfile(config_path)
+                and os.path.isfile(os.path.join(repo_dir, "schedule.json"))):
+            continue
+        try:
+            due = _due_issues(repo_dir, month_str)
+        except (OSError, ValueError) as e:
+            print(f"  ERROR: {name}: schedule.json: {e}")
+            jobs.append((name, config_path, {"date": "-", "serial": "-",
+                                             "volume": "-", "number": "-"}, e))
+            continue
+        for issue in due:
+            jobs.append((name, config_path, issue, None))
+
+    print(f"  {sum(1 for j in jobs if j[3] is None)} due issue(s) as of {month_str}")
+    fonts.preload(FONT_PATH, FONT_BOLD_PATH)  # inherited warm by forked workers
+    start = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(trace.enabled(),)) as pool:
+        futures = {}
+        for i, (name, config_path, issue, error) in enumerate(jobs):
+            if error is None:
+                futures[pool.submit(_fleet_one, config_path, issue, incremental, linearize,
+                                    reproducible)] = i
+            else:
+                results[i] = error
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                out_path, seconds, events = future.result()
+                trace.merge(events)
+                results[i] = out_path, seconds
+            except Exception as e:
+                results[i] = e
+                print(f"  ERROR: {jobs[i][0]} {jobs[i][2]['date']}: {e!r}")
+    wall = time.perf_counter() - start
+
+    rows = [(f"{name} {_issue_month(issue)}", f"#{issue['serial']}",
+             f"{issue['volume']}/{issue['number']}", results[i])
+            for i, (name, _, issue, _) in enumerate(jobs)]
+    return _print_build_summary(rows, wall)
 
 
 if __name__ == "__main__":
     print("Generating TokiStorage Newsletter...")
 
-    # Parse --client-config flag
+    # Parse --client-config / --fleet / --anthology / --incremental / --linearize /
+    # --reproducible / --publish / --trace / --rebuild-all / --workers flags
     client_config = None
     args = sys.argv[1:]
+    incremental = "--incremental" in args
+    if incremental:
+        args.remove("--incremental")
+    linearize = "--linearize" in args
+    if linearize:
+        args.remove("--linearize")
+        from tokilib.linearize import available
+        if not available():
+            print("  ERROR: --linearize needs pikepdf (pip install pikepdf) or the qpdf command")
+            sys.exit(1)
+    reproducible = requested(args)
+    trace.requested(args)
+    publish = "--publish" in args
+    if publish:
+        args.remove("--publish")
+    workers = None
+    if "--workers" in args:
+        idx = args.index("--workers")
+        workers = int(args[idx + 1])
+        args = args[:idx] + args[idx + 2:]
     if "--client-config" in args:
         idx = args.index("--client-config")
         client_config = args[idx + 1]
         args = args[:idx] + args[idx + 2:]
+    fleet_dir = None
+    if "--fleet" in args:
+        idx = args.index("--fleet")
+        fleet_dir = args[idx + 1]
+        args = args[:idx] + args[idx + 2:]
+
+    anthology = None
+    if "--anthology" in args:
+        idx = args.index("--anthology")
+        anthology = args[idx + 1]
+        args = args[:idx] + args[idx + 2:]
 
-    if client_config:
+    failed = 0  # the trace is still written when some pooled issues fail
+    if anthology:
+        failed = generate_anthology(anthology, linearize=linearize)
+    elif "--rebuild-all" in args:
+        failed = rebuild_all(workers=workers, incremental=incremental, linearize=linearize,
+                             reproducible=reproducible)
+    elif fleet_dir:
+        failed = generate_fleet(fleet_dir, args[0] if args else None, workers=workers,
+                                incremental=incremental, linearize=linearize,
+                                reproducible=reproducible)
+    elif client_config:
         if len(args) >= 4:
             year, month, issue_num, serial = int(args[0]), int(args[1]), int(args[2]), int(args[3])
         else:
-            print("Usage: generate-newsletter.py <year> <month> <issue_num> <serial> --client-config <path>")
+            print("Usage: generate-newsletter.py <year> <month> <issue_num> <serial> --client-config <path> [--incremental] [--linearize] [--reproducible]")
             sys.exit(1)
-        generate_client_issue(client_config, year, month, issue_num, serial)
+        generate_client_issue(client_config, year, month, issue_num, serial,
+                              incremental=incremental, linearize=linearize,
+                              reproducible=reproducible)
+    elif len(args) >= 4 and publish:
+        year, month, issue_num, serial = int(args[0]), int(args[1]), int(args[2]), int(args[3])
+        publish_issue(year, month, issue_num, serial, incremental=incremental,
+                      linearize=linearize)
     elif len(args) >= 4:
         year, month, issue_num, serial = int(args[0]), int(args[1]), int(args[2]), int(args[3])
-        generate_issue(year, month, issue_num, serial)
+        generate_issue(year, month, issue_num, serial, incremental=incremental,
+                       linearize=linearize, reproducible=reproducible)
     else:
-        generate_vol1()
+        generate_vol1(linearize=linearize, reproducible=reproducible)
+    trace.finish("generate-newsletter")
+    if failed:
+        sys.exit(1)
     print("Done.")
@@ -3,6 +3,13 @@
 
 from fpdf import FPDF
 import os
+import sys
+
+from tokilib import fonts
+from tokilib.chrome import ChromeMixin
+from tokilib.gstate import GStateMixin
+from tokilib.kinsoku import KinsokuMixin
+from tokilib.reproducible import ReproducibleMixin, requested, source_date
 
 OUT_DIR = os.path.dirname(os.path.abspath(__file__))
 ICON_PATH = os.path.join(OUT_DIR, "asset", "tokistorage-icon-circle.png")
@@ -26,31 +33,37 @@ BG_LIGHT = (248, 250, 252)
 WHITE = (255, 255, 255)
 
 
-class DocPDF(FPDF):
+class DocPDF(ReproducibleMixin, ChromeMixin, GStateMixin, KinsokuMixin, FPDF):
     """Base PDF class with Japanese font support."""
 
     def __init__(self):
         super().__init__()
-        self.add_font("JP", "", FONT_PATH, uni=True)
-        self.add_font("JP", "B", FONT_PATH, uni=True)
+        fonts.add_font(self, "JP", "", FONT_PATH)
+        fonts.add_font(self, "JP", "B", FONT_PATH)
         self.set_auto_page_break(auto=False)
 
     def footer(self):
         """Auto-called footer on every page — keeps everything on 1 page."""
+        self.stamp_chrome("footer_rule", self._draw_footer_rule)
         self.set_y(-18)
-        self.set_draw_color(*BORDER)
-        self.line(15, self.get_y(), 195, self.get_y())
         self.ln(2)
         self.set_font("JP", "", 6.5)
         self.set_text_color(*MUTED)
         self.cell(0, 3.5, "TokiStorage  |  Patronage Program", ln=True, align="C")
         self.cell(0, 3.5, "本書は見本です。実際の書類は内容確定後に発行いたします。", ln=True, align="C")
 
+    def _draw_footer_rule(self):
+        self.set_draw_color(*BORDER)
+        self.line(15, 279, 195, 279)
+
+    def _draw_accent_line(self):
+        self.set_fill_color(*EMERALD)
+        self.rect(0, 0, 210, 3, "F")
+
     def header_block(self, title, subtitle=None):
         """Company header + document title."""
         # Top accent line
-        self.set_fill_color(*EMERALD)
-        self.rect(0, 0, 210, 3, "F")
+        self.stamp_chrome("accent_line", self._draw_accent_line)
 
         self.set_y(10)
         # Icon + Company name
@@ -219,7 +232,7 @@ def generate_agreement():
 
     out = os.path.join(OUT_DIR, "patronage-template-agreement.pdf")
     pdf.output(out)
-    print(f"  -> {out}")
+    print(f"  -> {out} ({pdf.elided_ops} redundant state ops elided)")
 
 
 def generate_invoice():
@@ -333,7 +346,7 @@ def generate_invoice():
 
     out = os.path.join(OUT_DIR, "patronage-template-invoice.pdf")
     pdf.output(out)
-    print(f"  -> {out}")
+    print(f"  -> {out} ({pdf.elided_ops} redundant state ops elided)")
 
 
 def generate_receipt():
@@ -429,11 +442,13 @@ def generate_receipt():
 
     out = os.path.join(OUT_DIR, "patronage-template-receipt.pdf")
     pdf.output(out)
-    print(f"  -> {out}")
+    print(f"  -> {out} ({pdf.elided_ops} redundant state ops elided)")
 
 
 if __name__ == "__main__":
     print("Generating patronage document templates...")
+    if requested(sys.argv[1:]):
+        DocPDF.pin_all(source_date(__file__))
     generate_agreement()
     generate_invoice()
     generate_receipt()
@@ -7,17 +7,69 @@ Generates A4 portrait PDFs for NDL deposit:
 
 Usage:
   python3 build-tokiqr-newsletter.py <materials.json> <client-config.json> <output_dir> [zip_url]
+                                     [--linearize] [--vector-qr] [--trace]
+                                     [--workers N]
+  python3 build-tokiqr-newsletter.py --batch <jobs.json|jobs.ndjson|-> [--workers N]
+                                     [--linearize] [--vector-qr]
+
+--linearize writes a fast-web-view PDF (needs pikepdf or qpdf).
+--vector-qr draws the QR codes as vector paths (tokilib.qrdraw) instead of
+embedding PNGs: no temporary files, resolution-independent, smaller PDFs.
+--trace times QR rendering, image embedding and each page (see tokilib.trace).
+Encoded QR matrices are cached across runs in .cache/qr/ (tokilib.qrcache);
+URLs not in the cache are encoded on --workers processes (default: all cores).
+
+Very large specials can also give the materials as JSON Lines
+(.jsonl/.ndjson): the first line is the materials object without "urls",
+and every further line one URL, as a JSON string or {"url": ...}.  In
+either format the URLs are streamed from the file (tokilib.jsonstream for
+.json) and rendered STREAM_CHUNK_PAGES pages at a time into a streaming
+merge (tokilib.pdfmerge); every chunk starts with the previous chunk's font
+subset, so the output embeds the font once.  Peak memory does not grow
+with the number of URLs.
+
+QR pages hold one QR each unless the client config sets an N-up layout:
+  "tokiqr": {"layout": "2x2", "minModuleMm": 0.8}
+layout is "CxR" (columns x rows) or "auto", which gives each page the
+densest of 4x4, 3x3, 2x2 and 1x1 at which all of its QRs still print with
+modules of at least minModuleMm (default MIN_MODULE_MM): short URLs (low
+QR versions) share a page, long ones get more room.
+
+--batch builds many newsletters in one run, so the interpreter, fpdf and
+the parsed Japanese font are paid for once rather than per serial.  Jobs
+come from a JSON list or NDJSON (one object per line; "-" reads stdin):
+  {"materials": ..., "config": ..., "output_dir": ..., "zip_url": ...,
+   "linearize": bool, "vector_qr": bool}
+zip_url is optional; linearize and vector_qr default to the flags.  Jobs
+run on --workers processes (default: all cores; 1 builds them in this
+process), each encoding its QRs in-process.  One JSON result line per job
+is written to stdout as it finishes, in completion order:
+  {"job": 0, "materials": ..., "ok": true, "output": ..., "bytes": ...,
+   "qr_encoded": ..., "seconds": ...}
+  {"job": 1, "materials": ..., "ok": false, "error": "..."}
+Progress output goes to stderr; the exit status is 1 if any job failed.
 """
 
+import collections
+import contextlib
+import gc
+import io
+import itertools
 import json
 import os
 import sys
 import tempfile
+import time
 import urllib.parse
 from datetime import datetime
 
-from fpdf import FPDF
-import qrcode
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tokilib import fonts, jsonstream, qrcache, trace  # noqa: E402
+from tokilib.chrome import ChromeMixin  # noqa: E402
+from tokilib.gstate import GStateFPDF  # noqa: E402
+from tokilib.kinsoku import wrap_text  # noqa: E402
+from tokilib.qrdraw import draw_qr  # noqa: E402
+from tokilib.trace import TraceMixin  # noqa: E402
 
 # ── Font detection (macOS → Linux fallback) ───────────────────────────
 FONT_CANDIDATES = [
@@ -56,11 +108,139 @@ CONTENT_W = PAGE_W - MARGIN * 2
 
 QR_BASE_URL = "https://tokistorage.github.io/qr/"
 
+# fpdf keeps every page until output(); beyond this many QR pages the
+# document is rendered and merged in chunks of this size
+STREAM_CHUNK_PAGES = 500
+
+# ── N-up QR layouts ───────────────────────────────────────────────────
+QR_GRID_TOP = 28
+QR_GRID_BOTTOM = 238  # scan instruction below; Play/Recovery QRs from 248
+QR_CAPTION_H = 4
+QR_GUTTER = 4
+MIN_MODULE_MM = 0.8   # smallest module phone cameras read reliably off paper
+AUTO_LAYOUTS = [(4, 4), (3, 3), (2, 2), (1, 1)]
+
+
+class TokiQRPDF(TraceMixin, ChromeMixin, GStateFPDF):
+    """GStateFPDF with per-page tracing (--trace) and chrome forms (Play/Recovery QRs)."""
+
+
+def _parse_layout(value):
+    """(cols, rows) of a "CxR" layout ("2x2", "3×3"), or None for "auto"."""
+    value = str(value or "1x1").strip().lower().replace("×", "x")
+    if value == "auto":
+        return None
+    cols, _, rows = value.partition("x")
+    try:
+        cols, rows = int(cols), int(rows or cols)
+    except ValueError:
+        cols = rows = 0
+    if cols < 1 or rows < 1:
+        raise ValueError(f"bad tokiqr layout {value!r} (expected e.g. \"2x2\" or \"auto\")")
+    return cols, rows
+
+
+def _cell_qr_size(cols, rows):
+    """Side (mm) of each QR on a cols x rows page."""
+    if (cols, rows) == (1, 1):
+        return CONTENT_W
+    cell_w = CONTENT_W / cols
+    cell_h = (QR_GRID_BOTTOM - QR_GRID_TOP) / rows
+    return min(cell_w, cell_h - QR_CAPTION_H) - QR_GUTTER
+
+
+def _page_layout(layouts, pending, min_module):
+    """First (densest) of layouts at which the next QRs keep min_module mm modules.
+
+    pending holds (idx, url, matrix, png path) entries; matrices include
+    the quiet zone.  Falls back to the last layout.
+    """
+    for cols, rows in layouts:
+        size = _cell_qr_size(cols, rows)
+        group = itertools.islice(pending, cols * rows)
+        if all(size / len(entry[2]) >= min_module for entry in group):
+            return cols, rows
+    return layouts[-1]
+
+
+def _load_materials(materials_path):
+    """(materials, URL count, URL iterator) of a .json or JSON Lines materials file.
+
+    The URLs are counted in a first pass and then read lazily, so neither
+    format is ever held in memory whole (.json through tokilib.jsonstream).
+    """
+    if not materials_path.endswith((".jsonl", ".ndjson")):
+        mat, count = {}, 0
+        for kind, name, value in jsonstream.members(materials_path, "urls"):
+            if kind == "item":
+                count += 1
+            else:
+                mat[name] = value
+
+        def iter_urls():
+            for kind, _, url in jsonstream.members(materials_path, "urls"):
+                if kind == "item":
+                    yield url
+
+        return mat, count, iter_urls()
 
-def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
-    """Main entry: load materials + config, generate PDF."""
     with open(materials_path, encoding="utf-8") as f:
-        mat = json.load(f)
+        mat = json.loads(f.readline())
+        count = sum(1 for line in f if line.strip())
+
+    def iter_urls():
+        with open(materials_path, encoding="utf-8") as f:
+            f.readline()  # materials
+            for line in filter(str.strip, f):
+                url = json.loads(line)
+                yield url["url"] if isinstance(url, dict) else url
+
+    return mat, count, iter_urls()
+
+
+class _ChunkWriter:
+    """Streams finished chunk documents into one PDF (tokilib.pdfmerge)."""
+
+    def __init__(self, output_path):
+        from tokilib.pdfmerge import StreamingPdfWriter
+
+        self.file = open(output_path, "wb")
+        self.writer = StreamingPdfWriter(self.file)
+        self.elided_ops = 0
+
+    def add(self, pdf):
+        from pypdf import PdfReader
+
+        data = pdf.output()
+        self.elided_ops += pdf.elided_ops
+        with trace.span("merge chunk", "merge", pages=pdf.pages_count):
+            reader = PdfReader(io.BytesIO(data))
+            if not self.writer.page_count:
+                self.writer.set_info(reader.trailer.get("/Info"))
+            self.writer.add_pages(reader)
+            self.writer.release(reader)
+        del reader, data
+        gc.collect()  # pypdf readers are reference cycles
+
+    def close(self):
+        self.writer.close()
+        self.file.close()
+
+
+def build_newsletter(materials_path, config_path, output_dir, zip_url="", linearize=False,
+                     vector_qr=False, workers=None):
+    """Main entry: load materials + config, generate PDF.
+
+    vector_qr=True (--vector-qr) draws QR codes as vector paths.  Each page
+    QR is drawn inline (it appears once); the Play and Recovery QRs,
+    identical on every page, are stamped as chrome form XObjects and
+    written once per document.  The page QRs are encoded
+    ahead of the pages on up to workers processes and placed in order.
+    Beyond STREAM_CHUNK_PAGES pages the document is laid out a chunk at a
+    time and streamed into the output file.  The client config's "tokiqr"
+    section picks the N-up layout of the QR pages.
+    """
+    mat, url_count, urls = _load_materials(materials_path)
     with open(config_path, encoding="utf-8") as f:
         config = json.load(f)
 
@@ -75,13 +255,16 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
     number = mat["number"]
     series_name = mat.get("seriesName", "")
     title = mat.get("title", "")
-    urls = mat.get("urls", [])
     date_str = mat.get("date", datetime.now().strftime("%Y-%m-%d"))
 
     branding = config.get("branding", {})
     colophon = config.get("colophon", {})
     accent = tuple(branding.get("accentColor", list(TOKI_BLUE)))
     pub_name_ja = branding.get("publicationNameJa", f"{series_name} ニュースレター")
+    qr_options = config.get("tokiqr", {})
+    fixed_layout = _parse_layout(qr_options.get("layout"))
+    layouts = [fixed_layout] if fixed_layout else AUTO_LAYOUTS
+    min_module = float(qr_options.get("minModuleMm", MIN_MODULE_MM))
 
     serial_str = f"{serial:05d}"
     filename = f"TQ-{serial_str}.pdf"
@@ -109,10 +292,17 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
     play_qr_url = zip_url or pdf_url
 
     # ── Build PDF ──
-    pdf = FPDF(orientation="P", format="A4")
-    pdf.add_font("JP", "", font_path)
-    pdf.add_font("JP", "B", font_bold_path or font_path)
-    pdf.set_auto_page_break(auto=False)
+    def new_document():
+        doc = TokiQRPDF(orientation="P", format="A4")
+        fonts.add_font(doc, "JP", "", font_path)
+        fonts.add_font(doc, "JP", "B", font_bold_path or font_path)
+        doc.set_auto_page_break(auto=False)
+        return doc
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, filename)
+    chunks = None
+    pdf = new_document()
 
     # ── Cover page ──
     pdf.add_page()
@@ -201,7 +391,7 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
         pdf.set_font("JP", "", 6.5)
         pdf.set_text_color(*MUTED)
         pdf.set_x(MARGIN + 10)
-        pdf.multi_cell(CONTENT_W - 20, 4, note)
+        pdf.multi_cell(CONTENT_W - 20, 4, wrap_text(pdf, CONTENT_W - 20, note))
 
     # Footer
     pdf.set_y(-29)
@@ -221,11 +411,18 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
     pdf.set_text_color(*MUTED)
     pdf.cell(0, 3.5, f"© TokiStorage — tokistorage.github.io/lp/", align="C")
 
+    def stamp_qr(name, matrix, color, x, y, size):
+        def draw():
+            pdf.set_fill_color(*color)
+            draw_qr(pdf, matrix, 0, 0, size)
+        pdf.stamp_chrome(name, draw, x, y)
+
     # ── QR pages ──
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    # Play/Recovery QRs are PNG paths, or module matrices with vector_qr
+    with contextlib.nullcontext() if vector_qr else tempfile.TemporaryDirectory() as tmp_dir:
         # Generate Play QR (blue) and Recovery QR (gray) if pagesUrl is available
-        play_qr_path = None
-        recovery_qr_path = None
+        play_qr = None
+        recovery_qr = None
         if play_qr_url:
             if zip_url:
                 play_url = (
@@ -237,43 +434,71 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
                     "https://tokistorage.github.io/qr/archive.html?pdf="
                     + urllib.parse.quote(play_qr_url, safe="")
                 )
-            # Play QR — blue
-            pqr = qrcode.QRCode(
-                error_correction=qrcode.constants.ERROR_CORRECT_M,
-                box_size=8, border=1,
-            )
-            pqr.add_data(play_url)
-            pqr.make(fit=True)
-            pqr_img = pqr.make_image(fill_color=TOKI_BLUE, back_color="white")
-            play_qr_path = os.path.join(tmp_dir, "play_qr.png")
-            pqr_img.save(play_qr_path)
-
-            # Recovery QR — gray
-            rqr = qrcode.QRCode(
-                error_correction=qrcode.constants.ERROR_CORRECT_M,
-                box_size=8, border=1,
-            )
-            rqr.add_data(pdf_url)
-            rqr.make(fit=True)
-            rqr_img = rqr.make_image(fill_color=SLATE, back_color="white")
-            recovery_qr_path = os.path.join(tmp_dir, "recovery_qr.png")
-            rqr_img.save(recovery_qr_path)
-
-        for idx, url in enumerate(urls):
-            full_url = url if url.startswith("http") else QR_BASE_URL + url
-
-            # Generate QR image
-            qr = qrcode.QRCode(
-                version=None,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=2,
-            )
-            qr.add_data(full_url)
-            qr.make(fit=True)
-            img = qr.make_image(fill_color="black", back_color="white")
-            qr_path = os.path.join(tmp_dir, f"qr_{idx}.png")
-            img.save(qr_path)
+            with trace.span("play/recovery QR", "qr"):
+                # Play QR — blue
+                play_qr = qrcache.matrix(play_url, "M", border=1)
+                if not vector_qr:
+                    pqr_img = qrcache.image(play_qr, 8, fill_color=TOKI_BLUE)
+                    play_qr = os.path.join(tmp_dir, "play_qr.png")
+                    pqr_img.save(play_qr)
+
+                # Recovery QR — gray
+                recovery_qr = qrcache.matrix(pdf_url, "M", border=1)
+                if not vector_qr:
+                    rqr_img = qrcache.image(recovery_qr, 8, fill_color=SLATE)
+                    recovery_qr = os.path.join(tmp_dir, "recovery_qr.png")
+                    rqr_img.save(recovery_qr)
+
+        full_urls, qr_urls = itertools.tee(
+            url if url.startswith("http") else QR_BASE_URL + url for url in urls)
+        qr_matrices = qrcache.matrices(qr_urls, "L", border=2, workers=workers)
+        entries = enumerate(full_urls)
+        pending = collections.deque()  # (idx, url, matrix, png path), a page ahead
+        lookahead = max(cols * rows for cols, rows in layouts)
+        page_layouts = collections.Counter()
+        small_modules = 0
+
+        def fill():
+            for idx, full_url in itertools.islice(entries, lookahead - len(pending)):
+                # Generate QR image
+                with trace.span(f"QR {idx + 1}", "qr") as info:
+                    qr_matrix = next(qr_matrices)
+                    qr_path = None
+                    if not vector_qr:
+                        img = qrcache.image(qr_matrix, 10)
+                        qr_path = os.path.join(tmp_dir, f"qr_{idx}.png")
+                        img.save(qr_path)
+                    info["version"] = (len(qr_matrix) - 4 - 17) // 4
+                pending.append((idx, full_url, qr_matrix, qr_path))
+
+        def place_qr(idx, full_url, qr_matrix, qr_path, x, y, size):
+            if vector_qr:
+                with trace.span(f"QR {idx + 1}", "vector"):
+                    pdf.set_fill_color(0, 0, 0)
+                    draw_qr(pdf, qr_matrix, x, y, size)
+            else:
+                with trace.span(f"QR {idx + 1}", "image"):
+                    pdf.image(qr_path, x=x, y=y, w=size, h=size)
+                os.remove(qr_path)  # read by image(); keeps tmp_dir flat
+            pdf.link(x, y, size, size, full_url)
+
+        fill()
+        while pending:
+            cols, rows = _page_layout(layouts, pending, min_module)
+            group = [pending.popleft() for _ in range(min(cols * rows, len(pending)))]
+            fill()
+            page_layouts[f"{cols}x{rows}"] += 1
+            qr_size = _cell_qr_size(cols, rows)
+            small_modules += sum(1 for entry in group if qr_size / len(entry[2]) < min_module)
+            first, last = group[0][0] + 1, group[-1][0] + 1
+            numbers = f"{first}" if first == last else f"{first}–{last}"
+
+            if pdf.pages_count > STREAM_CHUNK_PAGES:
+                chunks = chunks or _ChunkWriter(output_path)
+                chunks.add(pdf)
+                prev, pdf = pdf, new_document()
+                fonts.seed_subsets(pdf, prev)  # one shared font subset in the output
+                del prev
 
             # Add page
             pdf.add_page()
@@ -284,25 +509,39 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
             pdf.set_y(15)
             pdf.set_font("JP", "B", 10)
             pdf.set_text_color(*DARK)
-            pdf.cell(0, 8, f"QR {idx + 1} / {len(urls)}", align="C",
+            pdf.cell(0, 8, f"QR {numbers} / {url_count}", align="C",
                      new_x="LMARGIN", new_y="NEXT")
 
-            # QR image full-width — clickable link
-            qr_size = CONTENT_W
-            qr_x = MARGIN
-            qr_y = 30
-            pdf.image(qr_path, x=qr_x, y=qr_y, w=qr_size, h=qr_size)
-            pdf.link(qr_x, qr_y, qr_size, qr_size, full_url)
+            if (cols, rows) == (1, 1):
+                # QR image full-width — clickable link
+                qr_x = MARGIN
+                qr_y = 30
+                place_qr(*group[0], qr_x, qr_y, qr_size)
+                instruction_y = qr_y + qr_size + 4
+            else:
+                # QR grid, each numbered below — clickable links
+                cell_w = CONTENT_W / cols
+                cell_h = (QR_GRID_BOTTOM - QR_GRID_TOP) / rows
+                for k, (idx, full_url, qr_matrix, qr_path) in enumerate(group):
+                    cell_x = MARGIN + (k % cols) * cell_w
+                    qr_x = cell_x + (cell_w - qr_size) / 2
+                    qr_y = QR_GRID_TOP + (k // cols) * cell_h + (cell_h - QR_CAPTION_H - qr_size) / 2
+                    place_qr(idx, full_url, qr_matrix, qr_path, qr_x, qr_y, qr_size)
+                    pdf.set_font("JP", "", 6.5)
+                    pdf.set_text_color(*MUTED)
+                    pdf.set_xy(cell_x, qr_y + qr_size + 0.5)
+                    pdf.cell(cell_w, 3, f"QR {idx + 1}", align="C", link=full_url)
+                instruction_y = QR_GRID_BOTTOM + 1
 
             # Scan instruction below QR
-            pdf.set_y(qr_y + qr_size + 4)
+            pdf.set_y(instruction_y)
             pdf.set_font("JP", "", 9)
             pdf.set_text_color(*SECONDARY)
             pdf.cell(0, 6, "スマートフォンでスキャンすると再生できます",
                      align="C", new_x="LMARGIN", new_y="NEXT")
 
             # Play QR — bottom-left (blue) — clickable link
-            if play_qr_path:
+            if play_qr:
                 sq = 18
                 if zip_url:
                     play_link = (
@@ -314,7 +553,11 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
                         "https://tokistorage.github.io/qr/archive.html?pdf="
                         + urllib.parse.quote(play_qr_url, safe="")
                     )
-                pdf.image(play_qr_path, x=MARGIN, y=248, w=sq, h=sq)
+                if vector_qr:
+                    stamp_qr("play_qr", play_qr, TOKI_BLUE, MARGIN, 248, sq)
+                else:
+                    with trace.span("play QR", "image"):
+                        pdf.image(play_qr, x=MARGIN, y=248, w=sq, h=sq)
                 pdf.link(MARGIN, 248, sq, sq, play_link)
                 pdf.set_font("JP", "", 4)
                 pdf.set_text_color(*TOKI_BLUE)
@@ -322,10 +565,14 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
                 pdf.cell(sq, 3, "Scan to play", align="C", link=play_link)
 
             # Recovery QR — bottom-right (gray) — clickable link
-            if recovery_qr_path:
+            if recovery_qr:
                 sq = 18
                 rx = PAGE_W - MARGIN - sq
-                pdf.image(recovery_qr_path, x=rx, y=248, w=sq, h=sq)
+                if vector_qr:
+                    stamp_qr("recovery_qr", recovery_qr, SLATE, rx, 248, sq)
+                else:
+                    with trace.span("recovery QR", "image"):
+                        pdf.image(recovery_qr, x=rx, y=248, w=sq, h=sq)
                 pdf.link(rx, 248, sq, sq, pdf_url)
                 pdf.set_font("JP", "", 4)
                 pdf.set_text_color(*MUTED)
@@ -340,20 +587,180 @@ def build_newsletter(materials_path, config_path, output_dir, zip_url=""):
             pdf.set_font("JP", "", 6.5)
             pdf.set_text_color(*MUTED)
             pdf.cell(0, 3.5,
-                     f"{pub_name_ja}　TQ-{serial_str}　{idx + 1}/{len(urls)}",
+                     f"{pub_name_ja}　TQ-{serial_str}　{numbers}/{url_count}",
                      align="C")
 
+    if fixed_layout != (1, 1):
+        print(f"  QR layout {qr_options.get('layout')}: {url_count} QRs on "
+              f"{sum(page_layouts.values())} pages ("
+              + ", ".join(f"{name}: {n}" for name, n in sorted(page_layouts.items())) + ")")
+    if small_modules:
+        print(f"  WARNING: {small_modules} QR(s) print with modules under {min_module} mm")
+
     # ── Output ──
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, filename)
-    pdf.output(output_path)
-    print(f"Generated: {output_path}")
+    if chunks:
+        chunks.add(pdf)
+        chunks.close()
+        elided_ops = chunks.elided_ops
+    else:
+        pdf.output(output_path)
+        elided_ops = pdf.elided_ops
+    if linearize:
+        _linearize(output_path)
+    print(f"Generated: {output_path} ({elided_ops} redundant state ops elided, "
+          f"QR cache: {qrcache.stats['hits']} hits, {qrcache.stats['misses']} encoded)")
     return output_path
 
 
+def _linearize(output_path):
+    from tokilib import linearize
+
+    with trace.span("linearize", "linearize"):
+        linearize.linearize(output_path)
+        problems = linearize.check(output_path)
+    if problems:
+        raise RuntimeError(f"linearization check failed for {output_path}: {'; '.join(problems)}")
+
+
+# ── Batch mode (--batch) ──────────────────────────────────────────────
+def _read_jobs(source):
+    """Jobs from a JSON list or NDJSON file ("-": stdin), yielded one at a time.
+
+    A line that isn't a JSON object is yielded as a ValueError so the
+    remaining jobs still run.
+    """
+    f = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        first = next((line for line in f if line.strip()), "")
+        if first.lstrip().startswith("["):
+            lines = enumerate(json.loads(first + f.read()))
+        else:
+            lines = enumerate(line for line in itertools.chain([first], f) if line.strip())
+        for i, job in lines:
+            if isinstance(job, str):
+                try:
+                    job = json.loads(job)
+                except ValueError as e:
+                    yield ValueError(f"job {i}: {e}")
+                    continue
+            if not isinstance(job, dict) or not all(k in job for k in ("materials", "config", "output_dir")):
+                yield ValueError(f"job {i}: expected an object with materials, config and output_dir")
+                continue
+            yield job
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _batch_one(job, linearize, vector_qr):
+    """Build one batch job; progress goes to stderr.  Returns its result fields."""
+    start = time.perf_counter()
+    misses = qrcache.stats["misses"]
+    with contextlib.redirect_stdout(sys.stderr):
+        output_path = build_newsletter(job["materials"], job["config"], job["output_dir"],
+                                       job.get("zip_url") or "",
+                                       linearize=job.get("linearize", linearize),
+                                       vector_qr=job.get("vector_qr", vector_qr), workers=1)
+    return {"output": output_path, "bytes": os.path.getsize(output_path),
+            "qr_encoded": qrcache.stats["misses"] - misses,
+            "seconds": round(time.perf_counter() - start, 3)}
+
+
+def run_batch(source, workers=None, linearize=False, vector_qr=False):
+    """Build every job from source, printing a JSON result line per job.
+
+    Fonts are parsed once up front (inherited by forked workers), and at
+    most 2 * workers jobs are queued, so an NDJSON stream of any length
+    can be piped in.  Returns the number of failed jobs.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    font_path = find_font(FONT_CANDIDATES)
+    if not font_path:
+        print("ERROR: No Japanese font found. Install fonts-ipafont-gothic.", file=sys.stderr)
+        sys.exit(1)
+    fonts.preload(font_path, find_font(FONT_BOLD_CANDIDATES))
+    workers = workers or os.cpu_count() or 1
+    counts = {"built": 0, "failed": 0}
+    start = time.perf_counter()
+
+    def emit(i, job, result):
+        line = {"job": i, "materials": job.get("materials") if isinstance(job, dict) else None}
+        if isinstance(result, Exception):
+            counts["failed"] += 1
+            line.update(ok=False, error=str(result) or repr(result))
+        else:
+            counts["built"] += 1
+            line.update(ok=True, **result)
+        print(json.dumps(line, ensure_ascii=False), flush=True)
+
+    def run(job):
+        try:
+            return _batch_one(job, linearize, vector_qr)
+        except Exception as e:
+            return e
+
+    def collect(future):
+        try:
+            return future.result()
+        except Exception as e:
+            return e
+
+    if workers == 1:
+        for i, job in enumerate(_read_jobs(source)):
+            emit(i, job, job if isinstance(job, Exception) else run(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = {}
+            for i, job in enumerate(_read_jobs(source)):
+                if isinstance(job, Exception):
+                    emit(i, job, job)
+                    continue
+                pending[pool.submit(_batch_one, job, linearize, vector_qr)] = (i, job)
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        emit(*pending.pop(future), collect(future))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    emit(*pending.pop(future), collect(future))
+        qrcache.evict()  # pool workers exit without running atexit
+    print(f"  {counts['built']} built, {counts['failed']} failed — "
+          f"{time.perf_counter() - start:.2f}s wall", file=sys.stderr)
+    return counts["failed"]
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 4:
-        print("Usage: build-tokiqr-newsletter.py <materials.json> <config.json> <output_dir> [zip_url]")
+    argv = sys.argv[1:]
+    linearize_arg = "--linearize" in argv
+    if linearize_arg:
+        argv.remove("--linearize")
+        from tokilib.linearize import available
+        if not available():
+            print("ERROR: --linearize needs pikepdf (pip install pikepdf) or the qpdf command.",
+                  file=sys.stderr)
+            sys.exit(1)
+    vector_qr_arg = "--vector-qr" in argv
+    if vector_qr_arg:
+        argv.remove("--vector-qr")
+    workers_arg = None
+    if "--workers" in argv:
+        idx = argv.index("--workers")
+        workers_arg = int(argv[idx + 1])
+        argv = argv[:idx] + argv[idx + 2:]
+    trace.requested(argv)
+    if "--batch" in argv:
+        idx = argv.index("--batch")
+        failed = run_batch(argv[idx + 1], workers_arg, linearize=linearize_arg,
+                           vector_qr=vector_qr_arg)
+        trace.finish("build-tokiqr-batch")
+        sys.exit(1 if failed else 0)
+    if len(argv) < 3:
+        print("Usage: build-tokiqr-newsletter.py <materials.json> <config.json> <output_dir> [zip_url] [--linearize] [--vector-qr] [--trace] [--workers N]")
+        print("       build-tokiqr-newsletter.py --batch <jobs.json|jobs.ndjson|-> [--workers N] [--linearize] [--vector-qr]")
         sys.exit(1)
-    zip_url_arg = sys.argv[4] if len(sys.argv) > 4 else ""
-    build_newsletter(sys.argv[1], sys.argv[2], sys.argv[3], zip_url_arg)
+    zip_url_arg = argv[3] if len(argv) > 3 else ""
+    build_newsletter(argv[0], argv[1], argv[2], zip_url_arg, linearize=linearize_arg,
+                     vector_qr=vector_qr_arg, workers=workers_arg)
+    trace.finish("build-tokiqr-newsletter")
@@ -0,0 +1,39 @@
+"""Tests for tokilib.fonts."""
+
+import io
+import os
+
+import pytest
+
+from tokilib.fonts import add_font, seed_subsets
+from tokilib.gstate import GStateFPDF
+
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def _doc(text, prev=None):
+    pdf = GStateFPDF()
+    add_font(pdf, "Sans", "", FONT)
+    add_font(pdf, "Sans", "B", FONT)
+    if prev is not None:
+        seed_subsets(pdf, prev)
+    pdf.add_page()
+    pdf.set_font("Sans", "B", 10)
+    pdf.cell(0, 10, text)
+    return pdf
+
+
+def _font_files(pdf):
+    pypdf = pytest.importorskip("pypdf")
+    reader = pypdf.PdfReader(io.BytesIO(pdf.output()))
+    fonts = reader.pages[0]["/Resources"]["/Font"].values()
+    return [f.get_object()["/DescendantFonts"][0].get_object()["/FontDescriptor"]
+            ["/FontFile2"].get_object().get_data() for f in fonts]
+
+
+@pytest.mark.skipif(not os.path.exists(FONT), reason="no TrueType font")
+def test_seeded_chunk_embeds_the_same_subset():
+    first = _doc("QR 1–500 / 1300 chunk")
+    seeded = _doc("QR 501", prev=first)
+    assert _font_files(seeded) == _font_files(first)
+    assert _font_files(_doc("QR 501")) != _font_files(first)
@@ -0,0 +1,247 @@
+"""Tests for tokilib.gstate: tokenizer, write-time state elision and bold emulation.
+
+Elision must never change what a page draws.  draws() replays a content
+stream with a q/Q state stack and lists every non-state operation with the
+graphics state in effect when it runs; a GStateFPDF page has to produce the
+same list as the plain FPDF page built by the same calls.
+"""
+
+import os
+import random
+
+import pytest
+from fpdf import FPDF
+
+from tokilib.chrome import ChromeMixin
+from tokilib.fonts import add_font
+from tokilib.gstate import GStateFPDF, _operations, embolden
+
+_STATE_KINDS = {
+    b"rg": "fill", b"g": "fill", b"k": "fill",
+    b"RG": "stroke", b"G": "stroke", b"K": "stroke",
+    b"w": "w", b"J": "J", b"j": "j", b"M": "M", b"d": "d",
+    b"Tf": "Tf", b"Tc": "Tc", b"Tw": "Tw", b"Tz": "Tz", b"TL": "TL",
+    b"Ts": "Ts", b"Tr": "Tr",
+}
+
+
+def draws(data):
+    """[(operator, operands, state)] for every operation that uses the state."""
+    state, stack, out = {}, [], []
+    for _, op, operands in _operations(bytes(data)):
+        if op in _STATE_KINDS:
+            state[_STATE_KINDS[op]] = (op, operands)
+        elif op == b"q":
+            stack.append(dict(state))
+        elif op == b"Q":
+            state = stack.pop()
+        elif op not in (b"BT", b"ET"):
+            out.append((op, operands, sorted(state.items())))
+    return out
+
+
+# ── Tokenizer ────────────────────────────────────────────────────────
+
+def test_operators_inside_strings_are_operands():
+    ops = _operations(b"BT (1 0 0 rg) Tj (a \\) 0 g) Tj (x (0 G) y) Tj <30> Tj ET")
+    assert [op for _, op, _ in ops] == [b"BT", b"Tj", b"Tj", b"Tj", b"Tj", b"ET"]
+    assert ops[2][2] == (b"(a \\) 0 g)",)
+    assert ops[3][2] == (b"(x (0 G) y)",)
+
+
+def test_arrays_names_and_comments():
+    ops = _operations(b"/F1 9 Tf % 1 0 0 rg\n[(a) -120 (b)] TJ [3 2] 0 d")
+    assert [op for _, op, _ in ops] == [b"Tf", b"TJ", b"d"]
+    assert ops[1][2] == (b"[", b"(a)", b"-120", b"(b)", b"]")
+
+
+def test_inline_image_is_left_alone():
+    data = b"/F2 9 Tf 1 0 0 rg BI /W 1 /H 1 /BPC 8 /CS /G ID \x00rg EI BT (x) Tj ET"
+    assert embolden(data, {b"/F2": b"/F1"}) == data
+
+
+# ── Elision ──────────────────────────────────────────────────────────
+
+def page_ops(pdf, page=1):
+    return [op for _, op, _ in _operations(bytes(pdf.pages[page].contents))]
+
+
+def test_dead_store_is_not_written():
+    pdf = GStateFPDF()
+    pdf.add_page()
+    pdf.set_draw_color(255, 0, 0)  # overwritten before use
+    pdf.set_draw_color(0, 0, 200)
+    pdf.rect(10, 10, 20, 20)
+    assert b"1.000 0.000 0.000 RG" not in bytes(pdf.pages[1].contents)
+    assert page_ops(pdf).count(b"RG") == 1
+    assert pdf.elided_ops == 1
+
+
+def test_value_set_back_before_use_is_skipped():
+    pdf = GStateFPDF()
+    pdf.add_page()
+    pdf.set_fill_color(200, 0, 0)
+    pdf.rect(10, 10, 20, 20, style="F")
+    pdf.set_fill_color(0, 0, 200)
+    pdf.set_fill_color(200, 0, 0)
+    pdf.rect(40, 10, 20, 20, style="F")
+    assert page_ops(pdf).count(b"rg") == 1
+    assert pdf.elided_ops == 2
+
+
+def test_state_discarded_by_Q_is_not_written():
+    pdf = GStateFPDF()
+    pdf.add_page()
+    with pdf.local_context():
+        pdf.set_line_width(2)
+        pdf.set_fill_color(0, 200, 0)
+    pdf.rect(10, 10, 20, 20)
+    assert b"q" in page_ops(pdf) and b"w" not in page_ops(pdf)[2:]
+
+
+def test_value_restored_by_Q_is_known():
+    pdf = GStateFPDF()
+    pdf.add_page()
+    pdf.set_fill_color(200, 0, 0)
+    pdf.rect(10, 10, 20, 20, style="F")
+    with pdf.local_context():
+        pdf.set_fill_color(0, 0, 200)
+        pdf.rect(40, 10, 20, 20, style="F")
+        pdf.set_fill_color(200, 0, 0)
+        pdf.rect(70, 10, 20, 20, style="F")
+    assert page_ops(pdf).count(b"rg") == 3
+    pdf.set_fill_color(0, 200, 0)  # a set back to the red Q restored is skipped
+    pdf.set_fill_color(200, 0, 0)
+    pdf.rect(10, 40, 20, 20, style="F")
+    assert page_ops(pdf).count(b"rg") == 3
+
+
+def test_held_state_lands_on_the_page_not_in_chrome():
+    class ChromeFPDF(ChromeMixin, GStateFPDF):
+        pass
+
+    pdf = ChromeFPDF()
+    pdf.add_page()
+    pdf.set_fill_color(200, 0, 0)
+
+    def draw():
+        pdf.set_fill_color(0, 0, 200)
+        pdf.rect(0, 0, 5, 5, style="F")
+
+    pdf.stamp_chrome("box", draw)
+    pdf.rect(10, 10, 20, 20, style="F")
+    fills = [dict(state)["fill"] for op, _, state in draws(pdf.pages[1].contents) if op == b"re"]
+    assert fills == [(b"rg", (b"0.7843", b"0", b"0"))]
+
+
+def random_calls(pdf, rng):
+    """Build three pages of random state changes and drawing."""
+    colours = [(0, 0, 0), (200, 30, 30), (0, 0, 200), (240, 240, 240)]
+    pdf.set_font("helvetica", size=9)
+    contexts = []
+    for _ in range(3):
+        pdf.add_page()
+        for _ in range(rng.randint(5, 60)):
+            roll = rng.random()
+            if roll < 0.1:
+                context = rng.choice([pdf.local_context(), pdf.rotation(rng.choice([0, 15]), 50, 50),
+                                      pdf.rect_clip(0, 0, 150, 200),
+                                      pdf.local_context(fill_color=rng.choice(colours))])
+                context.__enter__()
+                contexts.append(context)
+            elif roll < 0.2 and contexts:
+                contexts.pop().__exit__(None, None, None)
+            elif roll < 0.3:
+                pdf.set_draw_color(*rng.choice(colours))
+            elif roll < 0.4:
+                pdf.set_fill_color(*rng.choice(colours))
+            elif roll < 0.45:
+                pdf.set_text_color(*rng.choice(colours))
+            elif roll < 0.55:
+                pdf.set_line_width(rng.choice([0.2, 0.5, 1]))
+            elif roll < 0.6:
+                pdf.set_font("helvetica", rng.choice(["", "B"]), rng.choice([8, 9, 12]))
+            elif roll < 0.75:
+                pdf.cell(40, 6, rng.choice(["", "cell", "Q q (g)"]), border=rng.randint(0, 1),
+                         fill=rng.random() < 0.5, new_x="LMARGIN", new_y="NEXT")
+            elif roll < 0.85:
+                pdf.rect(rng.randint(0, 150), rng.randint(0, 250), 10, 10,
+                         style=rng.choice(["D", "F", "DF"]))
+            elif roll < 0.9:
+                pdf.text(rng.randint(10, 150), rng.randint(10, 250), "text")
+            else:
+                pdf.line(0, 0, rng.randint(0, 200), rng.randint(0, 280))
+        while contexts:
+            contexts.pop().__exit__(None, None, None)
+
+
+def test_random_calls_draw_the_same():
+    for seed in range(200):
+        pdfs = [FPDF(), GStateFPDF()]
+        for pdf in pdfs:
+            random_calls(pdf, random.Random(seed))
+        for page in (1, 2, 3):
+            plain, eliding = (draws(pdf.pages[page].contents) for pdf in pdfs)
+            assert eliding == plain, f"seed {seed}, page {page}"
+
+
+# ── Bold emulation ───────────────────────────────────────────────────
+
+_DEFAULTS = {"w": (b"w", (b"1",)), "stroke": (b"G", (b"0",)), "Tr": (b"Tr", (b"0",))}
+
+
+def state_at(data, operator):
+    """Stroke-related state in effect at each use of operator."""
+    return [{kind: dict(state).get(kind, _DEFAULTS[kind]) for kind in _DEFAULTS}
+            for op, _, state in draws(data) if op == operator]
+
+
+def test_bold_text_then_stroked_rect():
+    data = (b"1.5 w 1 0 0 RG 0 0 1 rg BT /F2 10 Tf 5 5 Td (bold) Tj ET "
+            b"0 0 5 5 re S")
+    out = embolden(data, {b"/F2": b"/F1"})
+    assert b"/F2" not in out
+    assert state_at(out, b"Tj") == [{"w": (b"w", (b"0.25",)),
+                                     "stroke": (b"RG", (b"0", b"0", b"1")),
+                                     "Tr": (b"Tr", (b"2",))}]
+    assert state_at(out, b"re") == state_at(data, b"re") == [
+        {"w": (b"w", (b"1.5",)), "stroke": (b"RG", (b"1", b"0", b"0")),
+         "Tr": (b"Tr", (b"0",))}]
+
+
+def test_bold_text_then_rect_in_default_state():
+    data = b"BT /F2 10 Tf (bold) Tj ET 0 0 5 5 re S"
+    out = embolden(data, {b"/F2": b"/F1"})
+    assert state_at(out, b"re") == [_DEFAULTS]
+
+
+def test_run_of_bold_text_sets_emulation_once():
+    data = (b"BT /F2 10 Tf (a) Tj ET BT /F2 10 Tf (b) Tj ET 0 0 1 rg BT /F2 10 Tf (c) Tj ET "
+            b"BT /F1 10 Tf (d) Tj ET 0 0 5 5 re S")
+    out = embolden(data, {b"/F2": b"/F1"})
+    assert out.count(b"Tr") == 2 and out.count(b" w") == 2
+    assert [s["Tr"] for s in state_at(out, b"Tj")] == [(b"Tr", (b"2",))] * 3 + [_DEFAULTS["Tr"]]
+    assert state_at(out, b"re") == [_DEFAULTS]
+
+
+def test_fpdf_bold_alias_keeps_rect_stroke():
+    pymupdf = pytest.importorskip("pymupdf")
+    font = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+    if not os.path.exists(font):
+        pytest.skip("no TrueType font")
+    pdf = GStateFPDF()
+    add_font(pdf, "Sans", "", font)
+    add_font(pdf, "Sans", "B", font)
+    assert pdf.font_aliases["sansB"] == "sans"
+    pdf.add_page()
+    pdf.set_line_width(0.8)
+    pdf.set_draw_color(200, 0, 0)
+    pdf.set_font("Sans", "B", 12)
+    pdf.text(20, 20, "bold")
+    pdf.cell(40, 8, "bold cell")
+    pdf.rect(20, 40, 50, 20)
+    contents = pymupdf.open(stream=bytes(pdf.output())).load_page(0).read_contents()
+    texts = state_at(contents, b"Tj")
+    assert texts and all(t["Tr"] == (b"Tr", (b"2",)) for t in texts)
+    assert state_at(contents, b"re")[-1]["w"] == (b"w", (b"2.27",))
+    assert state_at(contents, b"re")[-1]["stroke"] == (b"RG", (b"0.7843", b"0", b"0"))
@@ -0,0 +1,51 @@
+"""Tests for tokilib.jsonstream."""
+
+import json
+import random
+
+import pytest
+
+from tokilib import jsonstream
+
+
+def _read(path):
+    mat, urls = {}, []
+    for kind, name, value in jsonstream.members(path, "urls"):
+        if kind == "item":
+            urls.append(value)
+        else:
+            mat[name] = value
+    return mat, urls
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 7, 1 << 16])
+def test_members_match_json_load(tmp_path, monkeypatch, block_size):
+    monkeypatch.setattr(jsonstream, "BLOCK_SIZE", block_size)
+    rng = random.Random(block_size)
+    doc = {
+        "serial": 12345, "volume": 1, "ratio": -0.25e-3, "draft": False, "note": None,
+        "title": "特集 \"声\" \\ {[,]}",
+        "urls": [f"#d={rng.getrandbits(64):x}" for _ in range(50)] + [1234567, {"url": "x"}],
+        "colophon": {"urls": ["nested", "not streamed"]},
+    }
+    path = tmp_path / "materials.json"
+    path.write_text(json.dumps(doc, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    mat, urls = _read(str(path))
+    assert urls == doc.pop("urls")
+    assert mat == doc
+
+
+def test_empty_and_missing_array(tmp_path):
+    path = tmp_path / "materials.json"
+    path.write_text('{"urls": [], "serial": 1}', encoding="utf-8")
+    assert _read(str(path)) == ({"serial": 1}, [])
+    path.write_text(" { } ", encoding="utf-8")
+    assert _read(str(path)) == ({}, [])
+
+
+def test_truncated_file_is_an_error(tmp_path):
+    path = tmp_path / "materials.json"
+    path.write_text('{"serial": 1, "urls": ["a", "b"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        _read(str(path))
@@ -0,0 +1,52 @@
+"""Tests for tokilib.measure."""
+
+import os
+
+import pytest
+from fpdf import FPDF
+
+from tokilib.fonts import add_font
+from tokilib.measure import clip_to_width, string_widths
+
+NAMES = ["Yamada Taro (TQ-0001)", "", "x", "Åsa Öberg", "山田太郎（TQ-2026-0001）"]
+
+
+def _pdf():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("helvetica", size=8)
+    return pdf
+
+
+def test_clip_keeps_text_that_fits():
+    pdf = _pdf()
+    assert clip_to_width(pdf, "Yamada", 50) == "Yamada"
+
+
+def test_clip_is_the_longest_fitting_prefix():
+    pdf = _pdf()
+    text = "Yamada Taro (TQ-2026-0401-0001)"
+    for w in (1, 5, 10, 20, 30, pdf.get_string_width(text) - 0.01):
+        clipped = clip_to_width(pdf, text, w, ellipsis="...")
+        prefix = clipped[:-3]
+        assert clipped.endswith("...") and text.startswith(prefix)
+        assert not prefix or pdf.get_string_width(clipped) <= w
+        if len(prefix) < len(text):
+            assert pdf.get_string_width(text[:len(prefix) + 1] + "...") > w
+
+
+def test_string_widths_match_get_string_width():
+    font = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+    if not os.path.exists(font):
+        pytest.skip("no TrueType font")
+    pdf = FPDF()
+    add_font(pdf, "Sans", "", font)
+    pdf.add_page()
+    pdf.set_font("Sans", size=8)
+    assert string_widths(pdf, NAMES) == pytest.approx([pdf.get_string_width(t) for t in NAMES])
+
+
+def test_string_widths_fall_back_for_core_fonts():
+    pdf = _pdf()
+    texts = NAMES[:4]
+    assert string_widths(pdf, texts) == [pdf.get_string_width(t) for t in texts]
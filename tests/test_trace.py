@@ -0,0 +1,37 @@
+"""Tests for tokilib.trace: worker events merged into the parent's trace."""
+
+import os
+
+import pytest
+
+from tokilib import trace
+
+
+@pytest.fixture
+def tracing(monkeypatch):
+    monkeypatch.setattr(trace, "_enabled", False)
+    monkeypatch.setattr(trace, "_events", [])
+    trace.enable()
+
+
+def test_take_hands_over_events_once(tracing):
+    with trace.span("cover", "section"):
+        pass
+    events = trace.take()
+    assert [e["name"] for e in events] == ["cover"]
+    assert trace.take() == []
+
+
+def test_merged_worker_sections_are_summed(tracing):
+    with trace.span("cover", "section"):
+        pass
+    worker = trace.take()
+    for e in worker:
+        e["pid"] = os.getpid() + 1
+    with trace.span("cover", "section"):
+        pass
+    trace.merge(worker)
+    lines = trace.summary()
+    row = next(line for line in lines if line.split()[:1] == ["cover"])
+    assert row.split()[1] == "2"
+    assert {e["pid"] for e in trace._events} == {os.getpid(), os.getpid() + 1}
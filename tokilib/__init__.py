@@ -0,0 +1,6 @@
+"""Shared helpers for the TokiStorage PDF generators.
+
+The top-level ``generate-*.py`` scripts import from here directly (the repo
+root is on ``sys.path`` when they run); ``newsletter/*.py`` scripts add the
+repo root themselves.
+"""
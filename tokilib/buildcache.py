@@ -0,0 +1,135 @@
+"""Content-hash build cache for incremental PDF rebuilds.
+
+Every input of a build (manifest, client-config, fonts, icons, TokiQR PDFs,
+generator source) is fingerprinted with SHA-256.  The fingerprints are grouped
+into named *sections*; a build whose sections all match the previous record
+is skipped, and a build whose ``base`` section still matches can reuse the
+cached fpdf output instead of laying the pages out again.
+
+Records live under ``<root>/.cache/<namespace>/`` and are safe to delete.
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+
+CACHE_DIRNAME = ".cache"
+
+_DIGEST_MEMO = {}
+
+
+def file_digest(path):
+    """SHA-256 hex digest of a file's contents, or None if it doesn't exist.
+
+    Memoized per process on (path, size, mtime) so repeated lookups of the
+    same font or icon across issues cost one stat call.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    st = os.stat(path)
+    memo_key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+    digest = _DIGEST_MEMO.get(memo_key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        _DIGEST_MEMO[memo_key] = digest
+    return digest
+
+
+def replace_if_changed(tmp_path, path):
+    """Move tmp_path onto path unless path already holds the same bytes.
+
+    Returns True if path was (re)written; an unchanged output keeps its
+    mtime, so it doesn't show up as a change to git or to deploy steps.
+    """
+    if (os.path.exists(path) and os.path.getsize(path) == os.path.getsize(tmp_path)
+            and filecmp.cmp(tmp_path, path, shallow=False)):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_if_changed(path, data):
+    """Write bytes to path unless it already holds them; True if written."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def combine_digests(parts):
+    """Fold a dict of name → digest/JSON-serializable value into one digest."""
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def source_digest(*paths):
+    """Digest of the generator sources, so layout code changes invalidate."""
+    lib_dir = os.path.dirname(os.path.abspath(__file__))
+    sources = list(paths) + sorted(
+        os.path.join(lib_dir, f) for f in os.listdir(lib_dir) if f.endswith(".py")
+    )
+    return combine_digests({os.path.basename(p): file_digest(p) for p in sources})
+
+
+class BuildCache:
+    """Per-output build record: section fingerprints and the base PDF.
+
+    Reuse works at base-PDF level: the fpdf pages are taken from the cache
+    whole, and the TokiQR merge (if there is anything to merge) runs again
+    over every TokiQR PDF.  Unchanged sections' pages are not spliced in
+    from the previous output; the merge streams the complete file either
+    way, so that would only swap which file the same pages are read from.
+    """
+
+    def __init__(self, root_dir, namespace, key):
+        self.cache_dir = os.path.join(root_dir, CACHE_DIRNAME, namespace)
+        self.record_path = os.path.join(self.cache_dir, f"{key}.json")
+        self.base_path = os.path.join(self.cache_dir, f"{key}.base.pdf")
+        self.record = {}
+        if os.path.exists(self.record_path):
+            try:
+                with open(self.record_path, encoding="utf-8") as f:
+                    self.record = json.load(f)
+            except (OSError, ValueError):
+                self.record = {}
+
+    def is_fresh(self, sections, out_path):
+        """True when every section matches and the output is untouched."""
+        return (
+            self.record.get("sections") == sections
+            and self.record.get("output") is not None
+            and self.record.get("output") == file_digest(out_path)
+        )
+
+    def can_reuse_base(self, sections):
+        """True when the fpdf-rendered part can be taken from the cache."""
+        return (
+            self.record.get("sections", {}).get("base") == sections.get("base")
+            and file_digest(self.base_path) is not None
+            and self.record.get("base_pdf") == file_digest(self.base_path)
+        )
+
+    def changed_sections(self, sections):
+        old = self.record.get("sections", {})
+        return sorted(k for k in set(old) | set(sections) if old.get(k) != sections.get(k))
+
+    def save(self, sections, out_path):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.record = {
+            "sections": sections,
+            "base_pdf": file_digest(self.base_path),
+            "output": file_digest(out_path),
+        }
+        with open(self.record_path, "w", encoding="utf-8") as f:
+            json.dump(self.record, f, ensure_ascii=False, indent=2)
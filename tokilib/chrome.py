@@ -0,0 +1,105 @@
+"""Page chrome recorded once per document as form XObjects.
+
+Accent bars, footer rules and box frames are the same on every page, yet
+fpdf writes their operators into each page's content stream again.
+ChromeMixin.stamp_chrome() draws such static chrome once per document,
+lifts the operators out of the page into a Form XObject (fpdf already
+writes Form XObjects for blend groups, so the output stage knows how to
+emit them), and places that form on every page with a single "Do".
+
+Only vector graphics belong in a template: the form has no /Resources of
+its own, so text (page labels, footers) stays on the page as before.
+Content that appears once (a page's own QR code) gains nothing from a form
+and should be drawn inline.
+
+fpdf2 has no public API for adding forms; the private state involved is
+confined to _form_catalog() and _add_form(), and on an untested fpdf2
+release stamp_chrome() falls back to drawing the chrome inline.
+"""
+
+import fpdf
+from fpdf.enums import PDFResourceType
+from fpdf.syntax import Name, PDFArray, PDFContentStream
+
+# fpdf numbers images len(images) + 1 as they are added, regardless of
+# other XObjects, so templates take their /I<n> names from a separate range.
+_INDEX_BASE = 100000
+
+# fpdf2 releases (major, minor) checked to write the forms registered below
+_FORMS_TESTED = {(2, 8)}
+
+
+class ChromeMixin:
+    """FPDF mixin: reusable static page chrome (Form XObjects)."""
+
+    def stamp_chrome(self, name, draw, x=0, y=0):
+        """Place the chrome drawn by draw() at (x, y) on the current page.
+
+        draw() runs once per document, drawing relative to (0, 0) in user
+        units; later calls with the same name just reference that form.
+        On an fpdf2 release not in _FORMS_TESTED it is drawn inline instead.
+        """
+        translate = f"q 1 0 0 1 {x * self.k:.2f} {-y * self.k:.2f} cm"
+        catalog = _form_catalog(self)
+        if catalog is None:
+            self._out(translate)
+            with self.local_context():
+                draw()
+            self._out("Q")
+            return
+        templates = self.__dict__.setdefault("_chrome_templates", {})
+        index = templates.get(name)
+        if index is None:
+            index = templates[name] = _INDEX_BASE + len(templates)
+            _add_form(catalog, index, self._record_chrome(draw))
+        self._out(f"{translate} /I{index} Do Q")
+        catalog.add(PDFResourceType.X_OBJECT, index, self.page)
+
+    def _record_chrome(self, draw):
+        # Draw on the page inside q/Q (local_context restores fpdf's colour
+        # and line state too), then move the bytes into a form.
+        flush = getattr(self, "_flush_state", None)
+        if flush is not None:
+            flush()  # state tokilib.gstate held back belongs to the page
+        contents = self.pages[self.page].contents
+        start = len(contents)
+        line_width = self.line_width
+        with self.local_context():
+            draw()
+            line_width = max(line_width, self.line_width)
+        ops = bytes(contents[start:])
+        del contents[start:]
+
+        # Strokes along the page edges (e.g. a frame drawn at 0, 0) extend
+        # half their width outside the page; the BBox clips the form, so it
+        # is grown by a line width on every side.
+        pad = round(line_width * self.k, 2)
+        form = PDFContentStream(contents=ops, compress=self.compress)
+        form.type = Name("XObject")
+        form.subtype = Name("Form")
+        form.b_box = PDFArray([-pad, -pad, round(self.w_pt + pad, 2), round(self.h_pt + pad, 2)])
+        return form
+
+
+# ── fpdf2 private state ──────────────────────────────────────────────
+# fpdf2 has no API for adding a form XObject: its output stage writes the
+# (index, form) pairs in _resource_catalog.form_xobjects (used for blend
+# groups) and resolves /I<index> through the page resources.  Only these
+# two functions touch that, and only on releases listed in _FORMS_TESTED.
+
+def _form_catalog(pdf):
+    """pdf's resource catalog if forms can be added to it, else None."""
+    try:
+        version = tuple(int(part) for part in fpdf.FPDF_VERSION.split(".")[:2])
+    except ValueError:
+        return None
+    catalog = getattr(pdf, "_resource_catalog", None)
+    if version not in _FORMS_TESTED or not isinstance(
+            getattr(catalog, "form_xobjects", None), list):
+        return None
+    return catalog
+
+
+def _add_form(catalog, index, form):
+    form._registered = False  # fpdf assigns the object id at output
+    catalog.form_xobjects.append((index, form))
@@ -0,0 +1,160 @@
+"""Lead-paragraph excerpts of essay pages, cached by file hash.
+
+extract() streams an essay's HTML through html.parser in chunks and
+collects the text of the body paragraphs (<p> without a class, inside
+<main> but not in its header, nav, footer or asides) until the character
+budget is reached, then stops reading.  The excerpt is cut back to the
+last full sentence that fits, or ends in "…" when none does.
+
+ExcerptCache keeps results in .cache/excerpts.json keyed by the page's
+SHA-256; the file's size and mtime are stored alongside so unchanged pages
+aren't even re-hashed.  Regenerating the excerpts of the whole essay pool
+only parses pages that changed:
+  python3 -m tokilib.excerpts [--budget N] [page.html ...]
+"""
+
+import json
+import os
+import sys
+from html.parser import HTMLParser
+
+from tokilib.buildcache import CACHE_DIRNAME, file_digest
+
+DEFAULT_BUDGET = 100
+_CHUNK = 8192
+_SKIP = frozenset({"header", "nav", "footer", "aside", "figure", "script", "style",
+                   "noscript", "template"})
+_SENTENCE_ENDS = "。！？!?"
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _LeadParser(HTMLParser):
+    def __init__(self, budget):
+        super().__init__(convert_charrefs=True)
+        self.budget = budget
+        self.paragraphs = []
+        self.length = 0
+        self.done = False
+        self._in_main = 0
+        self._skip = 0
+        self._para = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("main", "article"):
+            self._in_main += 1
+        elif tag in _SKIP:
+            self._skip += 1
+        elif tag == "p" and self._in_main and not self._skip and not dict(attrs).get("class"):
+            self._para = []
+        elif tag == "br" and self._para is not None:
+            self._para.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in ("main", "article"):
+            self._in_main = max(self._in_main - 1, 0)
+        elif tag in _SKIP:
+            self._skip = max(self._skip - 1, 0)
+        elif tag == "p" and self._para is not None:
+            text = " ".join("".join(self._para).split())
+            self._para = None
+            if text:
+                self.paragraphs.append(text)
+                self.length += len(text)
+                self.done = self.length >= self.budget
+
+    def handle_data(self, data):
+        if self._para is not None:
+            self._para.append(data)
+
+
+def _trim(text, budget):
+    if len(text) <= budget:
+        return text
+    cut = max(text.rfind(ch, 0, budget) for ch in _SENTENCE_ENDS)
+    if cut > 0:
+        return text[:cut + 1]
+    return text[:budget - 1].rstrip() + "…"
+
+
+def extract(path, budget=DEFAULT_BUDGET):
+    """Lead paragraphs of the essay page at path, at most budget characters."""
+    parser = _LeadParser(budget)
+    with open(path, encoding="utf-8") as f:
+        while not parser.done:
+            chunk = f.read(_CHUNK)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    parser.close()
+    return _trim("".join(parser.paragraphs), budget)
+
+
+class ExcerptCache:
+    """Excerpts by page content hash, persisted under .cache/ (safe to delete)."""
+
+    def __init__(self, root_dir=_ROOT):
+        self.path = os.path.join(root_dir, CACHE_DIRNAME, "excerpts.json")
+        self.parsed = self.reused = 0
+        self._dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, page_path, budget=DEFAULT_BUDGET):
+        """Excerpt of page_path, parsing it only if its content changed."""
+        key = os.path.abspath(page_path)
+        st = os.stat(key)
+        entry = self.entries.get(key)
+        stamp = [st.st_size, st.st_mtime_ns]
+        if entry is None or entry["stat"] != stamp:
+            digest = file_digest(key)
+            if entry is None or entry["sha256"] != digest:
+                entry = {"sha256": digest, "excerpts": {}}
+            entry["stat"] = stamp
+            self.entries[key] = entry
+            self._dirty = True
+        text = entry["excerpts"].get(str(budget))
+        if text is None:
+            text = entry["excerpts"][str(budget)] = extract(key, budget)
+            self.parsed += 1
+            self._dirty = True
+        else:
+            self.reused += 1
+        return text
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def _pool_pages(root_dir=_ROOT):
+    with open(os.path.join(root_dir, "newsletter", "essays-pool.json"), encoding="utf-8") as f:
+        pool = json.load(f)
+    return [os.path.join(root_dir, f"{e['id']}.html") for e in pool.get("essays", [])]
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    budget = DEFAULT_BUDGET
+    if "--budget" in args:
+        idx = args.index("--budget")
+        budget = int(args[idx + 1])
+        args = args[:idx] + args[idx + 2:]
+    cache = ExcerptCache()
+    missing = 0
+    for page in args or _pool_pages():
+        if not os.path.exists(page):
+            missing += 1
+            print(f"  MISSING {page}")
+            continue
+        print(f"  {os.path.basename(page)}: {cache.get(page, budget)}")
+    cache.save()
+    print(f"  {cache.parsed} parsed, {cache.reused} from cache, {missing} missing")
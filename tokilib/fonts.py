@@ -0,0 +1,134 @@
+"""Warm font cache for fpdf documents.
+
+fpdf2 re-parses a font's cmap and hmtx tables on every add_font() call,
+which for a CJK font (IPA Gothic / Hiragino, ~12k glyphs) is the bulk of a
+document's start-up time.  add_font() here parses each font file once per
+process (regular and bold share the parse when they are the same file) and
+gives every document a clone of that prototype with its own
+subset map and a freshly opened fontTools object — fpdf subsets the
+fontTools object in place at output time, so it can't be shared.
+
+Fonts added here also measure text through a precomputed width table
+(tokilib.glyphwidths) instead of fpdf's per-character dict lookups.
+
+When a bold face is the same file as the family's regular face (always the
+case on Linux, where IPA Gothic has no W6), add_font() registers it as an
+alias: it shares the regular face's subset, pdf.font_aliases records it,
+and at output time GStateMixin (tokilib.gstate) points its text at the
+regular font and emulates the weight with a stroked outline — so the CJK
+subset is embedded once instead of twice.
+
+Call preload() in a worker-pool initializer to pay the parse up front.
+"""
+
+import copy
+import io
+import os
+from pathlib import Path
+
+from fontTools import ttLib
+from fpdf.enums import TextEmphasis
+from fpdf.fonts import SubsetMap, TTFFont
+
+from tokilib.glyphwidths import table_for
+
+_PROTOTYPES = {}
+_FONT_BYTES = {}
+
+
+class TableFont(TTFFont):
+    """TTFFont whose text widths come from a shared WidthTable."""
+
+    __slots__ = ("widths",)
+
+    def get_text_width(self, text, font_size_pt, text_shaping_params):
+        if font_size_pt > self.biggest_size_pt:
+            self.biggest_size_pt = font_size_pt
+        if text_shaping_params or self.is_symbol:
+            return super().get_text_width(text, font_size_pt, text_shaping_params)
+        if len(text) == 1:
+            return 1, self.widths.char_width(text) * font_size_pt * 0.001
+        return len(text), self.widths.units(text) * font_size_pt * 0.001
+
+    def __deepcopy__(self, memo):
+        # TTFFont.__deepcopy__ would hand back a plain TTFFont (FPDFRecorder)
+        clone = copy.copy(self)
+        for attr in ("cw", "glyph_ids", "missing_glyphs", "subset"):
+            setattr(clone, attr, copy.deepcopy(getattr(self, attr), memo))
+        return clone
+
+
+def _font_bytes(path):
+    data = _FONT_BYTES.get(path)
+    if data is None:
+        with open(path, "rb") as f:
+            data = _FONT_BYTES[path] = f.read()
+    return data
+
+
+def _prototype(pdf, path):
+    proto = _PROTOTYPES.get(path)
+    if proto is None:
+        proto = _PROTOTYPES[path] = TableFont(pdf, Path(path), "proto", "")
+        proto.widths = table_for(path, proto.collection_font_number)
+    return proto
+
+
+def add_font(pdf, family, style, path):
+    """Cached equivalent of pdf.add_font(family, style, path)."""
+    path = os.path.abspath(path)
+    style = "".join(sorted(style.upper()))
+    fontkey = f"{family.lower()}{style}"
+    if fontkey in pdf.fonts:
+        return
+
+    font = copy.copy(_prototype(pdf, path))
+    font.i = len(pdf.fonts) + 1
+    font.fontkey = fontkey
+    font.emphasis = TextEmphasis.coerce(style)
+    font.desc = copy.copy(font.desc)  # a PDF object: gets an object id per document
+    font._hbfont = None
+    font.biggest_size_pt = 0
+
+    regular = pdf.fonts.get(family.lower())
+    if ("B" in style and isinstance(regular, TableFont)
+            and regular.ttffile == font.ttffile):
+        # Same file as the regular face: share its subset, emulate the weight
+        font.ttfont = regular.ttfont
+        font.subset = regular.subset
+        font.missing_glyphs = regular.missing_glyphs
+        pdf.__dict__.setdefault("font_aliases", {})[fontkey] = regular.fontkey
+    else:
+        font.ttfont = ttLib.TTFont(io.BytesIO(_font_bytes(path)), recalcTimestamp=False,
+                                   fontNumber=font.collection_font_number, lazy=True)
+        font.subset = SubsetMap(font)
+        font.missing_glyphs = []
+    pdf.fonts[fontkey] = font
+
+
+def seed_subsets(pdf, prev):
+    """Start pdf's font subsets with every glyph prev's same-named fonts used.
+
+    For documents built in chunks and merged (one fpdf document per chunk):
+    glyphs are given the same subset positions as in prev, so a chunk that
+    needs no new glyphs embeds a byte-identical font, which the streaming
+    merge writes only once.
+    """
+    seeded = set()
+    for fontkey, font in pdf.fonts.items():
+        source = prev.fonts.get(fontkey)
+        if (not isinstance(font, TableFont) or not isinstance(source, TableFont)
+                or source.ttffile != font.ttffile or id(font.subset) in seeded):
+            continue
+        seeded.add(id(font.subset))  # a bold alias shares the regular subset
+        for glyph, _ in sorted(source.subset.items(), key=lambda item: item[1]):
+            font.subset.pick_glyph(glyph)
+
+
+def preload(*paths):
+    """Parse fonts ahead of time (e.g. once per pool worker)."""
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    for i, path in enumerate(p for p in paths if p):
+        add_font(pdf, f"preload{i}", "", path)
@@ -0,0 +1,157 @@
+"""Precomputed glyph-width tables for string measurement.
+
+fpdf measures text by summing font.cw[ord(c)] one character at a time, and
+its line breaker asks for every character separately.  WidthTable holds the
+advance widths of a font (in fpdf's 1/1000 em units, same rounding as
+fpdf) as a flat uint16 array indexed by BMP code point, with the few astral
+code points in a side dict.  Single characters are a plain array index;
+whole strings and batches of strings are summed with NumPy when it is
+installed (pure Python over the same array otherwise).
+
+Tables are built from the font's cmap/hmtx once and cached on disk under
+.cache/glyphwidths/, keyed by the font file's content hash, so later runs
+(and pool workers) skip rebuilding it.
+"""
+
+import os
+import sys
+from array import array
+
+from tokilib.buildcache import CACHE_DIRNAME, file_digest
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python sums over the same table
+    np = None
+
+BMP_SIZE = 0x10000
+_MISSING = BMP_SIZE  # last slot of the table: width of unmapped characters
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          CACHE_DIRNAME, "glyphwidths")
+_TABLES = {}
+
+
+class WidthTable:
+    """Advance widths of one font file, 1/1000 em per code point."""
+
+    def __init__(self, bmp, astral):
+        self.bmp = bmp            # array("H"), BMP_SIZE + 1 entries
+        self.astral = astral      # {codepoint: width} above U+FFFF
+        self.missing = bmp[_MISSING]
+        self._np = np.frombuffer(bmp, dtype=np.uint16) if np is not None else None
+
+    @classmethod
+    def from_font(cls, path, font_number=0):
+        """Read cmap/hmtx with fontTools (same rounding as fpdf's TTFFont)."""
+        from fontTools import ttLib
+
+        tt = ttLib.TTFont(path, fontNumber=font_number, lazy=True)
+        try:
+            scale = 1000 / float(tt["head"].unitsPerEm)
+            metrics = tt["hmtx"].metrics
+            missing = round(scale * metrics[".notdef"][0]) if ".notdef" in metrics else 0
+            bmp = array("H", [missing]) * (BMP_SIZE + 1)
+            astral = {}
+            for cp, glyph in (tt.getBestCmap() or {}).items():
+                w = metrics[glyph][0]
+                w = 0 if w == 65535 else round(scale * w + 0.001)
+                if cp < BMP_SIZE:
+                    bmp[cp] = w
+                else:
+                    astral[cp] = w
+        finally:
+            tt.close()
+        return cls(bmp, astral)
+
+    # ── Disk cache ───────────────────────────────────────────────────
+    # Layout: BMP table (uint16 × BMP_SIZE+1), then astral (cp, w) pairs
+    # as uint32, all little-endian.
+
+    @classmethod
+    def load(cls, cache_path):
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        split = (BMP_SIZE + 1) * 2
+        if len(data) < split:
+            raise ValueError(f"truncated width table: {cache_path}")
+        bmp, pairs = array("H"), array("I")
+        bmp.frombytes(data[:split])
+        pairs.frombytes(data[split:])
+        if sys.byteorder == "big":
+            bmp.byteswap()
+            pairs.byteswap()
+        return cls(bmp, dict(zip(pairs[::2], pairs[1::2])))
+
+    def save(self, cache_path):
+        bmp = array("H", self.bmp)
+        pairs = array("I", [v for item in sorted(self.astral.items()) for v in item])
+        if sys.byteorder == "big":
+            bmp.byteswap()
+            pairs.byteswap()
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(bmp.tobytes())
+            f.write(pairs.tobytes())
+        os.replace(tmp, cache_path)
+
+    # ── Measurement ──────────────────────────────────────────────────
+
+    def char_width(self, ch):
+        cp = ord(ch)
+        if cp < BMP_SIZE:
+            return self.bmp[cp]
+        return self.astral.get(cp, self.missing)
+
+    def units(self, text):
+        """Width of text in 1/1000 em."""
+        if len(text) < 8 or self._np is None:
+            bmp, astral, missing = self.bmp, self.astral, self.missing
+            return sum(bmp[cp] if cp < BMP_SIZE else astral.get(cp, missing)
+                       for cp in map(ord, text))
+        return int(self._widths(_codes(text)).sum(dtype=np.int64))
+
+    def batch_units(self, texts):
+        """Widths of several strings in 1/1000 em, one NumPy pass."""
+        texts = list(texts)
+        if self._np is None:
+            return [self.units(t) for t in texts]
+        codes = _codes("".join(texts))
+        widths = self._widths(codes)
+        sums = np.concatenate(([0], np.cumsum(widths, dtype=np.int64)))
+        ends = np.cumsum([len(t) for t in texts], dtype=np.int64)
+        starts = ends - np.array([len(t) for t in texts], dtype=np.int64)
+        return (sums[ends] - sums[starts]).tolist()
+
+    def _widths(self, codes):
+        widths = self._np[np.minimum(codes, _MISSING)]
+        astral = codes >= BMP_SIZE
+        if astral.any():
+            widths = widths.astype(np.int64)
+            widths[astral] = [self.astral.get(int(cp), self.missing) for cp in codes[astral]]
+        return widths
+
+
+def _codes(text):
+    return np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+
+
+def table_for(path, font_number=0):
+    """WidthTable for a font file: memory, then .cache/, then the font itself."""
+    path = os.path.abspath(path)
+    key = (path, font_number)
+    table = _TABLES.get(key)
+    if table is not None:
+        return table
+    digest = file_digest(path)
+    cache_path = os.path.join(_CACHE_DIR, f"{digest}-{font_number}.widths")
+    try:
+        table = WidthTable.load(cache_path)
+    except (OSError, ValueError):
+        table = WidthTable.from_font(path, font_number)
+        try:
+            table.save(cache_path)
+        except OSError:
+            pass  # read-only checkout: still fine, just not cached
+    _TABLES[key] = table
+    return table
@@ -0,0 +1,347 @@
+"""Redundant graphics-state elision for fpdf documents.
+
+The generators call set_font / set_*_color before nearly every cell, and
+fpdf writes a colour, line-width or font operator whenever its own idea of
+the current value changes — including colours that are overwritten before
+anything is painted, a font selected in an empty BT/ET pair and replaced
+right after, and values re-set to what a Q already brought back.
+
+GStateMixin holds those operators back when they are set (set_draw_color,
+set_fill_color, set_line_width, and the "BT /F Tf ET" fpdf writes before
+text) and writes them just before the next content that could use them:
+  - a value replaced, or discarded by Q, before anything else is written
+    is never written (a dead store),
+  - a value equal to the one known to be in effect is skipped; the known
+    values follow q/Q, and any other content that sets state (or saves and
+    restores it in ways the mixin can't follow) makes them unknown again.
+pdf.elided_ops counts the operators never written.
+
+It also resolves bold aliases (tokilib.fonts.add_font registers "JP B" as
+an alias when it is the same file as "JP"): at output, embolden() points
+the alias's Tf at the regular face and draws its text filled and stroked
+in the fill colour, so the document embeds a single subset of the font.
+Only the pages that use an alias are parsed for this.
+"""
+
+import re
+
+from fpdf import FPDF
+from fpdf.enums import PDFResourceType
+from fpdf.output import OutputProducer
+
+_WS = b" \t\r\n\x0c\x00"
+_DELIMS = b"()<>[]{}/%"
+
+# Operators in other content that change the values GStateMixin tracks
+_CHANGES = {
+    "rg": "fill", "g": "fill", "k": "fill", "cs": "fill", "sc": "fill", "scn": "fill",
+    "RG": "stroke", "G": "stroke", "K": "stroke", "CS": "stroke", "SC": "stroke",
+    "SCN": "stroke", "w": "w", "Tf": "Tf", "gs": "*", "q": "**", "Q": "**",
+}
+# A token that may be one of them (text in strings can only cause false alarms)
+_CHANGE_TOKEN = re.compile(r"(?<![^\s)\]>])(%s)(?![^\s(\[</%%])"
+                           % "|".join(sorted(_CHANGES, key=len, reverse=True)))
+
+_SHOW_TEXT = {b"Tj", b"TJ", b"'", b'"'}
+# Operators that neither use nor change stroke colour, line width or Tr
+_TEXT_ONLY = {b"BT", b"ET", b"Td", b"TD", b"Tm", b"T*", b"Tf", b"Tc", b"Tw", b"Tz",
+              b"TL", b"Ts", b"rg", b"g", b"k"}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _operations(data):
+    """(start, operator, operands) for each operation in a content stream."""
+    ops = []
+    operands = []
+    start = None
+    i, n = 0, len(data)
+    while i < n:
+        c = data[i]
+        if c in _WS:
+            i += 1
+            continue
+        if start is None:
+            start = i
+        if c == 0x25:  # % comment
+            while i < n and data[i] not in b"\r\n":
+                i += 1
+            continue
+        if c == 0x28:  # (literal string)
+            depth, j = 1, i + 1
+            while j < n and depth:
+                if data[j] == 0x5C:
+                    j += 2
+                    continue
+                if data[j] == 0x28:
+                    depth += 1
+                elif data[j] == 0x29:
+                    depth -= 1
+                j += 1
+            operands.append(data[i:j])
+            i = j
+        elif data[i:i + 2] in (b"<<", b">>"):
+            operands.append(data[i:i + 2])
+            i += 2
+        elif c == 0x3C:  # <hex string>
+            j = data.index(b">", i) + 1
+            operands.append(data[i:j])
+            i = j
+        elif c in b"[]{}":
+            operands.append(data[i:i + 1])
+            i += 1
+        else:
+            j = i + 1
+            while j < n and data[j] not in _WS and data[j] not in _DELIMS:
+                j += 1
+            token = data[i:j]
+            i = j
+            if c == 0x2F or c in b"+-.0123456789":  # /name or number
+                operands.append(token)
+                continue
+            if token in (b"BI", b"ID", b"EI"):
+                raise _Unsupported("inline image")
+            if token in (b"true", b"false", b"null"):
+                operands.append(token)
+                continue
+            ops.append((start, token, tuple(operands)))
+            operands = []
+            start = None
+    return ops
+
+
+# ── Bold emulation ───────────────────────────────────────────────────
+
+_BOLD_STROKE = 0.025  # stroke width per point of font size
+_STROKE_OF_FILL = {b"rg": b"RG", b"g": b"G", b"k": b"K"}
+# Page defaults of the state the emulation changes
+_DEFAULT = {"fill": (b"g", (b"0",)), "stroke": (b"G", (b"0",)), "w": (b"1",), "Tr": (b"0",)}
+
+
+def _state_op(kind, value):
+    if kind == "stroke":
+        return b" ".join(value[1] + (value[0],)) + b" "
+    return b" ".join(value + (kind.encode(),)) + b" "
+
+
+def embolden(data, aliases):
+    """Return data with bold-alias fonts drawn as fill+stroke of the regular face.
+
+    aliases maps alias font names to regular ones ({b"/F2": b"/F1"}).  The
+    stroke width, stroke colour and render mode set for the emulation are
+    put back before the first operation that could use them, so the rest
+    of the page is unaffected and runs of bold text set them only once.
+    """
+    try:
+        ops = _operations(bytes(data))
+    except (_Unsupported, ValueError):
+        return data
+    if not any(op == b"Tf" and operands and operands[0] in aliases
+               for _, op, operands in ops):
+        return data
+
+    # The page's own state (bold: size while a bold alias is selected), and
+    # the stroke-related part of it the page really has during emulation
+    state = dict(_DEFAULT, bold=None)
+    emitted = {kind: state[kind] for kind in ("stroke", "w", "Tr")}
+    stack = []
+    inserts = {}    # op index -> bytes to write before it
+    bounds = [start for start, _, _ in ops] + [len(data)]
+    replaced = {}   # op index -> rewritten operation
+
+    def put(idx, wanted):
+        text = b""
+        for kind, value in wanted.items():
+            if emitted[kind] != value:
+                text += _state_op(kind, value)
+                emitted[kind] = value
+        if text:
+            inserts[idx] = inserts.get(idx, b"") + text
+
+    def restore(idx):
+        put(idx, {kind: state[kind] for kind in emitted})
+
+    for idx, (_, op, operands) in enumerate(ops):
+        if op == b"Tf" and operands:
+            regular = aliases.get(operands[0])
+            if regular is not None:
+                state["bold"] = float(operands[1]) if len(operands) > 1 else 0.0
+                replaced[idx] = b" ".join((regular,) + operands[1:] + (op,)) + b"\n"
+            else:
+                state["bold"] = None
+        elif op in _STROKE_OF_FILL:
+            state["fill"] = (op, operands)
+        elif op in _SHOW_TEXT:
+            if state["Tr"] != _DEFAULT["Tr"]:
+                restore(idx)  # a render mode the page chose uses all of it
+                continue
+            if state["bold"] is None:
+                put(idx, {"Tr": state["Tr"]})  # filled: only Tr matters
+                continue
+            stroke_op, fill = state["fill"]
+            put(idx, {"Tr": (b"2",),
+                      "w": (f"{state['bold'] * _BOLD_STROKE:.2f}".encode(),),
+                      "stroke": (_STROKE_OF_FILL[stroke_op], fill)})
+        elif op in _TEXT_ONLY:
+            pass
+        elif op in (b"RG", b"G", b"K", b"w", b"Tr"):
+            kind = "stroke" if op in (b"RG", b"G", b"K") else op.decode()
+            state[kind] = emitted[kind] = (op, operands) if kind == "stroke" else operands
+        elif op == b"Q":
+            state = stack.pop() if stack else state
+            emitted = {kind: state[kind] for kind in emitted}
+        else:
+            restore(idx)  # painting, q, XObjects, unknown: the page's own state
+            if op == b"q":
+                stack.append(dict(state))
+
+    out = bytearray(data[:ops[0][0]])
+    for i in range(len(ops)):
+        out += inserts.get(i, b"")
+        out += replaced.get(i, data[bounds[i]:bounds[i + 1]])
+    return out
+
+
+def _resolve_font_aliases(fpdf):
+    """Rewrite pages to use the regular face for bold aliases; drop the aliases."""
+    fonts = fpdf.fonts
+    by_index = {fonts[alias].i: fonts[regular].i
+                for alias, regular in fpdf.font_aliases.items()
+                if alias in fonts and regular in fonts}
+    if not by_index:
+        return
+    names = {f"/F{a}".encode(): f"/F{r}".encode() for a, r in by_index.items()}
+    per_page = fpdf._resource_catalog.resources_per_page
+    for number, page in fpdf.pages.items():
+        used = per_page.get((number, PDFResourceType.FONT))
+        if not used:
+            continue
+        # ids come in as ints (set_font) or strings (stream scans)
+        aliased = [i for i in by_index if i in used or str(i) in used]
+        if not aliased:
+            continue
+        page.contents = embolden(page.contents, names)
+        for alias_i in aliased:
+            used.difference_update((alias_i, str(alias_i)))
+            used.add(by_index[alias_i])
+    for alias in fpdf.font_aliases:
+        fonts.pop(alias, None)
+
+
+class _AliasProducer(OutputProducer):
+    def bufferize(self):
+        _resolve_font_aliases(self.fpdf)
+        return super().bufferize()
+
+
+class GStateMixin:
+    """FPDF mixin: write colour, line-width and font operators only when needed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.elided_ops = 0
+        self._gs_page = None
+        self._gs_setting = None  # kind of the set_* call in progress
+        self._gs_pending = {}    # kind -> operator not written yet
+        self._gs_known = {}      # kind -> operator in effect at this q level
+        self._gs_saved = []      # _gs_known of the enclosing q levels
+
+    def set_draw_color(self, *args, **kwargs):
+        self._setting("stroke", super().set_draw_color, args, kwargs)
+
+    def set_fill_color(self, *args, **kwargs):
+        self._setting("fill", super().set_fill_color, args, kwargs)
+
+    def set_line_width(self, width):
+        self._setting("w", super().set_line_width, (width,), {})
+
+    def _set_font_for_page(self, font, font_size_pt, wrap_in_text_object=True):
+        sl = super()._set_font_for_page(font, font_size_pt, wrap_in_text_object)
+        if not wrap_in_text_object:
+            return sl
+        self._hold("Tf", f"/F{font.i} {font_size_pt:.2f} Tf")
+        return ""  # written by _flush_state() as "BT ... Tf ET"
+
+    def _setting(self, kind, setter, args, kwargs):
+        self._gs_setting = kind
+        try:
+            setter(*args, **kwargs)  # fpdf's own check and formatting, into _out()
+        finally:
+            self._gs_setting = None
+
+    def _hold(self, kind, op):
+        self._sync_page()
+        if kind in self._gs_pending:
+            self.elided_ops += 1
+        self._gs_pending[kind] = op
+
+    def _sync_page(self):
+        if self._gs_page != self.page:  # new page: new content stream
+            self.elided_ops += len(self._gs_pending)
+            self._gs_page = self.page
+            self._gs_pending, self._gs_known, self._gs_saved = {}, {}, []
+
+    def _flush_state(self):
+        """Write the state operators held back so far."""
+        self._sync_page()
+        for kind, op in self._gs_pending.items():
+            if self._gs_known.get(kind) == op:
+                self.elided_ops += 1
+                continue
+            self._gs_known[kind] = op
+            super()._out(f"BT {op} ET" if kind == "Tf" else op)
+        self._gs_pending.clear()
+
+    def _out(self, s):
+        if self._gs_setting is not None:
+            self._hold(self._gs_setting, s)
+            return
+        if not s:
+            return
+        text = s.decode("latin-1") if isinstance(s, (bytes, bytearray)) else str(s)
+        if text == "Q":
+            self._sync_page()
+            self.elided_ops += len(self._gs_pending)  # discarded by Q
+            self._gs_pending.clear()
+            self._gs_known = self._gs_saved.pop() if self._gs_saved else {}
+            super()._out(s)
+            return
+        self._flush_state()
+        super()._out(s)
+        if text == "q":
+            self._gs_saved.append(dict(self._gs_known))
+        else:
+            self._forget_changes(text)
+
+    def _forget_changes(self, text):
+        """Drop the known values other content written with _out() may change."""
+        depth, nested, kinds = 0, False, set()
+        for token in _CHANGE_TOKEN.findall(text):
+            kind = _CHANGES[token]
+            if kind == "**":
+                nested = True
+                depth += 1 if token == "q" else -1
+                if depth < 0:
+                    break
+            elif not depth:
+                kinds.add(kind)
+        # Unbalanced q/Q ("q /GS1 gs", clipping, rotation) or q/Q next to text
+        # (whose strings could hide or fake one): no q level can be trusted.
+        if depth or nested and ("(" in text or "<" in text):
+            self._gs_known = {}
+            self._gs_saved = [{} for _ in self._gs_saved]
+        elif "*" in kinds:
+            self._gs_known = {}
+        else:
+            for kind in kinds:
+                self._gs_known.pop(kind, None)
+
+    def output(self, *args, **kwargs):
+        kwargs.setdefault("output_producer_class", _AliasProducer)
+        return super().output(*args, **kwargs)
+
+
+class GStateFPDF(GStateMixin, FPDF):
+    """Plain FPDF with state elision, for scripts without their own subclass."""
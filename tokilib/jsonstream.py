@@ -0,0 +1,101 @@
+"""Incremental reading of one large array inside a JSON object file.
+
+A TokiQR materials file is a JSON object whose "urls" array can hold
+hundreds of thousands of entries.  json.load() builds all of them at once;
+members() reads the file in fixed-size blocks and decodes one value at a
+time with json.JSONDecoder.raw_decode, so memory stays at one block plus
+the value being decoded, however long the array is.
+
+  for kind, name, value in members(path, "urls"):
+      # ("member", name, value) for every other top-level member,
+      # ("item", "urls", value) for each element of the "urls" array
+"""
+
+import json
+
+BLOCK_SIZE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_WS = " \t\r\n"
+_DELIMS = _WS + ",]}"
+
+
+class _Reader:
+    """Text buffer over a file, refilled as values are consumed."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.pos > BLOCK_SIZE:
+            self.buf, self.pos = self.buf[self.pos:], 0
+        block = self.f.read(BLOCK_SIZE)
+        self.eof = not block
+        self.buf += block
+        return not self.eof
+
+    def peek(self):
+        """Next non-whitespace character ("" at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, chars):
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError(f"expected one of {chars!r} in JSON, found {c or 'end of file'!r}")
+        self.pos += 1
+        return c
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number is only complete once a delimiter follows it ("1" of "1.5")
+            complete = (end < len(self.buf) and self.buf[end] in _DELIMS
+                        or not isinstance(value, (int, float)) or isinstance(value, bool))
+            if complete or self.eof or not self._fill():
+                self.pos = end
+                return value
+
+
+def members(path, array_key):
+    """Yield the top-level members of the JSON object in path, streaming array_key.
+
+    ("member", name, value) for each member other than array_key, and
+    ("item", array_key, value) for each element of array_key's array.
+    """
+    with open(path, encoding="utf-8") as f:
+        r = _Reader(f)
+        r.expect("{")
+        if r.peek() == "}":
+            return
+        while True:
+            name = r.value()
+            if not isinstance(name, str):
+                raise ValueError(f"JSON object key expected in {path}")
+            r.expect(":")
+            if name == array_key and r.peek() == "[":
+                r.expect("[")
+                if r.peek() != "]":
+                    while True:
+                        yield "item", name, r.value()
+                        if r.expect(",]") == "]":
+                            break
+                else:
+                    r.expect("]")
+            else:
+                yield "member", name, r.value()
+            if r.expect(",}") == "}":
+                return
@@ -0,0 +1,138 @@
+"""Japanese line breaking with kinsoku shori (禁則処理) for fpdf multi_cell.
+
+fpdf breaks CJK text at whichever character runs out of width, so 。、」
+end up at the start of a line and （「 at the end of one.  wrap_text()
+breaks lines itself — greedily, but only at positions the kinsoku rules
+allow (追い出し: the offending character is pushed to the next line
+together with its neighbour) — and hands multi_cell text with explicit
+newlines, which fpdf then draws as-is.
+
+Break opportunities are computed once per paragraph; wrapped lines are
+memoized per (paragraph, width, font, size), so measuring a box
+(tokilib.measure) and drawing it, or re-laying-out at another width, reuse
+the work.
+
+Generators mix KinsokuMixin into their FPDF subclass; code holding a plain
+FPDF can call wrap_text() before multi_cell().
+"""
+
+# 行頭禁則: may not start a line
+NO_START = frozenset(
+    "、。，．,.・：；:;？！?!‼⁇⁈⁉゛゜ヽヾゝゞ々〻ー－‐゠–〜～"
+    "）〕］｝〉》」』】〙〗〟’”)]}»"
+    "…‥ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶㇰㇱㇲㇳㇴㇵㇶㇷㇸㇹㇺㇻㇼㇽㇾㇿ"
+    "%％‰℃°′″"
+)
+# 行末禁則: may not end a line
+NO_END = frozenset("（〔［｛〈《「『【〘〖〝‘“([{«￥＄$£＃#")
+
+_TOLERANCE = 1e-9  # same as fpdf.util.FloatTolerance
+_OPPORTUNITIES = {}
+_LINES = {}
+_CHAR_WIDTHS = {}
+
+
+def _is_wide(ch):
+    # CJK, kana and fullwidth forms: a line may break on either side
+    return ch >= "⺀"
+
+
+def break_opportunities(paragraph):
+    """Indices i where a line may break before paragraph[i] (memoized)."""
+    opps = _OPPORTUNITIES.get(paragraph)
+    if opps is None:
+        opps = set()
+        for i in range(1, len(paragraph)):
+            a, b = paragraph[i - 1], paragraph[i]
+            if a == " " or b == " ":
+                opps.add(i)
+            elif b in NO_START or a in NO_END:
+                continue
+            elif _is_wide(a) or _is_wide(b):
+                opps.add(i)
+        opps = _OPPORTUNITIES[paragraph] = frozenset(opps)
+    return opps
+
+
+def _char_widths(pdf):
+    font = pdf.current_font
+    key = (str(getattr(font, "ttffile", pdf.font_family)), pdf.font_style,
+           pdf.font_size_pt, pdf.k)
+    widths = _CHAR_WIDTHS.get(key)
+    if widths is None:
+        widths = _CHAR_WIDTHS[key] = {}
+    return key, widths
+
+
+def _wrap_paragraph(paragraph, char_w, max_w):
+    opps = break_opportunities(paragraph)
+    widths = [char_w(ch) for ch in paragraph]
+    lines = []
+    start, n = 0, len(paragraph)
+    while start < n:
+        width, end, last = 0.0, start, None
+        while end < n:
+            if end > start and end in opps:
+                last = end
+            if end > start and width + widths[end] > max_w + _TOLERANCE:
+                break
+            width += widths[end]
+            end += 1
+        else:
+            lines.append(paragraph[start:])
+            break
+        # Push out to the last allowed break; force one only if there is none
+        brk = last or end
+        lines.append(paragraph[start:brk].rstrip(" "))
+        start = brk
+        while start < n and paragraph[start] == " ":
+            start += 1
+    return lines or [""]
+
+
+def wrap_lines(pdf, w, text):
+    """Kinsoku-wrapped lines of text for multi_cell(w, ...) in the current font."""
+    if w == 0:
+        w = pdf.w - pdf.r_margin - pdf.x
+    max_w = w - 2 * pdf.c_margin
+    font_key, cache = _char_widths(pdf)
+    key = (text, font_key, round(max_w, 6))
+    lines = _LINES.get(key)
+    if lines is not None:
+        return lines
+
+    font, size_pt, k = pdf.current_font, pdf.font_size_pt, pdf.k
+
+    def char_w(ch):
+        cw = cache.get(ch)
+        if cw is None:
+            cw = cache[ch] = font.get_text_width(ch, size_pt, None)[1] / k
+        return cw
+
+    lines = []
+    for paragraph in text.replace("\r", "").split("\n"):
+        lines.extend(_wrap_paragraph(paragraph, char_w, max_w))
+    lines = _LINES[key] = tuple(lines)
+    return lines
+
+
+def wrap_text(pdf, w, text):
+    """text with kinsoku line breaks made explicit, for pdf.multi_cell(w, ...).
+
+    Falls back to the text unchanged where fpdf would measure differently
+    (text shaping, character spacing or stretching).
+    """
+    if (not text or pdf.text_shaping or pdf.char_spacing
+            or pdf.font_stretching != 100 or not pdf.current_font):
+        return text
+    return "\n".join(wrap_lines(pdf, w, pdf.normalize_text(text)))
+
+
+class KinsokuMixin:
+    """FPDF mixin: multi_cell() breaks lines by the kinsoku rules."""
+
+    def multi_cell(self, w, h=None, text="", *args, markdown=False, padding=0, **kwargs):
+        if not markdown and not padding:
+            text = wrap_text(self, w, text)
+        return super().multi_cell(w, h, text, *args, markdown=markdown,
+                                  padding=padding, **kwargs)
@@ -0,0 +1,89 @@
+"""Linearized ("fast web view") PDF output.
+
+A linearized PDF puts the first page's objects, and hint tables locating
+the rest, at the front of the file, so a viewer fetching the issue over
+HTTP can show the cover before the whole download has finished.
+
+The rewrite is done by qpdf: through pikepdf when it is installed, else
+the qpdf command-line tool.  Object IDs are derived from the content
+(--deterministic-id), so linearizing the same input twice gives the same
+bytes.
+
+Check a published file:
+  python3 -m tokilib.linearize newsletter/2026-02.pdf [...]
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+
+try:
+    import pikepdf
+except ImportError:  # optional: fall back to the qpdf binary
+    pikepdf = None
+
+
+def available():
+    """Whether a linearization backend (pikepdf or qpdf) is installed."""
+    return pikepdf is not None or shutil.which("qpdf") is not None
+
+
+def linearize(path):
+    """Rewrite the PDF at path in place as a linearized file."""
+    tmp = f"{path}.{os.getpid()}.lin"
+    try:
+        if pikepdf is not None:
+            with pikepdf.open(path) as pdf:
+                pdf.save(tmp, linearize=True, deterministic_id=True)
+        elif shutil.which("qpdf"):
+            # exit status 3: succeeded with warnings
+            result = subprocess.run(["qpdf", "--linearize", "--deterministic-id", path, tmp],
+                                    capture_output=True, text=True)
+            if result.returncode not in (0, 3):
+                raise RuntimeError(f"qpdf --linearize failed: {result.stderr.strip()}")
+        else:
+            raise RuntimeError("linearized output needs pikepdf (pip install pikepdf) "
+                               "or the qpdf command")
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def check(path):
+    """Problems with path's linearization and hint tables ([] if it is valid)."""
+    if pikepdf is not None:
+        with pikepdf.open(path) as pdf:
+            if not pdf.is_linearized:
+                return ["not linearized"]
+            report = io.StringIO()
+            ok = pdf.check_linearization(report)
+        problems = [line for line in report.getvalue().splitlines() if line.strip()]
+        return [] if ok and not problems else problems or ["linearization check failed"]
+    if shutil.which("qpdf"):
+        result = subprocess.run(["qpdf", "--check-linearization", path],
+                                capture_output=True, text=True)
+        output = (result.stdout + result.stderr).strip()
+        if result.returncode == 0 and "no linearization errors" in output:
+            return []
+        return output.splitlines() or [f"qpdf exited with status {result.returncode}"]
+    raise RuntimeError("checking linearization needs pikepdf or the qpdf command")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 -m tokilib.linearize <pdf> [...]")
+        sys.exit(1)
+    failed = 0
+    for pdf_path in sys.argv[1:]:
+        problems = check(pdf_path)
+        if problems:
+            failed += 1
+            print(f"  FAIL {pdf_path}")
+            for problem in problems:
+                print(f"       {problem}")
+        else:
+            print(f"  OK   {pdf_path}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,64 @@
+"""Measured text layout for fpdf multi_cell boxes.
+
+Box heights used to be guessed from character counts (len(text) / 55, or
+~3mm per character), which is wrong for mixed Japanese/Latin text.
+split_lines() asks fpdf itself how a multi_cell would wrap — a dry run with
+output="LINES", nothing is drawn — and caches the result per
+(text, font, size, width), so boxes and page breaks can be sized exactly
+before anything is placed on the page.  On a KinsokuMixin document the dry
+run goes through the same kinsoku line breaker as the real draw.
+"""
+
+_LINES_CACHE = {}
+
+
+def split_lines(pdf, w, text):
+    """Lines multi_cell(w, ..., text) would produce with the current font."""
+    if w == 0:
+        w = pdf.w - pdf.r_margin - pdf.x
+    font = pdf.current_font
+    key = (text, str(getattr(font, "ttffile", pdf.font_family)), pdf.font_style,
+           pdf.font_size_pt, round(w, 3), pdf.c_margin)
+    lines = _LINES_CACHE.get(key)
+    if lines is None:
+        lines = _LINES_CACHE[key] = tuple(
+            pdf.multi_cell(w, 1, text, dry_run=True, output="LINES"))
+    return lines
+
+
+def text_height(pdf, w, line_h, text):
+    """Height of multi_cell(w, line_h, text) with the current font."""
+    return len(split_lines(pdf, w, text)) * line_h
+
+
+def string_widths(pdf, texts):
+    """get_string_width() of each of texts with the current font, batched.
+
+    Fonts added through tokilib.fonts carry a WidthTable, whose
+    batch_units() sums every string in one pass; plain fpdf fonts, text
+    shaping, stretching and character spacing fall back to one call each.
+    """
+    texts = list(texts)
+    table = getattr(pdf.current_font, "widths", None)
+    if table is None or pdf.text_shaping or pdf.font_stretching != 100 or pdf.char_spacing:
+        return [pdf.get_string_width(text) for text in texts]
+    scale = pdf.font_size_pt * 0.001 / pdf.k
+    return [units * scale for units in table.batch_units(texts)]
+
+
+def clip_to_width(pdf, text, w, ellipsis="…"):
+    """text, or its longest prefix + ellipsis fitting in w (current font).
+
+    The prefix length is bisected, so a long name costs a handful of
+    measurements instead of one per character dropped.
+    """
+    if pdf.get_string_width(text) <= w:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if pdf.get_string_width(text[:mid] + ellipsis) <= w:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + ellipsis
@@ -0,0 +1,353 @@
+"""Streaming PDF merge (pypdf objects in, PDF bytes out as we go).
+
+pypdf's PdfWriter keeps every merged page and its resources in memory until
+write().  StreamingPdfWriter instead copies each source page's object graph
+straight to the output file, renumbering references on the way, so only the
+source document currently being copied is held in memory.  The page tree,
+catalog, xref table and trailer are written at close().
+
+Identical objects are written once: every copied object (other than
+pages, annotations and tree nodes) is keyed by a SHA-256 of its serialized
+form after its own references were resolved, so fonts, images and form
+XObjects repeated across the merged documents — and everything they
+reference — collapse into one shared object.  bytes_saved and
+objects_deduped report the effect.
+
+Outline items and page labels are kept as small (title, page index) records
+until close(), so they can be added for pages of readers already released.
+
+Usage:
+  with open(out_path, "wb") as f:
+      writer = StreamingPdfWriter(f)
+      writer.add_pages(PdfReader(io.BytesIO(buf)))
+      writer.close()
+"""
+
+import hashlib
+import io
+
+from pypdf.generic import (
+    ArrayObject,
+    ByteStringObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NullObject,
+    NumberObject,
+    StreamObject,
+    TextStringObject,
+)
+
+PDF_HEADER = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
+
+# Objects that belong to one place in the document and must not be shared
+_UNSHARED_TYPES = frozenset({"/Annot", "/Page", "/Pages", "/Outlines", "/StructElem", "/Sig"})
+_MAX_SHARE_DEPTH = 200  # deeper reference chains are copied without dedupe
+
+
+def _shareable(obj):
+    if not isinstance(obj, DictionaryObject):
+        return True
+    return (obj.get("/Type") not in _UNSHARED_TYPES
+            and "/Parent" not in obj and "/Rect" not in obj)
+
+
+class _HashingFile:
+    """File wrapper that tracks the write offset and an MD5 of the output."""
+
+    def __init__(self, f):
+        self.f = f
+        self.offset = 0
+        self.md5 = hashlib.md5()
+
+    def write(self, data):
+        self.f.write(data)
+        self.md5.update(data)
+        self.offset += len(data)
+
+
+class StreamingPdfWriter:
+    """Write pages from one or more PdfReaders into a single PDF file."""
+
+    def __init__(self, fileobj):
+        self._out = _HashingFile(fileobj)
+        self._offsets = {}
+        self._next_num = 1
+        self._pages_num = self._alloc()
+        self._page_nums = []
+        self._info = None
+        self._mappings = {}
+        self._shared = {}    # content digest -> object number
+        self._visiting = {}  # source key -> number, for reference cycles
+        self.bytes_saved = 0
+        self.objects_deduped = 0
+        self._outline = []  # [title, page index, children]
+        self._labels = {}   # first page index -> label dict
+        self._out.write(PDF_HEADER)
+
+    @property
+    def page_count(self):
+        return len(self._page_nums)
+
+    def _alloc(self):
+        num = self._next_num
+        self._next_num += 1
+        return num
+
+    def _ref(self, num):
+        return IndirectObject(num, 0, self)
+
+    # ── Copying ──────────────────────────────────────────────────────
+
+    def add_pages(self, reader, indices=None):
+        """Copy pages (all, or the given indices) of reader to the output.
+
+        Objects shared between pages of the same reader are written once,
+        also across several add_pages() calls until release(reader).
+        Returns the (start, stop) range of the new pages in the output.
+        """
+        start = self.page_count
+        pages = reader.pages
+        if indices is None:
+            indices = range(len(pages))
+        indices = list(indices)
+        mapping = self._mappings.setdefault(id(reader), (reader, {}))[1]
+
+        # Pre-assign page numbers so annotation /P and link targets that
+        # point at a copied page resolve to its new object.
+        copied = []
+        for i in indices:
+            page = pages[i]
+            ref = page.indirect_reference
+            num = self._alloc()
+            if ref is not None:
+                mapping[(ref.idnum, ref.generation)] = num
+            copied.append((num, page))
+
+        pending = []
+        for num, page in copied:
+            self._write_object(num, self._copy_page(page, mapping, pending))
+            self._page_nums.append(num)
+            self._drain(mapping, pending)
+        return start, self.page_count
+
+    def release(self, reader):
+        """Forget reader's object mapping so it can be garbage-collected."""
+        self._mappings.pop(id(reader), None)
+
+    def _copy_page(self, page, mapping, pending):
+        new_page = DictionaryObject()
+        for key, value in page.items():
+            if key == "/Parent":
+                continue
+            new_page[NameObject(key)] = self._copy(value, mapping, pending)
+        # pypdf has already flattened inherited /Resources, /MediaBox etc.
+        # into the page, so dropping the old /Parent loses nothing.
+        new_page[NameObject("/Parent")] = self._ref(self._pages_num)
+        return new_page
+
+    def _copy(self, obj, mapping, pending, depth=0):
+        if isinstance(obj, IndirectObject):
+            key = (obj.idnum, obj.generation)
+            num = mapping.get(key)
+            if num is None:
+                target = obj.get_object()
+                if isinstance(target, DictionaryObject) and target.get("/Type") == "/Page":
+                    # Reference to a page that isn't being copied
+                    return NullObject()
+                if depth < _MAX_SHARE_DEPTH and _shareable(target):
+                    return self._ref(self._copy_shared(key, target, mapping, pending, depth))
+                num = self._alloc()
+                mapping[key] = num
+                pending.append((num, target))
+            return self._ref(num)
+        # Keys are written sorted, so the same object from differently
+        # serialized files (e.g. rewritten by qpdf) hashes the same.
+        if isinstance(obj, StreamObject):
+            new = StreamObject()
+            for key, value in sorted(obj.items()):
+                new[NameObject(key)] = self._copy(value, mapping, pending, depth + 1)
+            new._data = obj._data
+            return new
+        if isinstance(obj, DictionaryObject):
+            new = DictionaryObject()
+            for key, value in sorted(obj.items()):
+                new[NameObject(key)] = self._copy(value, mapping, pending, depth + 1)
+            return new
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self._copy(v, mapping, pending, depth + 1) for v in obj)
+        return obj
+
+    def _copy_shared(self, key, target, mapping, pending, depth):
+        """Copy target (references first) and write it, or reuse an identical object."""
+        visiting = self._visiting
+        if key in visiting:
+            # Reference cycle: give the object its own number; it won't be shared
+            if visiting[key] is None:
+                visiting[key] = self._alloc()
+            return visiting[key]
+        visiting[key] = None
+        try:
+            copied = self._copy(target, mapping, pending, depth + 1)
+        finally:
+            num = visiting.pop(key)
+        buf = io.BytesIO()
+        copied.write_to_stream(buf)
+        data = buf.getvalue()
+        if num is None:
+            digest = hashlib.sha256(data).digest()
+            num = self._shared.get(digest)
+            if num is not None:
+                mapping[key] = num
+                self.bytes_saved += len(data)
+                self.objects_deduped += 1
+                return num
+            num = self._shared[digest] = self._alloc()
+        mapping[key] = num
+        self._write_raw(num, data)
+        return num
+
+    def _drain(self, mapping, pending):
+        while pending:
+            num, target = pending.pop()
+            self._write_object(num, self._copy(target, mapping, pending))
+
+    def _write_object(self, num, obj):
+        self._offsets[num] = self._out.offset
+        self._out.write(f"{num} 0 obj\n".encode())
+        obj.write_to_stream(self._out)
+        self._out.write(b"\nendobj\n")
+
+    def _write_raw(self, num, data):
+        self._offsets[num] = self._out.offset
+        self._out.write(f"{num} 0 obj\n".encode() + data + b"\nendobj\n")
+
+    # ── Navigation ───────────────────────────────────────────────────
+
+    def add_outline_item(self, title, page, parent=None):
+        """Add a bookmark to output page index page; returns it for nesting."""
+        item = [title, page, []]
+        (self._outline if parent is None else parent[2]).append(item)
+        return item
+
+    def copy_outline(self, reader, page_map, parent=None):
+        """Copy reader's bookmarks under parent.
+
+        page_map(source page index) gives the output page index, or None for
+        pages that weren't copied (their bookmarks are dropped, children kept).
+        """
+        def walk(entries, into):
+            last = None
+            for entry in entries:
+                if isinstance(entry, list):
+                    walk(entry, last if last is not None else into)
+                    continue
+                try:
+                    page = page_map(reader.get_destination_page_number(entry))
+                except (KeyError, ValueError, TypeError):
+                    page = None
+                last = into if page is None else self.add_outline_item(entry.title, page, into)
+        try:
+            outline = reader.outline
+        except Exception:  # malformed /Outlines: the pages still merge
+            return
+        walk(outline, parent)
+
+    def add_page_label(self, page, prefix="", style="/D", first=1):
+        """Label output pages from index page on as prefix + number (style /D, /r...)."""
+        label = DictionaryObject({NameObject("/St"): NumberObject(first)})
+        if style:
+            label[NameObject("/S")] = NameObject(style)
+        if prefix:
+            label[NameObject("/P")] = TextStringObject(prefix)
+        self._labels[page] = label
+
+    def _write_outline(self, items, parent_num):
+        """Write sibling items (sorted by page); returns (first, last, count)."""
+        items = sorted(items, key=lambda item: item[1])
+        nums = [self._alloc() for _ in items]
+        count = 0
+        for i, ((title, page, children), num) in enumerate(zip(items, nums)):
+            node = DictionaryObject({
+                NameObject("/Title"): TextStringObject(title),
+                NameObject("/Parent"): self._ref(parent_num),
+                NameObject("/Dest"): ArrayObject([
+                    self._ref(self._page_nums[page]), NameObject("/Fit")]),
+            })
+            if i:
+                node[NameObject("/Prev")] = self._ref(nums[i - 1])
+            if i + 1 < len(nums):
+                node[NameObject("/Next")] = self._ref(nums[i + 1])
+            if children:
+                first, last, n = self._write_outline(children, num)
+                node[NameObject("/First")] = self._ref(first)
+                node[NameObject("/Last")] = self._ref(last)
+                node[NameObject("/Count")] = NumberObject(-n)  # closed
+            self._write_object(num, node)
+            count += 1
+        return nums[0], nums[-1], count
+
+    # ── Finishing ────────────────────────────────────────────────────
+
+    def set_info(self, info):
+        """Carry a document-info dict (e.g. the fpdf base's /Info) over."""
+        self._info = info
+
+    def close(self):
+        """Write the page tree, catalog, info, xref and trailer."""
+        kids = ArrayObject(self._ref(n) for n in self._page_nums)
+        pages = DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): kids,
+            NameObject("/Count"): NumberObject(len(kids)),
+        })
+        self._write_object(self._pages_num, pages)
+
+        catalog = DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): self._ref(self._pages_num),
+        })
+        if self._outline:
+            outlines_num = self._alloc()
+            first, last, count = self._write_outline(self._outline, outlines_num)
+            self._write_object(outlines_num, DictionaryObject({
+                NameObject("/Type"): NameObject("/Outlines"),
+                NameObject("/First"): self._ref(first),
+                NameObject("/Last"): self._ref(last),
+                NameObject("/Count"): NumberObject(count),
+            }))
+            catalog[NameObject("/Outlines")] = self._ref(outlines_num)
+            catalog[NameObject("/PageMode")] = NameObject("/UseOutlines")
+        if self._labels:
+            nums = ArrayObject()
+            for page in sorted(self._labels):
+                nums.extend((NumberObject(page), self._labels[page]))
+            catalog[NameObject("/PageLabels")] = DictionaryObject({NameObject("/Nums"): nums})
+        catalog_num = self._alloc()
+        self._write_object(catalog_num, catalog)
+
+        trailer = DictionaryObject({
+            NameObject("/Root"): self._ref(catalog_num),
+        })
+        if self._info:
+            info_num = self._alloc()
+            mapping, pending = {}, []
+            info = self._info.get_object()
+            self._write_object(info_num, self._copy(info, mapping, pending))
+            self._drain(mapping, pending)
+            trailer[NameObject("/Info")] = self._ref(info_num)
+        trailer[NameObject("/Size")] = NumberObject(self._next_num)
+
+        # /ID derived from the bytes written so far (no random component)
+        digest = self._out.md5.digest()
+        trailer[NameObject("/ID")] = ArrayObject(
+            [ByteStringObject(digest), ByteStringObject(digest)])
+
+        xref_offset = self._out.offset
+        lines = [f"xref\n0 {self._next_num}\n", "0000000000 65535 f \n"]
+        for num in range(1, self._next_num):
+            lines.append(f"{self._offsets[num]:010d} 00000 n \n")
+        self._out.write("".join(lines).encode())
+        self._out.write(b"trailer\n")
+        trailer.write_to_stream(self._out)
+        self._out.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
@@ -0,0 +1,233 @@
+"""Content-addressed cache of encoded QR module matrices.
+
+Encoding a QR (Reed-Solomon error correction, then scoring all eight mask
+patterns) is most of the cost of a TokiQR build, yet an issue's URLs
+rarely change between rebuilds.  matrix() keys each encoding by
+(payload, error-correction level, version, mask) and keeps the result
+under .cache/qr/ as a bit-packed file: one byte of matrix size, then the
+modules row by row, eight to a byte.  Hits refresh the file's mtime, and
+once more than MAX_ENTRIES are stored the least recently used are
+evicted (at exit).  A per-process LRU of the packed entries sits in
+front of the disk.
+matrices() does the same for a stream of payloads, encoding the misses on
+a process pool and yielding the results in order.
+
+Entries are written atomically, so concurrent builds can share the cache;
+it is safe to delete.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+from tokilib.buildcache import CACHE_DIRNAME
+from tokilib.qrdraw import module_rects
+
+MAX_ENTRIES = 20000
+_MEMO_SIZE = 4096
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(_ROOT, CACHE_DIRNAME, "qr")
+
+_memo = OrderedDict()
+stats = {"hits": 0, "misses": 0}
+_evict_registered = False
+
+
+def _key(data, error_correction, version, mask):
+    blob = json.dumps([data, error_correction, version, mask], ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def pack(modules):
+    """Bit-pack a square matrix of bools: size byte, then rows, MSB first."""
+    n = len(modules)
+    bits = "".join("1" if m else "0" for row in modules for m in row)
+    return bytes([n]) + int(bits or "0", 2).to_bytes((n * n + 7) // 8, "big")
+
+
+def unpack(blob):
+    """Inverse of pack(); None if blob is truncated or malformed."""
+    if not blob:
+        return None
+    n = blob[0]
+    if len(blob) != 1 + (n * n + 7) // 8:
+        return None
+    bits = bin(int.from_bytes(blob[1:], "big"))[2:].zfill(n * n)
+    return [[bits[r * n + c] == "1" for c in range(n)] for r in range(n)]
+
+
+def _encode(data, error_correction, version, mask):
+    import qrcode
+
+    level = getattr(qrcode.constants, f"ERROR_CORRECT_{error_correction}")
+    qr = qrcode.QRCode(version=version, error_correction=level, border=0, mask_pattern=mask)
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+
+def _path(key):
+    return os.path.join(CACHE_DIR, key[:2], key + ".bin")
+
+
+def _lookup(key):
+    """Cached modules for key (memo, then disk), or None."""
+    blob = _memo.get(key)
+    if blob is not None:
+        _memo.move_to_end(key)
+        return unpack(blob)
+    path = _path(key)
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        os.utime(path)
+    except OSError:
+        return None
+    modules = unpack(blob)
+    if modules is not None:
+        _remember(key, blob)
+    return modules
+
+
+def _remember(key, blob):
+    _memo[key] = blob
+    if len(_memo) > _MEMO_SIZE:
+        _memo.popitem(last=False)
+
+
+def _store(key, blob):
+    global _evict_registered
+    path = _path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+    if not _evict_registered:
+        atexit.register(evict)
+        _evict_registered = True
+
+
+def _with_border(modules, border):
+    if not border:
+        return modules
+    n = len(modules) + 2 * border
+    blank = [False] * n
+    pad = [False] * border
+    return [blank] * border + [pad + row + pad for row in modules] + [blank] * border
+
+
+def matrix(data, error_correction="M", version=None, mask=None, border=0):
+    """Module matrix (rows of bools) of data as a QR code, quiet zone included.
+
+    error_correction is "L", "M", "Q" or "H"; version is the smallest
+    version to use (grown to fit, like qrcode's make(fit=True)) and mask
+    a fixed mask pattern (None: the best one).
+    """
+    key = _key(data, error_correction, version, mask)
+    modules = _lookup(key)
+    if modules is None:
+        stats["misses"] += 1
+        modules = _encode(data, error_correction, version, mask)
+        blob = pack(modules)
+        _store(key, blob)
+        _remember(key, blob)
+    else:
+        stats["hits"] += 1
+    return _with_border(modules, border)
+
+
+def _encode_packed(data, error_correction, version, mask):
+    return pack(_encode(data, error_correction, version, mask))
+
+
+def matrices(payloads, error_correction="M", version=None, mask=None, border=0, workers=None):
+    """matrix() of each payload, yielded in order; misses encode on a process pool.
+
+    Cache hits are answered in this process.  At most 4 * workers payloads
+    are in flight, so memory stays flat however many there are, and the
+    pool is only started once there is something to encode.  workers
+    defaults to the CPU count; 1 encodes in-process.
+    """
+    from collections import deque
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for data in payloads:
+            yield matrix(data, error_correction, version, mask, border)
+        return
+
+    def resolve(key, item):
+        if not isinstance(item, Future):
+            return item
+        blob = item.result()
+        _store(key, blob)
+        _remember(key, blob)
+        return unpack(blob)
+
+    pool = None
+    window = deque()
+    try:
+        for data in payloads:
+            key = _key(data, error_correction, version, mask)
+            modules = _lookup(key)
+            if modules is None:
+                stats["misses"] += 1
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                window.append((key, pool.submit(_encode_packed, data, error_correction,
+                                                version, mask)))
+            else:
+                stats["hits"] += 1
+                window.append((key, modules))
+            while window and (len(window) >= 4 * workers
+                              or not isinstance(window[0][1], Future) or window[0][1].done()):
+                yield _with_border(resolve(*window.popleft()), border)
+        while window:
+            yield _with_border(resolve(*window.popleft()), border)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def image(modules, box_size, fill_color="black", back_color="white"):
+    """PIL image of a module matrix, box_size pixels per module (like qrcode's)."""
+    from PIL import Image, ImageDraw
+
+    n = len(modules)
+    mono = fill_color == "black" and back_color == "white"
+    img = Image.new("1" if mono else "RGB", (n * box_size, n * box_size),
+                    1 if mono else back_color)
+    draw = ImageDraw.Draw(img)
+    for c, r, w, h in module_rects(modules):
+        draw.rectangle([c * box_size, r * box_size,
+                        (c + w) * box_size - 1, (r + h) * box_size - 1],
+                       fill=0 if mono else fill_color)
+    return img
+
+
+def evict(max_entries=MAX_ENTRIES):
+    """Delete the least recently used entries beyond max_entries."""
+    entries = []
+    try:
+        with os.scandir(CACHE_DIR) as shards:
+            for shard in shards:
+                if shard.is_dir():
+                    with os.scandir(shard.path) as files:
+                        entries.extend((e.stat().st_mtime_ns, e.path) for e in files
+                                       if e.name.endswith(".bin"))
+    except OSError:
+        return 0
+    if len(entries) <= max_entries:
+        return 0
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return len(entries) - max_entries
@@ -0,0 +1,49 @@
+"""QR codes drawn as vector paths instead of embedded PNGs.
+
+Rendering a QR through PIL means an encode, a raster pass, PNG
+compression, a temporary file and a PNG decode in fpdf, for every URL.
+draw_qr() takes the module matrix (qrcode's get_matrix(), quiet zone
+included) and fills the dark modules as rectangles: runs of dark modules
+in a row become one rectangle, and identical runs in consecutive rows are
+merged into taller ones.  All rectangles go out as a single path with one
+fill, in module units, so the QR is resolution-independent and compact.
+"""
+
+
+def module_rects(matrix):
+    """(col, row, width, height) rectangles covering the dark modules."""
+    rects = []
+    open_runs = {}  # (start, stop) -> first row
+    for r, row in enumerate(matrix):
+        runs = set()
+        c, n = 0, len(row)
+        while c < n:
+            if row[c]:
+                start = c
+                while c < n and row[c]:
+                    c += 1
+                runs.add((start, c))
+            else:
+                c += 1
+        for run in [run for run in open_runs if run not in runs]:
+            top = open_runs.pop(run)
+            rects.append((run[0], top, run[1] - run[0], r - top))
+        for run in runs:
+            open_runs.setdefault(run, r)
+    for run, top in open_runs.items():
+        rects.append((run[0], top, run[1] - run[0], len(matrix) - top))
+    return rects
+
+
+def draw_qr(pdf, matrix, x, y, size):
+    """Fill matrix's dark modules in the current fill colour, size x size at (x, y).
+
+    The path is written in module units under a scaling cm, so every
+    rectangle is four small integers and adjacent rectangles share exact
+    edges (no hairline seams).
+    """
+    scale = size / len(matrix) * pdf.k
+    ops = [f"{c} {r} {w} {h} re" for c, r, w, h in module_rects(matrix)]
+    if ops:
+        pdf._out(f"q {scale:.4f} 0 0 {-scale:.4f} {x * pdf.k:.2f} {(pdf.h - y) * pdf.k:.2f} cm\n"
+                 + "\n".join(ops) + "\nf Q")
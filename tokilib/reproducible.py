@@ -0,0 +1,81 @@
+"""Byte-reproducible PDF output.
+
+fpdf stamps /CreationDate with the current time, and its default /ID is an
+MD5 of the document bytes plus that time, so identical inputs produce
+different bytes on every run.  In reproducible mode (--reproducible, or
+SOURCE_DATE_EPOCH set in the environment) the generators pin the creation
+date to a date taken from their inputs, which turns the /ID into a pure
+content hash as well:
+  - newsletter issues: the manifest's lastUpdated, else the issue month,
+  - other documents: SOURCE_DATE_EPOCH, else the last commit touching the
+    generator script (ReproducibleMixin.pin_all).
+Merged issues (tokilib.pdfmerge) and linearized files (tokilib.linearize)
+already derive their /ID from the content.
+"""
+
+import os
+import subprocess
+from datetime import datetime, timedelta, timezone
+
+JST = timezone(timedelta(hours=9))
+
+
+def requested(args):
+    """True if --reproducible is in args (removed) or SOURCE_DATE_EPOCH is set."""
+    flag = "--reproducible" in args
+    if flag:
+        args.remove("--reproducible")
+    return flag or bool(os.environ.get("SOURCE_DATE_EPOCH"))
+
+
+def issue_date(manifest, year, month):
+    """Creation date of an issue: manifest["lastUpdated"] or the 1st of its month (JST)."""
+    stamp = (manifest or {}).get("lastUpdated")
+    if stamp:
+        try:
+            date = datetime.fromisoformat(stamp)
+            return date if date.tzinfo else date.replace(tzinfo=JST)
+        except ValueError:
+            pass
+    return datetime(year, month, 1, tzinfo=JST)
+
+
+def source_date(*paths):
+    """SOURCE_DATE_EPOCH, else the newest commit date of paths (None if unknown)."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc)
+    paths = [os.path.abspath(p) for p in paths]
+    try:
+        result = subprocess.run(["git", "log", "-1", "--format=%cI", "--", *paths],
+                                cwd=os.path.dirname(paths[0]), capture_output=True,
+                                text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    stamp = result.stdout.strip()
+    return datetime.fromisoformat(stamp) if stamp else None
+
+
+def pin(pdf, date):
+    """Give pdf a fixed creation date (and so a content-derived /ID)."""
+    if date is None:
+        print("  WARNING: no source date (not a git checkout?) — output is not reproducible")
+        return
+    pdf.set_creation_date(date)
+
+
+class ReproducibleMixin:
+    """FPDF mixin: documents created after pin_all(cls, date) get that date."""
+
+    pinned_date = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.pinned_date is not None:
+            pin(self, self.pinned_date)
+
+    @classmethod
+    def pin_all(cls, date):
+        if date is None:
+            print("  WARNING: no source date (not a git checkout?) — output is not reproducible")
+        cls.pinned_date = date
@@ -0,0 +1,129 @@
+"""Essay rotation planner for newsletter issues.
+
+newsletter/essays-pool.json assigns every essay a theme and records the
+issues it was featured in.  Each issue features ESSAYS_PER_ISSUE essays of
+different themes; essays never featured come first, and once a theme has
+none left ("runs dry") its least recently featured essays are re-run.
+
+RotationPlanner indexes the pool once -- per theme, a heap of essays keyed
+by (last issue featured, pool order), unfeatured essays having 0 -- so
+projecting a selection costs a few heap operations per issue rather than a
+scan of the pool, and a whole volume is planned in milliseconds.  Themes
+are taken least recently used first, preferring themes with new essays
+and then those whose next essay has waited longest.
+Essays whose theme is not in the pool's "themes" (e.g. "untagged") are not
+selected automatically.
+
+Plan the rest of the current volume (or the next N issues):
+  python3 -m tokilib.rotation [N]
+"""
+
+import heapq
+import json
+import os
+import sys
+
+ESSAYS_PER_ISSUE = 5
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+POOL_PATH = os.path.join(_ROOT, "newsletter", "essays-pool.json")
+SCHEDULE_PATH = os.path.join(_ROOT, "newsletter", "schedule.json")
+
+
+class RotationPlanner:
+    """Projects essay selections for upcoming issues (by serial number)."""
+
+    def __init__(self, pool, per_issue=ESSAYS_PER_ISSUE):
+        self.per_issue = per_issue
+        self.essays = {}
+        self._heaps = {theme: [] for theme in pool.get("themes", {})}
+        self._fresh = dict.fromkeys(self._heaps, 0)
+        self._theme_last = dict.fromkeys(self._heaps, 0)
+        for order, essay in enumerate(pool.get("essays", [])):
+            theme = essay.get("theme")
+            if theme not in self._heaps:
+                continue
+            last = max(essay.get("featured_in") or [0])
+            self.essays[essay["id"]] = essay
+            self._heaps[theme].append((last, order, essay["id"]))
+            self._theme_last[theme] = max(self._theme_last[theme], last)
+            if not last:
+                self._fresh[theme] += 1
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+        self.dry = {theme: None for theme, n in self._fresh.items() if not n and self._heaps[theme]}
+
+    def select(self, serial):
+        """Essay ids for issue serial; the selection is recorded as featured."""
+        themes = sorted((t for t, heap in self._heaps.items() if heap),
+                        key=lambda t: (not self._fresh[t], self._theme_last[t], self._heaps[t][0]))
+        picks = []
+        for theme in themes[:self.per_issue]:
+            last, order, essay_id = heapq.heappop(self._heaps[theme])
+            heapq.heappush(self._heaps[theme], (serial, order, essay_id))
+            self._theme_last[theme] = serial
+            if not last:
+                self._fresh[theme] -= 1
+                if not self._fresh[theme]:
+                    self.dry[theme] = serial
+            picks.append(essay_id)
+        return picks
+
+    def plan(self, first_serial, count):
+        """{serial: [essay ids]} for count issues starting at first_serial."""
+        return {serial: self.select(serial) for serial in range(first_serial, first_serial + count)}
+
+
+def _next_issues(schedule, count=None):
+    """(serial, number, "YYYY-MM") of the issues after schedule's last one.
+
+    count defaults to the rest of the last issue's volume.
+    """
+    last = max(schedule.get("issues", []), key=lambda i: i["serial"])
+    info = schedule.get("volumes", {}).get(str(last["volume"]), {})
+    if count is None:
+        count = info.get("issues_max", last["number"]) - last["number"]
+    year, month = map(int, last["date"].split("-"))
+    cadence = schedule.get("cadence_months", 6)
+    issues = []
+    for k in range(1, count + 1):
+        index = year * 12 + month - 1 + k * cadence
+        issues.append((last["serial"] + k, last["number"] + k,
+                       f"{index // 12}-{index % 12 + 1:02d}"))
+    return issues
+
+
+if __name__ == "__main__":
+    import time
+
+    with open(POOL_PATH, encoding="utf-8") as f:
+        pool = json.load(f)
+    with open(SCHEDULE_PATH, encoding="utf-8") as f:
+        schedule = json.load(f)
+    issues = _next_issues(schedule, int(sys.argv[1]) if len(sys.argv) > 1 else None)
+    if not issues:
+        print("  No issues left to plan in this volume")
+        sys.exit(0)
+
+    t0 = time.perf_counter()
+    planner = RotationPlanner(pool)
+    plan = planner.plan(issues[0][0], len(issues))
+    elapsed = (time.perf_counter() - t0) * 1000
+
+    for serial, number, date in issues:
+        picks = plan[serial]
+        print(f"  No.{number:<3} {date}  " + ", ".join(
+            f"{planner.essays[i]['title_ja']}({planner.essays[i]['theme']})" for i in picks))
+        if len(picks) < planner.per_issue:
+            print(f"           WARNING: only {len(picks)} themes have essays")
+    numbers = {serial: (number, date) for serial, number, date in issues}
+    print(f"\n  Planned {len(issues)} issues from {len(planner.essays)} essays in {elapsed:.1f} ms")
+    for theme, serial in sorted(planner.dry.items(), key=lambda kv: kv[1] or 0):
+        if serial is None:
+            print(f"  {theme}: already dry — only re-runs")
+        elif serial in numbers:
+            number, date = numbers[serial]
+            print(f"  {theme}: runs dry after No.{number} ({date}), re-runs from then on")
+    fresh = [t for t in pool.get("themes", {}) if t not in planner.dry]
+    if fresh:
+        print(f"  Still new essays after the plan: {', '.join(fresh)}")
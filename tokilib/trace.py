@@ -0,0 +1,188 @@
+"""Build tracing for the PDF generators (--trace).
+
+Records where a build spends its time as Chrome trace JSON (open it in
+chrome://tracing or https://ui.perfetto.dev) and prints a summary table:
+  - sections: layout (TraceMixin, from creating the FPDF to output()),
+    fpdf output (font subsetting and embedding), and span()s for each
+    newsletter section (cover, essays, materials index...), QR rendering,
+    image embedding, the pypdf merge and linearization,
+  - pages (TraceMixin): wall time from one add_page() to the next, with
+    the page's content-stream bytes and the fonts and images it uses
+    (and how many of them it is the first to use, i.e. embeds).
+Pages are on their own track, so they may overlap the sections that run
+while they are open.  Process-pool workers (--rebuild-all, --fleet) trace
+into their own event list: a task returns take() and the parent merge()s
+it, so each worker shows up as its own process in the trace (timestamps
+come from the system-wide monotonic clock).  Traces are written under
+.cache/trace/.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from fpdf.enums import PDFResourceType
+
+from tokilib.buildcache import CACHE_DIRNAME
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SECTIONS, _PAGES = 0, 1
+
+_events = []
+_enabled = False
+
+
+def requested(args):
+    """Enable tracing if --trace is in args (removed); returns whether it was."""
+    if "--trace" in args:
+        args.remove("--trace")
+        enable()
+    return _enabled
+
+
+def enable():
+    """Turn tracing on (a pool worker of a traced build)."""
+    global _enabled
+    _enabled = True
+
+
+def enabled():
+    """Whether this build is traced (to pass on to pool workers)."""
+    return _enabled
+
+
+def take():
+    """Remove and return the events recorded so far, for merge() in another process."""
+    global _events
+    events, _events = _events, []
+    return events
+
+
+def merge(events):
+    """Add events take()n in a worker process to this trace."""
+    _events.extend(events)
+
+
+def _now():
+    return time.perf_counter_ns() // 1000
+
+
+def _record(name, cat, start, tid, args):
+    _events.append({"name": name, "cat": cat, "ph": "X", "ts": start, "dur": _now() - start,
+                    "pid": os.getpid(), "tid": tid, "args": args})
+
+
+@contextmanager
+def span(name, cat, **args):
+    """Time the with-block as one trace event; the yielded dict adds args."""
+    if not _enabled:
+        yield args
+        return
+    start = _now()
+    try:
+        yield args
+    finally:
+        _record(name, cat, start, _SECTIONS, args)
+
+
+class TraceMixin:
+    """FPDF mixin: layout (construction to output()), each page, and output()."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if _enabled:
+            self.__dict__["_layout_trace_start"] = _now()
+
+    def add_page(self, *args, **kwargs):
+        if _enabled:
+            self._close_page_trace()
+        super().add_page(*args, **kwargs)
+        if _enabled:
+            self.__dict__["_page_trace_start"] = _now()
+
+    def output(self, *args, **kwargs):
+        if not _enabled:
+            return super().output(*args, **kwargs)
+        self._close_page_trace()
+        start = self.__dict__.pop("_layout_trace_start", None)
+        if start is not None:
+            _record(self.title or type(self).__name__, "layout", start, _SECTIONS,
+                    {"pages": self.pages_count})
+        with span("output", "output", pages=self.pages_count) as info:
+            result = super().output(*args, **kwargs)
+            info.update(fonts=len(self.fonts), images=len(self.image_cache.images))
+        return result
+
+    def _close_page_trace(self):
+        start = self.__dict__.pop("_page_trace_start", None)
+        if start is None:
+            return
+        seen = self.__dict__.setdefault("_trace_seen", set())
+        per_page = self._resource_catalog.resources_per_page
+        fonts = {("F", str(i)) for i in per_page.get((self.page, PDFResourceType.FONT), ())}
+        image_ids = {info["i"] for info in self.image_cache.images.values()}
+        images = {("I", str(i)) for i in per_page.get((self.page, PDFResourceType.X_OBJECT), ())
+                  if i in image_ids}  # not chrome forms
+        used = fonts | images
+        new = used - seen
+        seen |= used
+        _record(f"page {self.page}", "page", start, _PAGES, {
+            "content_bytes": len(self.pages[self.page].contents),
+            "fonts": len(fonts), "images": len(images),
+            "new_fonts": sum(1 for kind, _ in new if kind == "F"),
+            "new_images": sum(1 for kind, _ in new if kind == "I"),
+        })
+
+
+def summary():
+    """Summary table lines: time per category and per section, then the slowest pages."""
+    if not _events:
+        return ["  (nothing traced)"]
+    wall = max(e["ts"] + e["dur"] for e in _events) - min(e["ts"] for e in _events)
+    totals = {}
+    for e in _events:
+        count, dur = totals.get(e["cat"], (0, 0))
+        totals[e["cat"]] = (count + 1, dur + e["dur"])
+    lines = [f"  {'category':<12}{'count':>7}{'total ms':>11}{'share':>8}"]
+    for cat, (count, dur) in sorted(totals.items(), key=lambda kv: -kv[1][1]):
+        lines.append(f"  {cat:<12}{count:>7}{dur / 1000:>11.1f}{dur / max(wall, 1):>8.0%}")
+    sections = {}
+    for e in _events:
+        if e["cat"] == "section":
+            count, dur = sections.get(e["name"], (0, 0))
+            sections[e["name"]] = (count + 1, dur + e["dur"])
+    if sections:
+        lines.append(f"  {'sections':<16}{'count':>7}{'total ms':>11}")
+        for name, (count, dur) in sorted(sections.items(), key=lambda kv: -kv[1][1]):
+            lines.append(f"  {name:<16}{count:>7}{dur / 1000:>11.1f}")
+    pages = sorted((e for e in _events if e["cat"] == "page"), key=lambda e: -e["dur"])[:5]
+    if pages:
+        lines.append(f"  {'slowest pages':<16}{'ms':>7}{'bytes':>10}{'fonts':>7}{'images':>8}")
+        for e in pages:
+            a = e["args"]
+            lines.append(f"  {e['name']:<16}{e['dur'] / 1000:>7.1f}{a['content_bytes']:>10}"
+                         f"{a['fonts']:>7}{a['images']:>8}")
+    lines.append(f"  wall time {wall / 1000:.1f} ms")
+    return lines
+
+
+def finish(name):
+    """Write the trace as .cache/trace/{name}-{timestamp}.json and print the summary."""
+    if not _enabled:
+        return None
+    trace_dir = os.path.join(_ROOT, CACHE_DIRNAME, "trace")
+    os.makedirs(trace_dir, exist_ok=True)
+    path = os.path.join(trace_dir, f"{name}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    main = os.getpid()
+    pids = [main] + sorted({e["pid"] for e in _events} - {main})
+    meta = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+             "args": {"name": name if pid == main else f"worker {pid}"}} for pid in pids]
+    meta += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": label}}
+             for pid in pids for tid, label in ((_SECTIONS, "sections"), (_PAGES, "pages"))]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": meta + _events, "displayTimeUnit": "ms"}, f)
+    print("\n".join(summary()))
+    print(f"  Trace: {path}")
+    return path